@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from war_hunger_aging.config import CaseGroup, load_config
+from war_hunger_aging.pipeline.build_panel import build_panels
+
+
+def _synthetic_inputs(
+    countries: list[str], *, start_year: int, end_year: int, seed: int = 0
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    years = np.arange(start_year, end_year + 1)
+    sexes = np.array(["Female", "Male"])
+    ages = np.arange(15, 90, dtype=float)
+
+    grid = pd.MultiIndex.from_product([countries, years, sexes, ages], names=["iso3", "year", "sex", "age"])
+    mortality = grid.to_frame(index=False)
+    mortality["mx"] = 1e-4 * np.exp(0.085 * (mortality["age"] - 15)) * rng.lognormal(0, 0.05, len(mortality))
+
+    wgrid = pd.MultiIndex.from_product(
+        [countries, years, ["SP.POP.TOTL", "SN.ITK.DEFC.ZS", "SN.ITK.MSFI.ZS"]], names=["iso3", "year", "indicator"]
+    )
+    wdi = wgrid.to_frame(index=False)
+    wdi["value"] = rng.uniform(1.0, 1e7, len(wdi))
+    wdi.loc[rng.uniform(size=len(wdi)) < 0.3, "value"] = np.nan
+
+    conflict = rng.choice(countries, size=max(1, len(countries) // 10), replace=False)
+    ucdp = pd.MultiIndex.from_product([sorted(conflict), years], names=["iso3", "year"]).to_frame(index=False)
+    ucdp["battle_deaths"] = rng.integers(0, 5000, len(ucdp)).astype(float)
+    return mortality, wdi, ucdp
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Compare pandas vs polars engines for build_panels on a synthetic global panel.")
+    ap.add_argument("--countries", type=int, default=230, help="Number of synthetic countries (default: 230).")
+    ap.add_argument("--repeat", type=int, default=3, help="Timed runs per engine; the best is reported.")
+    ap.add_argument("--config", type=Path, default=Path("config/project.yml"))
+    args = ap.parse_args()
+
+    cfg = load_config(args.config)
+    countries = [f"{chr(65 + i // 676)}{chr(65 + (i // 26) % 26)}{chr(65 + i % 26)}" for i in range(args.countries)]
+    # One case group per 8 countries, each with 7 controls, to exercise the event expansion at scale.
+    cases = tuple(
+        CaseGroup(id=f"G{k:03d}", iso3=countries[k], t0=2011, t1=2018, controls=tuple(countries[k + 1 : k + 8]))
+        for k in range(0, len(countries), 8)
+    )
+    cfg = replace(cfg, cases=cases)
+    mortality, wdi, ucdp = _synthetic_inputs(countries, start_year=cfg.start_year, end_year=cfg.end_year)
+    print(f"mortality rows: {len(mortality):,}; countries: {len(countries)}; case groups: {len(cases)}")
+
+    outputs: dict[str, Path] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for engine in ["pandas", "polars"]:
+            best = float("inf")
+            for run in range(args.repeat):
+                out_dir = Path(tmp) / f"{engine}_{run}"
+                t = time.perf_counter()
+                build_panels(
+                    cfg=cfg,
+                    mortality=mortality,
+                    wdi_long=wdi,
+                    ucdp=ucdp,
+                    out_dir=out_dir,
+                    incremental=False,
+                    engine=engine,
+                )
+                best = min(best, time.perf_counter() - t)
+                outputs[engine] = out_dir
+            print(f"{engine:>7}: {best:.2f}s (best of {args.repeat})")
+
+        for name in ["panel_base.parquet", "panel.parquet", "groups.parquet"]:
+            same = (outputs["pandas"] / name).read_bytes() == (outputs["polars"] / name).read_bytes()
+            print(f"{name}: {'identical' if same else 'DIFFERENT'}")
+
+
+if __name__ == "__main__":
+    main()
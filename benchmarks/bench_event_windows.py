@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from war_hunger_aging.analysis.event_study import EventSummary, summarize_event_windows
+
+
+def _summarize_event_windows_loop(
+    *, params: pd.DataFrame, groups: pd.DataFrame, param_cols: list[str], pre_years: int = 5
+) -> pd.DataFrame:
+    """The previous iterrows / per-(group, param) implementation, kept as the baseline."""
+    expanded: list[dict[str, object]] = []
+    for _, g in groups.iterrows():
+        t0, t1 = int(g["t0"]), int(g["t1"])
+        for year in params["year"].unique():
+            year_i = int(year)
+            if t0 - pre_years <= year_i <= t0 - 1:
+                period = "pre"
+            elif t0 <= year_i <= t1:
+                period = "crisis"
+            elif year_i >= t1 + 1:
+                period = "post"
+            else:
+                period = "other"
+            expanded.append({"case_group": str(g["case_group"]), "iso3": str(g["iso3"]), "year": year_i, "period": period})
+    merged = pd.DataFrame(expanded).merge(params, on=["iso3", "year"], how="left").dropna(subset=["sex"])
+
+    rows: list[EventSummary] = []
+    for (case_group, iso3, sex), sdf in merged.groupby(["case_group", "iso3", "sex"]):
+        for param in param_cols:
+            v = sdf[["period", param]].dropna()
+            if v.empty:
+                continue
+            means = v.groupby("period")[param].mean()
+            pre, crisis, post = (float(means.get(p, np.nan)) for p in ("pre", "crisis", "post"))
+            diff = float(crisis - pre) if np.isfinite(crisis) and np.isfinite(pre) else np.nan
+            rows.append(EventSummary(str(case_group), str(iso3), str(sex), str(param), pre, crisis, post, diff))
+    return pd.DataFrame([r.__dict__ for r in rows])
+
+
+def _synthetic(countries: int, params: int, *, seed: int = 0) -> tuple[pd.DataFrame, pd.DataFrame, list[str]]:
+    rng = np.random.default_rng(seed)
+    isos = [f"C{i:03d}" for i in range(countries)]
+    panel = pd.MultiIndex.from_product([isos, range(1990, 2024), ["Female", "Male"]], names=["iso3", "year", "sex"])
+    panel = panel.to_frame(index=False)
+    cols = [f"p{k}" for k in range(params)]
+    values = rng.normal(size=(len(panel), params))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    panel[cols] = values
+
+    # Each case group: one case country + three controls sharing its crisis window.
+    n_groups = max(1, countries // 4)
+    t0 = rng.integers(1995, 2020, n_groups)
+    groups = pd.DataFrame(
+        {
+            "case_group": np.repeat([f"G{k:03d}" for k in range(n_groups)], 4),
+            "iso3": rng.choice(isos, 4 * n_groups),
+            "t0": np.repeat(t0, 4),
+            "t1": np.repeat(t0 + rng.integers(0, 4, n_groups), 4),
+        }
+    )
+    return panel, groups, cols
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Loop vs vectorized summarize_event_windows on a synthetic panel.")
+    ap.add_argument("--countries", type=int, default=400)
+    ap.add_argument("--params", type=int, default=8, help="Parameter columns to summarize (default: 8).")
+    ap.add_argument("--repeat", type=int, default=3, help="Timed runs per implementation; the best is reported.")
+    args = ap.parse_args()
+
+    params, groups, cols = _synthetic(args.countries, args.params)
+    print(f"synthetic: {args.countries} countries, {len(groups)} group rows, {len(cols)} params, {len(params):,} panel rows")
+
+    loop = lambda: _summarize_event_windows_loop(params=params, groups=groups, param_cols=cols)  # noqa: E731
+    fast = lambda: summarize_event_windows(params=params, groups=groups, param_cols=cols)  # noqa: E731
+    pd.testing.assert_frame_equal(loop(), fast())
+
+    t_loop = _best(loop, args.repeat)
+    t_fast = _best(fast, args.repeat)
+    print(f"      loop: {t_loop:.3f}s (best of {args.repeat})")
+    print(f"vectorized: {t_fast:.3f}s (best of {args.repeat})")
+    print(f"   speedup: {t_loop / t_fast:.1f}x; summaries identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import argparse
+import mmap
+import random
+import time
+from pathlib import Path
+
+from war_hunger_aging.io import srs_life_tables as srs
+
+
+def _synthetic_streams(pages: int, *, seed: int = 0) -> tuple[list[bytes], srs.CMap]:
+    """Content streams shaped like the SRS tables: one hex Tj / kerned TJ per cell, plus rules."""
+    rng = random.Random(seed)
+    chars = "0123456789.-+ ,()ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+    cmap = srs.CMap(key_len=2, mapping={(3 + k).to_bytes(2, "big"): ch for k, ch in enumerate(chars)})
+
+    def enc(text: str) -> str:
+        return "<" + "".join(f"{3 + chars.index(ch):04X}" for ch in text) + ">"
+
+    streams = []
+    for _ in range(pages):
+        ops = ["q 0.5 w 0 0 0 RG"]
+        for row in range(40):
+            ops.append(f"36 {760 - 18 * row} m 576 {760 - 18 * row} l S")
+            for col in range(10):
+                cell = f"{rng.uniform(0, 1):.5f}" if col % 2 else str(rng.randint(1000, 100000))
+                if col % 4 == 3:
+                    ops.append(f"BT /F1 7.5 Tf 1 0 0 1 {40 + 54 * col} {748 - 18 * row} Tm [{enc(cell[:2])} -8 {enc(cell[2:])}] TJ ET")
+                else:
+                    ops.append(f"BT /F1 7.5 Tf 1 0 0 1 {40 + 54 * col} {748 - 18 * row} Tm {enc(cell)} Tj ET")
+        ops.append("Q")
+        streams.append("\n".join(ops).encode("ascii"))
+    return streams, cmap
+
+
+def _pdf_streams(path: Path) -> tuple[list[bytes], srs.CMap | None]:
+    """Decoded text streams of a real SRS PDF and the CMap the extractor's fallback would pick."""
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as pdf:
+        blobs = list(srs._cmap_blobs(pdf))
+        streams = []
+        for _, header, start, end in srs._iter_flate_streams(pdf):
+            if srs._NON_TEXT_STREAM.search(header):
+                continue
+            dec = srs._inflate(pdf[start:end]) or b""
+            blob = srs._first_cmap_blob(dec)
+            if blob is not None:
+                blobs.append(blob)
+            elif b"Tj" in dec or b"TJ" in dec:
+                streams.append(dec)
+    cmaps = [c for c in (srs._parse_cmap_blob(b) for b in dict.fromkeys(blobs)) if c is not None]
+    sample = [srs._hex_to_bytes(h) for s in streams[:5] for h in srs._HEX_TOKEN.findall(s)[:40]]
+    return streams, srs._best_cmap_for_stream(cmaps=cmaps, sample_hex=sample)
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Byte scanner vs regex tokenizer for SRS PDF content streams.")
+    ap.add_argument("--pdf", type=Path, default=Path("SRS-Abridged_Life_Tables_2018-2022.pdf"))
+    ap.add_argument("--pages", type=int, default=300, help="Synthetic pages when --pdf does not exist (default: 300).")
+    ap.add_argument("--repeat", type=int, default=3, help="Timed runs per implementation; the best is reported.")
+    args = ap.parse_args()
+
+    if args.pdf.exists():
+        streams, cmap = _pdf_streams(args.pdf)
+        print(f"{args.pdf}: {len(streams)} text streams, {sum(map(len, streams)) / 1e6:.1f} MB decoded")
+    else:
+        streams, cmap = _synthetic_streams(args.pages)
+        print(f"synthetic: {len(streams)} pages, {sum(map(len, streams)) / 1e6:.1f} MB of content")
+
+    scan = lambda: [srs._extract_text_ops_scan(s, cmap=cmap) for s in streams]  # noqa: E731
+    fast = lambda: [srs._extract_text_ops(s, cmap=cmap) for s in streams]  # noqa: E731
+    if scan() != fast():
+        raise SystemExit("Tokenizer outputs differ")
+
+    t_scan = _best(scan, args.repeat)
+    t_fast = _best(fast, args.repeat)
+    print(f"   scan: {t_scan:.3f}s (best of {args.repeat})")
+    print(f"  regex: {t_fast:.3f}s (best of {args.repeat})")
+    print(f"speedup: {t_scan / t_fast:.1f}x; segments identical")
+
+
+if __name__ == "__main__":
+    main()
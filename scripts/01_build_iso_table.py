@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from war_hunger_aging.iso import build_iso_table
+
+
+DEFAULT_OUT = Path(__file__).resolve().parents[1] / "src" / "war_hunger_aging" / "data" / "iso3_table.json"
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Regenerate the static ISO3 lookup table shipped with the package.")
+    ap.add_argument("--out", type=Path, default=DEFAULT_OUT)
+    args = ap.parse_args()
+
+    table = build_iso_table()
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(table, ensure_ascii=False, separators=(",", ":"), sort_keys=False) + "\n", encoding="utf-8")
+    print(f"Wrote {args.out} ({len(table['names']):,} names, {table['source']})")
+
+
+if __name__ == "__main__":
+    main()
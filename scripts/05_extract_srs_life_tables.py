@@ -1,41 +1,49 @@
 from __future__ import annotations
 
+import argparse
 from pathlib import Path
 
+import pyarrow.parquet as pq
+
 from war_hunger_aging.config import ensure_dirs, load_config
-from war_hunger_aging.io.srs_life_tables import load_srs_abridged_life_tables_pdf, write_rows_csv
+from war_hunger_aging.io.srs_life_tables import (
+    extract_srs_pdf_segments,
+    iter_srs_abridged_life_tables_segments,
+    write_rows_csv,
+    write_srs_parquet,
+)
 
 
 def main() -> None:
+    ap = argparse.ArgumentParser(description="Extract SRS abridged life tables (India + states) from the PDF.")
+    ap.add_argument("--pdf", type=Path, default=Path("SRS-Abridged_Life_Tables_2018-2022.pdf"))
+    ap.add_argument("--workers", type=int, default=None, help="Processes for stream extraction (default: all CPUs).")
+    ap.add_argument("--csv", action="store_true", help="Also export the rows as CSV next to the parquet file.")
+    args = ap.parse_args()
+
     cfg = load_config(Path("config/project.yml"))
     ensure_dirs(cfg)
 
-    pdf = Path("SRS-Abridged_Life_Tables_2018-2022.pdf")
+    pdf = args.pdf
     if not pdf.exists():
         raise FileNotFoundError(f"Missing PDF at {pdf.resolve()}")
 
-    rows = load_srs_abridged_life_tables_pdf(pdf)
-    out_csv = cfg.paths.data_intermediate / "srs_abridged_life_tables_2018_22.csv"
-    write_rows_csv(rows, out_csv)
+    segments = extract_srs_pdf_segments(pdf, max_workers=args.workers)
+    out_parquet = cfg.paths.data_intermediate / "srs_abridged_life_tables_2018_22.parquet"
+    n = write_srs_parquet(iter_srs_abridged_life_tables_segments(segments), out_parquet)
+    print(f"Wrote {out_parquet} ({n:,} rows)")
 
-    areas = sorted({str(r["area"]) for r in rows})
-    residences = sorted({str(r["residence"]) for r in rows})
-    sexes = sorted({str(r["sex"]) for r in rows})
-    print(f"Wrote {out_csv} ({len(rows):,} rows)")
+    table = pq.read_table(out_parquet, columns=["area", "residence", "sex"])
+    areas = table["area"].unique()
+    residences = sorted(table["residence"].unique().to_pylist())
+    sexes = sorted(table["sex"].unique().to_pylist())
     print(f"Areas: {len(areas)}; Residences: {residences}; Sexes: {sexes}")
 
-    # Optional parquet output when pandas/pyarrow are available.
-    try:
-        import pandas as pd  # type: ignore
-
-        df = pd.DataFrame(rows)
-        out_parquet = cfg.paths.data_intermediate / "srs_abridged_life_tables_2018_22.parquet"
-        df.to_parquet(out_parquet, index=False)
-        print(f"Wrote {out_parquet} ({len(df):,} rows)")
-    except ModuleNotFoundError:
-        pass
+    if args.csv:
+        out_csv = out_parquet.with_suffix(".csv")
+        write_rows_csv(pq.read_table(out_parquet).to_pylist(), out_csv)
+        print(f"Wrote {out_csv} ({n:,} rows)")
 
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from war_hunger_aging.config import ensure_dirs, load_config
+from war_hunger_aging.io.srs_releases import build_srs_dataset, load_srs_dataset
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(
+        description="Extract a directory of SRS abridged life-table PDFs (one per release) into a partitioned parquet dataset."
+    )
+    ap.add_argument("--pdf-dir", type=Path, default=Path("data/raw/srs"), help="Directory of SRS PDFs (default: data/raw/srs).")
+    ap.add_argument("--out", type=Path, default=None, help="Dataset root (default: data/intermediate/srs_life_tables).")
+    ap.add_argument("--workers", type=int, default=None, help="Processes, one PDF each (default: all CPUs).")
+    ap.add_argument("--force", action="store_true", help="Re-extract every PDF even if its hash is unchanged.")
+    args = ap.parse_args()
+
+    cfg = load_config(Path("config/project.yml"))
+    ensure_dirs(cfg)
+
+    if not args.pdf_dir.is_dir():
+        raise FileNotFoundError(f"Missing SRS PDF directory at {args.pdf_dir.resolve()}")
+    out = args.out or cfg.paths.data_intermediate / "srs_life_tables"
+
+    written = build_srs_dataset(args.pdf_dir, out, max_workers=args.workers, force=args.force)
+    df = load_srs_dataset(out)
+    print(f"Extracted releases: {', '.join(written) or 'none (all unchanged)'}")
+    print(f"Wrote {out} ({len(df):,} rows; releases: {sorted(df['release'].unique())}; areas: {df['area'].nunique()})")
+
+
+if __name__ == "__main__":
+    main()
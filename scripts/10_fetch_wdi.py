@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import argparse
 from pathlib import Path
 
 from war_hunger_aging.config import ensure_dirs, load_config
+from war_hunger_aging.io.http import http_cache_from_config
 from war_hunger_aging.io.wdi import fetch_indicators
 
 
 def main() -> None:
+    ap = argparse.ArgumentParser(description="Fetch the configured WDI indicators.")
+    ap.add_argument("--offline", action="store_true", help="Serve responses only from the HTTP cache.")
+    ap.add_argument("--no-cache", action="store_true", help="Bypass the on-disk HTTP cache.")
+    args = ap.parse_args()
+
     cfg = load_config(Path("config/project.yml"))
     ensure_dirs(cfg)
 
@@ -15,7 +22,8 @@ def main() -> None:
         cfg.wdi.indicators.pou,
         cfg.wdi.indicators.fies,
     ]
-    df = fetch_indicators(inds, countries=cfg.countries, start_year=cfg.start_year, end_year=cfg.end_year)
+    cache = http_cache_from_config(cfg, offline=args.offline, enabled=not args.no_cache)
+    df = fetch_indicators(inds, countries=cfg.countries, start_year=cfg.start_year, end_year=cfg.end_year, cache=cache)
     out = cfg.paths.data_intermediate / "wdi.parquet"
     df.to_parquet(out, index=False)
     print(f"Wrote {out} ({len(df):,} rows)")
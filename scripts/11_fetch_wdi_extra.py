@@ -4,7 +4,9 @@ import argparse
 from pathlib import Path
 
 from war_hunger_aging.config import ensure_dirs, load_config
+from war_hunger_aging.io.http import http_cache_from_config
 from war_hunger_aging.io.wdi import fetch_indicators
+from war_hunger_aging.io.wdi_bulk import load_wdi_bulk
 
 
 DEFAULT_INDICATORS = [
@@ -30,13 +32,32 @@ def main() -> None:
         default=[],
         help="Indicator code to fetch (repeatable). If omitted, uses a default set.",
     )
+    ap.add_argument(
+        "--archive",
+        type=Path,
+        default=None,
+        help="Read from a local bulk WDI CSV zip (WDI_CSV.zip) instead of the API.",
+    )
+    ap.add_argument("--offline", action="store_true", help="Serve responses only from the HTTP cache.")
+    ap.add_argument("--no-cache", action="store_true", help="Bypass the on-disk HTTP cache.")
     args = ap.parse_args()
 
     cfg = load_config(Path("config/project.yml"))
     ensure_dirs(cfg)
 
     inds = args.inds or DEFAULT_INDICATORS
-    df = fetch_indicators(inds, countries=cfg.countries, start_year=cfg.start_year, end_year=cfg.end_year)
+    if args.archive is not None:
+        df = load_wdi_bulk(
+            args.archive,
+            inds,
+            countries=cfg.countries,
+            start_year=cfg.start_year,
+            end_year=cfg.end_year,
+            cache_dir=cfg.paths.data_intermediate / "wdi_bulk",
+        )
+    else:
+        cache = http_cache_from_config(cfg, offline=args.offline, enabled=not args.no_cache)
+        df = fetch_indicators(inds, countries=cfg.countries, start_year=cfg.start_year, end_year=cfg.end_year, cache=cache)
 
     out_parquet = cfg.paths.data_intermediate / "wdi_extra.parquet"
     out_csv = cfg.paths.data_intermediate / "wdi_extra.csv"
@@ -4,9 +4,18 @@ import argparse
 from pathlib import Path
 
 import pandas as pd
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 from war_hunger_aging.config import ensure_dirs, load_config
-from war_hunger_aging.io.who_gho import fetch_gho_indicator
+from war_hunger_aging.io.http import http_cache_from_config, make_session
+from war_hunger_aging.io.who_gho import (
+    country_filter,
+    fetch_gho_indicator,
+    fetch_gho_sharded,
+    write_gho_parquet,
+    year_filter,
+)
 
 
 DEFAULT_INDICATORS = [
@@ -16,17 +25,11 @@ DEFAULT_INDICATORS = [
 ]
 
 
-def _country_filter(iso3s: list[str]) -> str:
-    parts = [f"SpatialDim eq '{c}'" for c in iso3s]
-    if not parts:
-        return ""
-    if len(parts) == 1:
-        return parts[0]
-    return "(" + " or ".join(parts) + ")"
-
-
-def _year_filter(start_year: int, end_year: int) -> str:
-    return f"(TimeDim ge {start_year} and TimeDim le {end_year})"
+def _parquet_to_csv(src: Path, dst: Path) -> None:
+    pf = pq.ParquetFile(src)
+    with pacsv.CSVWriter(dst, pf.schema_arrow) as writer:
+        for batch in pf.iter_batches():
+            writer.write_batch(batch)
 
 
 def main() -> None:
@@ -45,6 +48,22 @@ def main() -> None:
     )
     ap.add_argument("--start-year", type=int, default=None)
     ap.add_argument("--end-year", type=int, default=None)
+    mode = ap.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write typed, column-projected batches page by page instead of building a DataFrame.",
+    )
+    mode.add_argument(
+        "--shard",
+        action="store_true",
+        help="Split into (country batch x year range) queries fetched concurrently.",
+    )
+    ap.add_argument("--countries-per-shard", type=int, default=10)
+    ap.add_argument("--years-per-shard", type=int, default=10)
+    ap.add_argument("--workers", type=int, default=4, help="Concurrent requests with --stream / --shard.")
+    ap.add_argument("--offline", action="store_true", help="Serve responses only from the HTTP cache.")
+    ap.add_argument("--no-cache", action="store_true", help="Bypass the on-disk HTTP cache.")
     args = ap.parse_args()
 
     cfg = load_config(Path("config/project.yml"))
@@ -54,18 +73,37 @@ def main() -> None:
     start_year = int(args.start_year) if args.start_year is not None else int(cfg.start_year)
     end_year = int(args.end_year) if args.end_year is not None else int(cfg.end_year)
 
-    where_parts = [_year_filter(start_year, end_year)]
-    if not args.all_countries:
-        where_parts.append(_country_filter(list(cfg.countries)))
+    countries = [] if args.all_countries else list(cfg.countries)
+    where_parts = [year_filter(start_year, end_year), country_filter(countries)]
     where = " and ".join([p for p in where_parts if p])
 
-    frames: list[pd.DataFrame] = []
-    for ind in inds:
-        frames.append(fetch_gho_indicator(ind, where=where if where else None))
-
-    df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    cache = http_cache_from_config(cfg, offline=args.offline, enabled=not args.no_cache)
     out_parquet = cfg.paths.data_intermediate / "who_gho.parquet"
     out_csv = cfg.paths.data_intermediate / "who_gho.csv"
+    if args.stream:
+        n = write_gho_parquet(inds, out_parquet, where=where or None, max_workers=args.workers, cache=cache)
+        _parquet_to_csv(out_parquet, out_csv)
+        print(f"Wrote {out_parquet} ({n:,} rows)")
+        print(f"Wrote {out_csv} ({n:,} rows)")
+        return
+
+    if args.shard:
+        df = fetch_gho_sharded(
+            inds,
+            countries=countries,
+            start_year=start_year,
+            end_year=end_year,
+            countries_per_shard=args.countries_per_shard,
+            years_per_shard=args.years_per_shard,
+            max_workers=args.workers,
+            cache=cache,
+        )
+    else:
+        session = make_session()
+        frames: list[pd.DataFrame] = []
+        for ind in inds:
+            frames.append(fetch_gho_indicator(ind, where=where if where else None, session=session, cache=cache))
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
     df.to_parquet(out_parquet, index=False)
     df.to_csv(out_csv, index=False)
     print(f"Wrote {out_parquet} ({len(df):,} rows)")
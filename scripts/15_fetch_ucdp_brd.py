@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import argparse
-import io
 import pathlib
-import urllib.request
-import zipfile
+
+from war_hunger_aging.io.download import fetch_archive
 
 
 DEFAULT_URL = "https://ucdp.uu.se/downloads/brd/ucdp-brd-conf-251-csv.zip"
@@ -14,28 +13,38 @@ def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Download and extract UCDP BRD (conflict-level) into data/raw/ucdp/.")
     p.add_argument("--url", default=DEFAULT_URL, help=f"Zip URL to download (default: {DEFAULT_URL})")
     p.add_argument("--outdir", default="data/raw/ucdp", help="Output directory (default: data/raw/ucdp)")
+    p.add_argument("--sha256", default=None, help="Expected SHA-256 of the zip; a mismatch aborts.")
+    p.add_argument(
+        "--member",
+        dest="members",
+        action="append",
+        default=[],
+        help="Glob of zip members to extract (repeatable). Default: *.csv",
+    )
+    p.add_argument("--force", action="store_true", help="Re-download even if the recorded archive is unchanged.")
     return p.parse_args()
 
 
 def main() -> None:
     args = parse_args()
     outdir = pathlib.Path(args.outdir)
-    outdir.mkdir(parents=True, exist_ok=True)
 
     print(f"Downloading: {args.url}")
-    with urllib.request.urlopen(args.url, timeout=300) as resp:
-        data = resp.read()
-    print(f"Downloaded bytes: {len(data):,}")
-
-    z = zipfile.ZipFile(io.BytesIO(data))
-    names = z.namelist()
-    print(f"Zip entries: {len(names)}")
-    z.extractall(outdir)
-    print(f"Extracted to: {outdir}")
-    for name in names[:20]:
-        print(f"- {name}")
+    result = fetch_archive(
+        args.url,
+        outdir,
+        members=tuple(args.members) or ("*.csv",),
+        expected_sha256=args.sha256,
+        force=args.force,
+    )
+    if result.skipped:
+        print(f"Unchanged: {result.archive} (sha256 {result.sha256[:12]}...); nothing to do")
+        return
+    print(f"Downloaded bytes: {result.size:,} (sha256 {result.sha256})")
+    print(f"Extracted {len(result.extracted)} member(s) to: {outdir}")
+    for path in result.extracted[:20]:
+        print(f"- {path.relative_to(outdir)}")
 
 
 if __name__ == "__main__":
     main()
-
@@ -4,7 +4,7 @@ import argparse
 from pathlib import Path
 
 from war_hunger_aging.config import ensure_dirs, load_config
-from war_hunger_aging.io.ucdp import discover_ucdp_file, load_and_standardize_ucdp_brd
+from war_hunger_aging.io.ucdp import ALLOCATIONS, discover_ucdp_file, load_and_standardize_ucdp_brd
 
 
 def parse_args() -> argparse.Namespace:
@@ -13,6 +13,12 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--year-col", type=str, default=None)
     p.add_argument("--country-col", type=str, default=None)
     p.add_argument("--deaths-col", type=str, default=None)
+    p.add_argument(
+        "--allocation",
+        choices=ALLOCATIONS,
+        default="equal",
+        help="How deaths of multi-country locations (e.g. 'Syria, Turkey') are split.",
+    )
     return p.parse_args()
 
 
@@ -30,6 +36,7 @@ def main() -> None:
         year_col=args.year_col,
         country_col=args.country_col,
         deaths_col=args.deaths_col,
+        allocation=args.allocation,
     )
     out = cfg.paths.data_intermediate / "ucdp_brd.parquet"
     std.to_parquet(out, index=False)
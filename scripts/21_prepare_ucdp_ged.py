@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from war_hunger_aging.config import ensure_dirs, load_config
+from war_hunger_aging.io.ucdp import discover_ged_files, write_ged_aggregates
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Stream UCDP GED events into iso3-year and admin1-year death totals.")
+    p.add_argument(
+        "--input",
+        type=Path,
+        action="append",
+        default=[],
+        help="GED CSV / CSV.gz file (repeatable). If omitted, uses every CSV in data/raw/ucdp_ged/.",
+    )
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    cfg = load_config(Path("config/project.yml"))
+    ensure_dirs(cfg)
+
+    paths = args.input or discover_ged_files(cfg.paths.data_raw / "ucdp_ged")
+    written = write_ged_aggregates(paths, cfg.paths.data_intermediate, start_year=cfg.start_year, end_year=cfg.end_year)
+    for path in written.values():
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from war_hunger_aging.config import ensure_dirs, load_config
+from war_hunger_aging.io.wpp import write_wpp_bulk_parquet
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(
+        description="Convert UN WPP bulk life-table CSVs into data/raw/wpp_mx.parquet (no R needed)."
+    )
+    p.add_argument(
+        "inputs",
+        type=Path,
+        nargs="+",
+        help="WPP bulk CSV / CSV.gz files, e.g. WPP2024_Life_Table_Complete_Medium_{Female,Male,Both}_1950-2023.csv.gz",
+    )
+    p.add_argument("--out", type=Path, default=None, help="Output parquet (default: data/raw/wpp_mx.parquet)")
+    p.add_argument("--variant", default=None, help="Keep only this projection variant (e.g. Medium).")
+    p.add_argument("--all", action="store_true", help="Keep every country/year/sex instead of filtering to config/project.yml.")
+    p.add_argument("--block-size-mb", type=int, default=16, help="CSV block size; bounds peak memory (default: 16)")
+    return p.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    cfg = load_config(Path("config/project.yml"))
+    ensure_dirs(cfg)
+
+    out = args.out or cfg.paths.data_raw / "wpp_mx.parquet"
+    filters = {} if args.all else dict(
+        countries=cfg.countries, start_year=cfg.start_year, end_year=cfg.end_year, sexes=cfg.sexes
+    )
+    rows = write_wpp_bulk_parquet(
+        args.inputs, out, variant=args.variant, block_size=args.block_size_mb << 20, **filters
+    )
+    print(f"Wrote {out} with {rows:,} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,29 @@
 from __future__ import annotations
 
+import argparse
 from pathlib import Path
 
 import pandas as pd
 
 from war_hunger_aging.config import ensure_dirs, load_config
-from war_hunger_aging.io.wpp import load_wpp_mx
+from war_hunger_aging.io.ucdp import GED_MEASURES, ged_battle_deaths
 from war_hunger_aging.pipeline.build_panel import build_panels
+from war_hunger_aging.pipeline.mortality import load_mortality
 
 
 def main() -> None:
+    ap = argparse.ArgumentParser(description="Build panel_base / event panel / groups parquet outputs.")
+    ap.add_argument("--engine", choices=["pandas", "polars"], default="pandas", help="Panel engine (polars is optional).")
+    ap.add_argument("--force", action="store_true", help="Rebuild every country instead of only changed ones.")
+    ap.add_argument(
+        "--conflict",
+        choices=["brd", "ged"],
+        default="brd",
+        help="battle_deaths from UCDP BRD (default) or the GED country-year aggregate (scripts/21).",
+    )
+    ap.add_argument("--ged-measure", choices=GED_MEASURES, default="best")
+    args = ap.parse_args()
+
     cfg = load_config(Path("config/project.yml"))
     ensure_dirs(cfg)
 
@@ -19,13 +33,28 @@ def main() -> None:
         if csv_fallback.exists():
             wpp_path = csv_fallback
     wdi_path = cfg.paths.data_intermediate / "wdi.parquet"
-    ucdp_path = cfg.paths.data_intermediate / "ucdp_brd.parquet"
+    ucdp_name = "ucdp_ged_country.parquet" if args.conflict == "ged" else "ucdp_brd.parquet"
+    ucdp_path = cfg.paths.data_intermediate / ucdp_name
 
-    mortality = load_wpp_mx(wpp_path)
+    mortality = load_mortality(cfg, wpp_path=wpp_path)
     wdi_long = pd.read_parquet(wdi_path)
     ucdp = pd.read_parquet(ucdp_path)
+    if args.conflict == "ged":
+        ucdp = ged_battle_deaths(ucdp, measure=args.ged_measure)
 
-    paths = build_panels(cfg=cfg, mortality=mortality, wdi_long=wdi_long, ucdp=ucdp, out_dir=cfg.paths.data_processed)
+    paths = build_panels(
+        cfg=cfg,
+        mortality=mortality,
+        wdi_long=wdi_long,
+        ucdp=ucdp,
+        out_dir=cfg.paths.data_processed,
+        incremental=not args.force,
+        engine=args.engine,
+    )
+    if paths.up_to_date:
+        print(f"Panel up to date in {cfg.paths.data_processed}")
+        return
+    print(f"Rebuilt {len(paths.rebuilt)}/{len(cfg.countries)} countries")
     print(f"Wrote {paths.panel_base}")
     print(f"Wrote {paths.groups}")
     print(f"Wrote {paths.panel_event}")
@@ -75,7 +75,7 @@ def main() -> None:
         ("Fit QC", Path("data/processed/fit_qc.parquet")),
         ("WDI extra series (optional)", Path("data/intermediate/wdi_extra.parquet")),
         ("WHO GHO series (optional)", Path("data/intermediate/who_gho.parquet")),
-        ("SRS (India) extracted table", Path("data/intermediate/srs_abridged_life_tables_2018_22.csv")),
+        ("SRS (India) extracted table", Path("data/intermediate/srs_abridged_life_tables_2018_22.parquet")),
         ("SRS (India) fitted params", Path("data/processed/srs_params.parquet")),
         ("SRS (India) Urban–Rural deltas", Path("data/processed/srs_urban_rural_deltas.parquet")),
         ("SRS (India) figures", figures_dir / "srs"),
@@ -86,16 +86,16 @@ def main() -> None:
         lines.append(f"- **{label}:** `{p.as_posix()}`")
     lines.append("")
 
-    # Optional: India SRS add-on section (if the extracted CSV exists).
-    srs_csv = Path("data/intermediate/srs_abridged_life_tables_2018_22.csv")
+    # Optional: India SRS add-on section (if the extracted table exists).
+    srs_table = Path("data/intermediate/srs_abridged_life_tables_2018_22.parquet")
     srs_fig_dir = figures_dir / "srs"
-    if srs_csv.exists():
+    if srs_table.exists() or srs_table.with_suffix(".csv").exists():
         lines.append("## India (SRS) Add-on\n")
         lines.append("This repo can also fit GM/GMH on India’s SRS abridged life tables (2018–22) by `area × residence × sex`.\n")
         lines.append("Run:\n")
         lines.append(_code_block("python3 scripts/05_extract_srs_life_tables.py\npython3 scripts/55_fit_srs_models.py", lang="bash"))
         lines.append("Key outputs:\n")
-        lines.append("- `data/intermediate/srs_abridged_life_tables_2018_22.csv` (tidy extraction + derived `mx`)\n")
+        lines.append("- `data/intermediate/srs_abridged_life_tables_2018_22.parquet` (typed tidy extraction + derived `mx`)\n")
         lines.append("- `data/processed/srs_params.parquet` and `reports/tables/srs_params.csv`\n")
         lines.append("- `data/processed/srs_urban_rural_deltas.parquet` and `reports/tables/srs_urban_rural_deltas.csv`\n")
         if srs_fig_dir.exists():
@@ -18,18 +18,28 @@ class EventSummary:
     crisis_minus_pre: float
 
 
+_PERIODS = ("pre", "crisis", "post")
+
+
 def summarize_event_windows(
     *,
     params: pd.DataFrame,
     groups: pd.DataFrame,
     param_cols: list[str],
     pre_years: int = 5,
+    with_counts: bool = False,
+    with_se: bool = False,
 ) -> pd.DataFrame:
     """
     Build pre/crisis/post summaries per (case_group, iso3, sex, param).
 
     params: iso3-year-sex with parameter columns
     groups: case_group-iso3 with t0/t1/is_case_country
+
+    One row per `EventSummary`. Groups are cross-joined with the years of `params`,
+    periods are labelled with array comparisons and every parameter is averaged in
+    a single groupby. `with_counts` adds `{period}_n` (non-missing years) and
+    `with_se` adds `{period}_se` (standard error of the mean, NaN below 2 years).
     """
     needed = {"iso3", "year", "sex"} | set(param_cols)
     missing = needed - set(params.columns)
@@ -41,56 +51,51 @@ def summarize_event_windows(
     if g_missing:
         raise KeyError(f"groups missing columns: {sorted(g_missing)}")
 
-    # Expand groups to (case_group, iso3, year) with event_time and period.
-    expanded: list[dict[str, object]] = []
-    for _, g in groups.iterrows():
-        t0 = int(g["t0"])
-        t1 = int(g["t1"])
-        iso3 = str(g["iso3"])
-        case_group = str(g["case_group"])
-        for year in params["year"].unique():
-            year_i = int(year)
-            if t0 - pre_years <= year_i <= t0 - 1:
-                period = "pre"
-            elif t0 <= year_i <= t1:
-                period = "crisis"
-            elif year_i >= t1 + 1:
-                period = "post"
-            else:
-                period = "other"
-            expanded.append(
-                {
-                    "case_group": case_group,
-                    "iso3": iso3,
-                    "year": year_i,
-                    "period": period,
-                }
-            )
-    periods = pd.DataFrame(expanded)
-    merged = periods.merge(params, on=["iso3", "year"], how="left")
+    # Expand groups to (case_group, iso3, year) with period.
+    g = pd.DataFrame(
+        {
+            "case_group": groups["case_group"].astype(str).to_numpy(),
+            "iso3": groups["iso3"].astype(str).to_numpy(),
+            "t0": groups["t0"].astype(int).to_numpy(),
+            "t1": groups["t1"].astype(int).to_numpy(),
+        }
+    )
+    years = pd.DataFrame({"year": params["year"].unique().astype(int)})
+    periods = g.merge(years, how="cross")
+    year, t0, t1 = (periods[c].to_numpy() for c in ("year", "t0", "t1"))
+    periods["period"] = np.select(
+        [(year >= t0 - pre_years) & (year <= t0 - 1), (year >= t0) & (year <= t1), year >= t1 + 1],
+        _PERIODS,
+        default="other",
+    )
+    merged = periods[["case_group", "iso3", "year", "period"]].merge(
+        params[["iso3", "year", "sex", *param_cols]], on=["iso3", "year"], how="left"
+    )
     merged = merged.dropna(subset=["sex"])
+    merged["sex"] = merged["sex"].astype(str)
+
+    keys = ["case_group", "iso3", "sex"]
+    long = merged.melt(id_vars=[*keys, "period"], value_vars=param_cols, var_name="param").dropna(subset=["value"])
+    long["param"] = pd.Categorical(long["param"], categories=list(dict.fromkeys(param_cols)))
+    stats = long.groupby([*keys, "param", "period"], observed=True, sort=True)["value"].agg(["mean", "count", "std"])
+    wide = stats.unstack("period")
+
+    out = wide.index.to_frame(index=False)
+    out["param"] = out["param"].astype(str)
 
-    rows: list[EventSummary] = []
-    for (case_group, iso3, sex), sdf in merged.groupby(["case_group", "iso3", "sex"]):
-        for param in param_cols:
-            v = sdf[["period", param]].dropna()
-            if v.empty:
-                continue
-            means = v.groupby("period")[param].mean()
-            pre = float(means.get("pre", np.nan))
-            crisis = float(means.get("crisis", np.nan))
-            post = float(means.get("post", np.nan))
-            rows.append(
-                EventSummary(
-                    case_group=str(case_group),
-                    iso3=str(iso3),
-                    sex=str(sex),
-                    param=str(param),
-                    pre_mean=pre,
-                    crisis_mean=crisis,
-                    post_mean=post,
-                    crisis_minus_pre=float(crisis - pre) if np.isfinite(crisis) and np.isfinite(pre) else np.nan,
-                )
-            )
-    return pd.DataFrame([r.__dict__ for r in rows])
+    def stat(name: str, period: str) -> np.ndarray:
+        if (name, period) not in wide.columns:
+            return np.full(len(out), np.nan)
+        return wide[(name, period)].to_numpy(float)
 
+    for period in _PERIODS:
+        out[f"{period}_mean"] = stat("mean", period)
+    pre, crisis = out["pre_mean"].to_numpy(), out["crisis_mean"].to_numpy()
+    out["crisis_minus_pre"] = np.where(np.isfinite(crisis) & np.isfinite(pre), crisis - pre, np.nan)
+    if with_counts:
+        for period in _PERIODS:
+            out[f"{period}_n"] = np.nan_to_num(stat("count", period)).astype(int)
+    if with_se:
+        for period in _PERIODS:
+            out[f"{period}_se"] = stat("std", period) / np.sqrt(stat("count", period))
+    return out
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from war_hunger_aging.io.srs_life_tables import read_srs_life_tables
+from war_hunger_aging.io.srs_releases import load_srs_dataset
+from war_hunger_aging.model.gmh import fit_gompertz_makeham_hump
+
+
+SRS_GROUP_COLS = ["area", "period", "residence", "sex"]
+SRS_DELTA_METRICS = ("b", "c", "h", "mrdt", "rmse_log")
+
+
+def load_srs_fit_input(path: str | Path) -> pd.DataFrame:
+    """
+    Rows to fit: one extracted table (parquet / CSV) or a multi-release dataset
+    directory from `build_srs_dataset`. Open intervals (no `mx`) are dropped.
+    """
+    path = Path(path)
+    df = load_srs_dataset(path) if path.is_dir() else read_srs_life_tables(path)
+    return df.dropna(subset=["age_mid", "mx"]).reset_index(drop=True)
+
+
+def srs_group_cols(df: pd.DataFrame) -> list[str]:
+    """Fitting groups: area x period x residence x sex, per release when present."""
+    return (["release"] if "release" in df.columns else []) + SRS_GROUP_COLS
+
+
+def _fit_group(
+    age: np.ndarray,
+    mx: np.ndarray,
+    *,
+    adult_age_min: float,
+    adult_age_max: float,
+    fit_age_min: float,
+    fit_age_max: float,
+    mu_h: float,
+    sigma_h: float,
+    min_points: int,
+) -> list[dict[str, object]]:
+    """Worker: GM and GMH fits of one group -> two parameter rows."""
+    gm, gmh = fit_gompertz_makeham_hump(
+        pd.DataFrame({"age": age, "mx": mx}),
+        adult_age_min=adult_age_min,
+        adult_age_max=adult_age_max,
+        fit_age_min=fit_age_min,
+        fit_age_max=fit_age_max,
+        mu_h=mu_h,
+        sigma_h=sigma_h,
+        min_points=min_points,
+    )
+    gm_row = {
+        "model": "gm",
+        "a": gm.a,
+        "b": gm.b,
+        "c": gm.c,
+        "h": np.nan,
+        "converged": gm.converged,
+        "rmse_log": gm.rmse_log,
+        "rmse_log_adult": np.nan,
+        "n": gm.n,
+        "mrdt": gm.mrdt,
+        "message": gm.message,
+    }
+    gmh_row = {
+        "model": "gmh",
+        "a": gmh.a,
+        "b": gmh.b,
+        "c": gmh.c,
+        "h": gmh.h,
+        "converged": gmh.converged,
+        "rmse_log": gmh.rmse_log,
+        "rmse_log_adult": gmh.rmse_log_adult,
+        "n": gmh.n,
+        "mrdt": gmh.mrdt,
+        "message": gmh.message,
+    }
+    return [gm_row, gmh_row]
+
+
+def fit_srs_groups(
+    df: pd.DataFrame,
+    *,
+    adult_age_min: float = 35.0,
+    fit_age_min: float = 15.0,
+    mu_h: float = 28.0,
+    sigma_h: float = 10.0,
+    min_points: int = 12,
+    max_workers: int | None = None,
+) -> pd.DataFrame:
+    """
+    Fit GM and GMH to every (release,) area x period x residence x sex group of
+    SRS rows (`age_mid`, `mx`); returns two rows (model gm / gmh) per group.
+
+    Both fits run up to the oldest closed interval in `df`. Groups are sent to a
+    process pool as plain age / mx arrays (None = one worker per CPU, 1 = serial);
+    results come back in group order, so the output does not depend on `max_workers`.
+    """
+    keys = srs_group_cols(df)
+    df = df.dropna(subset=["age_mid", "mx"])
+    if df.empty:
+        raise RuntimeError("No mx values found; check extraction output.")
+    max_age_mid = float(df["age_mid"].max())
+    fit = partial(
+        _fit_group,
+        adult_age_min=float(adult_age_min),
+        adult_age_max=max_age_mid,
+        fit_age_min=float(fit_age_min),
+        fit_age_max=max_age_mid,
+        mu_h=float(mu_h),
+        sigma_h=float(sigma_h),
+        min_points=int(min_points),
+    )
+
+    df = df.sort_values(keys + ["age_mid"], kind="stable")
+    groups = df.groupby(keys, observed=True, sort=True)
+    labels = list(groups.groups)
+    ages = [g["age_mid"].to_numpy(float) for _, g in groups]
+    mxs = [g["mx"].to_numpy(float) for _, g in groups]
+
+    workers = min(max_workers or os.cpu_count() or 1, len(labels))
+    if workers <= 1:
+        fitted = list(map(fit, ages, mxs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            fitted = list(pool.map(fit, ages, mxs, chunksize=max(1, len(labels) // (workers * 4))))
+
+    rows = [
+        {**dict(zip(keys, label if isinstance(label, tuple) else (label,))), **row}
+        for label, pair in zip(labels, fitted)
+        for row in pair
+    ]
+    params = pd.DataFrame(rows)
+    params[keys] = params[keys].astype(str)
+    return params
+
+
+def srs_urban_rural_deltas(
+    params: pd.DataFrame,
+    *,
+    models: Iterable[str] = ("gm", "gmh"),
+    metrics: Iterable[str] = SRS_DELTA_METRICS,
+) -> pd.DataFrame:
+    """
+    Urban - Rural differences per (release,) area x period x sex x model.
+
+    Parameters are indexed by group + residence and unstacked once into
+    `{metric}_{residence}` columns; `delta_{metric}_urban_minus_rural` (and `_pct`,
+    relative to Rural) are whole-column array operations.
+    """
+    metrics = list(metrics)
+    keys = [c for c in srs_group_cols(params) if c != "residence"] + ["model"]
+    sub = params[params["model"].isin(list(models))]
+    table = sub.set_index(keys + ["residence"])[metrics].astype(float)
+    # Like pivot_table: groups with no metric at all and all-NaN columns are dropped.
+    wide = table.dropna(how="all").unstack("residence").dropna(axis=1, how="all")
+    wide = wide.sort_index(axis=1)
+    wide.columns = [f"{metric}_{residence}" for metric, residence in wide.columns]
+
+    for metric in metrics:
+        urban, rural = f"{metric}_Urban", f"{metric}_Rural"
+        if urban not in wide.columns or rural not in wide.columns:
+            continue
+        u, r = wide[urban].to_numpy(), wide[rural].to_numpy()
+        delta = u - r
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pct = np.where(r != 0, delta / r, np.nan)
+        wide[f"delta_{metric}_urban_minus_rural"] = delta
+        wide[f"delta_{metric}_urban_minus_rural_pct"] = pct
+    return wide.reset_index()
@@ -9,13 +9,18 @@ from rich import print
 
 from war_hunger_aging.analysis.event_study import summarize_event_windows
 from war_hunger_aging.analysis.regressions import run_fe_regression
+from war_hunger_aging.analysis.srs import fit_srs_groups, load_srs_fit_input, srs_urban_rural_deltas
 from war_hunger_aging.config import ensure_dirs, load_config
 from war_hunger_aging.io import ucdp as ucdp_io
 from war_hunger_aging.io import wdi as wdi_io
-from war_hunger_aging.io.wpp import load_wpp_mx
+from war_hunger_aging.io.http import http_cache_from_config
+from war_hunger_aging.io.srs_releases import build_srs_dataset
+from war_hunger_aging.io.wdi_bulk import load_wdi_bulk
+from war_hunger_aging.io.wpp import write_wpp_bulk_parquet
 from war_hunger_aging.model.gmh import fit_gompertz_makeham_hump
 from war_hunger_aging.model.gm import fit_gompertz_makeham
 from war_hunger_aging.pipeline.build_panel import build_panels
+from war_hunger_aging.pipeline.mortality import load_mortality
 from war_hunger_aging.viz.figures import (
     plot_hazard_overlays_pre_crisis_post,
     plot_param_timeseries_case_vs_controls,
@@ -27,7 +32,19 @@ app = typer.Typer(add_completion=False, help="War & hunger vs aging curves pipel
 
 
 @app.command()
-def fetch_wdi(config: Path = typer.Option(Path("config/project.yml"), exists=True), force: bool = False) -> None:
+def fetch_wdi(
+    config: Path = typer.Option(Path("config/project.yml"), exists=True),
+    force: bool = False,
+    workers: int = typer.Option(4, help="Concurrent WDI requests (indicators and pages)."),
+    offline: bool = typer.Option(False, help="Serve responses only from the HTTP cache; fail on misses."),
+    cache: bool = typer.Option(True, help="Use the on-disk HTTP cache (config http_cache)."),
+    source: str = typer.Option("api", help="'api' (paginated JSON API) or 'bulk' (local WDI_CSV.zip)."),
+    archive: Path | None = typer.Option(None, help="Path to the bulk WDI CSV zip (with --source bulk)."),
+) -> None:
+    if source not in {"api", "bulk"}:
+        raise typer.BadParameter("source must be 'api' or 'bulk'.")
+    if source == "bulk" and archive is None:
+        raise typer.BadParameter("--source bulk requires --archive PATH.")
     cfg = load_config(config)
     ensure_dirs(cfg)
     out = cfg.paths.data_intermediate / "wdi.parquet"
@@ -39,7 +56,24 @@ def fetch_wdi(config: Path = typer.Option(Path("config/project.yml"), exists=Tru
         cfg.wdi.indicators.pou,
         cfg.wdi.indicators.fies,
     ]
-    df = wdi_io.fetch_indicators(inds, countries=cfg.countries, start_year=cfg.start_year, end_year=cfg.end_year)
+    if source == "bulk":
+        df = load_wdi_bulk(
+            archive,
+            inds,
+            countries=cfg.countries,
+            start_year=cfg.start_year,
+            end_year=cfg.end_year,
+            cache_dir=cfg.paths.data_intermediate / "wdi_bulk",
+        )
+    else:
+        df = wdi_io.fetch_indicators(
+            inds,
+            countries=cfg.countries,
+            start_year=cfg.start_year,
+            end_year=cfg.end_year,
+            max_workers=workers,
+            cache=http_cache_from_config(cfg, offline=offline, enabled=cache),
+        )
     df.to_parquet(out, index=False)
     print(f"[green]Wrote[/green] {out} ({len(df):,} rows)")
 
@@ -51,6 +85,7 @@ def prepare_ucdp(
     year_col: str | None = None,
     country_col: str | None = None,
     deaths_col: str | None = None,
+    allocation: str = typer.Option("equal", help="Multi-country locations: equal, full or first."),
     force: bool = False,
 ) -> None:
     cfg = load_config(config)
@@ -69,6 +104,7 @@ def prepare_ucdp(
         year_col=year_col,
         country_col=country_col,
         deaths_col=deaths_col,
+        allocation=allocation,
     )
     std.to_parquet(out, index=False)
     if not unmapped.empty:
@@ -79,7 +115,71 @@ def prepare_ucdp(
 
 
 @app.command()
-def build_panel(config: Path = typer.Option(Path("config/project.yml"), exists=True), force: bool = False) -> None:
+def prepare_ged(
+    config: Path = typer.Option(Path("config/project.yml"), exists=True),
+    input_path: list[Path] = typer.Option([], help="GED CSV file(s); default: all CSVs in data/raw/ucdp_ged/."),
+    force: bool = False,
+) -> None:
+    cfg = load_config(config)
+    ensure_dirs(cfg)
+    out = cfg.paths.data_intermediate / "ucdp_ged_country.parquet"
+    if out.exists() and not force:
+        print(f"[yellow]Skip[/yellow] UCDP GED aggregate; exists: {out}")
+        return
+    paths = input_path or ucdp_io.discover_ged_files(cfg.paths.data_raw / "ucdp_ged")
+    written = ucdp_io.write_ged_aggregates(
+        paths, cfg.paths.data_intermediate, start_year=cfg.start_year, end_year=cfg.end_year
+    )
+    for path in written.values():
+        print(f"[green]Wrote[/green] {path}")
+
+
+@app.command()
+def export_wpp(
+    input_path: list[Path] = typer.Argument(..., exists=True, help="WPP bulk life-table CSV / CSV.gz file(s)."),
+    config: Path = typer.Option(Path("config/project.yml"), exists=True),
+    variant: str | None = typer.Option(None, help="Keep only this projection variant (e.g. Medium)."),
+    all_rows: bool = typer.Option(False, "--all", help="Keep every country/year/sex, not just the config subset."),
+    force: bool = False,
+) -> None:
+    cfg = load_config(config)
+    ensure_dirs(cfg)
+    out = cfg.paths.data_raw / "wpp_mx.parquet"
+    if out.exists() and not force:
+        print(f"[yellow]Skip[/yellow] WPP export; exists: {out}")
+        return
+    filters = {} if all_rows else dict(
+        countries=cfg.countries, start_year=cfg.start_year, end_year=cfg.end_year, sexes=cfg.sexes
+    )
+    rows = write_wpp_bulk_parquet(input_path, out, variant=variant, **filters)
+    print(f"[green]Wrote[/green] {out} ({rows:,} rows)")
+
+
+@app.command()
+def extract_srs(
+    pdf_dir: Path = typer.Argument(Path("data/raw/srs"), exists=True, file_okay=False, help="Directory of SRS PDFs."),
+    config: Path = typer.Option(Path("config/project.yml"), exists=True),
+    workers: int | None = typer.Option(None, help="Processes, one PDF each (default: all CPUs)."),
+    force: bool = False,
+) -> None:
+    cfg = load_config(config)
+    ensure_dirs(cfg)
+    out = cfg.paths.data_intermediate / "srs_life_tables"
+    written = build_srs_dataset(pdf_dir, out, max_workers=workers, force=force)
+    if not written:
+        print(f"[yellow]Skip[/yellow] SRS extraction; all PDFs unchanged in {out}")
+        return
+    print(f"[green]Wrote[/green] {out} (releases: {', '.join(written)})")
+
+
+@app.command()
+def build_panel(
+    config: Path = typer.Option(Path("config/project.yml"), exists=True),
+    force: bool = False,
+    conflict: str = typer.Option("brd", help="Conflict deaths source: 'brd' (UCDP BRD) or 'ged' (UCDP GED)."),
+    ged_measure: str = typer.Option("best", help="GED estimate used as battle_deaths: best, low or high."),
+    engine: str = typer.Option("pandas", help="Panel engine: pandas or polars (needs the polars extra)."),
+) -> None:
     cfg = load_config(config)
     ensure_dirs(cfg)
 
@@ -88,29 +188,42 @@ def build_panel(config: Path = typer.Option(Path("config/project.yml"), exists=T
         csv_fallback = cfg.paths.data_raw / "wpp_mx.csv"
         if csv_fallback.exists():
             wpp_path = csv_fallback
-        else:
-            raise FileNotFoundError(f"Missing WPP export: {wpp_path} (or {csv_fallback}). Run scripts/30_export_wpp_from_r.R")
 
+    if conflict not in {"brd", "ged"}:
+        raise typer.BadParameter("conflict must be 'brd' or 'ged'.")
     wdi_path = cfg.paths.data_intermediate / "wdi.parquet"
-    ucdp_path = cfg.paths.data_intermediate / "ucdp_brd.parquet"
+    if conflict == "ged":
+        ucdp_path = cfg.paths.data_intermediate / "ucdp_ged_country.parquet"
+        ucdp_hint = "scripts/21_prepare_ucdp_ged.py"
+    else:
+        ucdp_path = cfg.paths.data_intermediate / "ucdp_brd.parquet"
+        ucdp_hint = "scripts/20_prepare_ucdp.py"
     if not wdi_path.exists():
         raise FileNotFoundError(f"Missing WDI file: {wdi_path}. Run scripts/10_fetch_wdi.py")
     if not ucdp_path.exists():
-        raise FileNotFoundError(f"Missing UCDP file: {ucdp_path}. Run scripts/20_prepare_ucdp.py")
+        raise FileNotFoundError(f"Missing UCDP file: {ucdp_path}. Run {ucdp_hint}")
 
     out_dir = cfg.paths.data_processed
-    panel_base = out_dir / "panel_base.parquet"
-    panel_event = out_dir / "panel.parquet"
-    groups_path = out_dir / "groups.parquet"
-    if all(p.exists() for p in [panel_base, panel_event, groups_path]) and not force:
-        print(f"[yellow]Skip[/yellow] build panel; outputs exist in {out_dir}")
-        return
-
-    mortality = load_wpp_mx(wpp_path)
+    # WPP or HMD per country, as selected by the config's mortality section.
+    mortality = load_mortality(cfg, wpp_path=wpp_path)
     wdi_long = pd.read_parquet(wdi_path)
     ucdp = pd.read_parquet(ucdp_path)
-
-    paths = build_panels(cfg=cfg, mortality=mortality, wdi_long=wdi_long, ucdp=ucdp, out_dir=out_dir)
+    if conflict == "ged":
+        ucdp = ucdp_io.ged_battle_deaths(ucdp, measure=ged_measure)
+
+    paths = build_panels(
+        cfg=cfg,
+        mortality=mortality,
+        wdi_long=wdi_long,
+        ucdp=ucdp,
+        out_dir=out_dir,
+        incremental=not force,
+        engine=engine,
+    )
+    if paths.up_to_date:
+        print(f"[yellow]Skip[/yellow] build panel; inputs unchanged since last build in {out_dir}")
+        return
+    print(f"Rebuilt {len(paths.rebuilt)}/{len(cfg.countries)} countries: {', '.join(paths.rebuilt) or '-'}")
     print(f"[green]Wrote[/green] {paths.panel_base}")
     print(f"[green]Wrote[/green] {paths.groups}")
     print(f"[green]Wrote[/green] {paths.panel_event}")
@@ -205,6 +318,47 @@ def fit_models(config: Path = typer.Option(Path("config/project.yml"), exists=Tr
     print(f"[green]Wrote[/green] {out_qc} ({len(qc):,} rows)")
 
 
+@app.command()
+def srs_fit(
+    input_path: Path = typer.Argument(
+        Path("data/intermediate/srs_abridged_life_tables_2018_22.parquet"),
+        exists=True,
+        help="Extracted SRS table (parquet / CSV) or a release dataset dir (wha extract-srs).",
+    ),
+    config: Path = typer.Option(Path("config/project.yml"), exists=True),
+    adult_age_min: float = typer.Option(35.0, help="Minimum age (midpoint) for the adult GM fit."),
+    fit_age_min: float = typer.Option(15.0, help="Minimum age (midpoint) for the full GMH fit."),
+    min_points: int = typer.Option(12, help="Minimum age points to attempt the GMH fit."),
+    model: str = typer.Option("both", help="Models kept for the Urban-Rural deltas: gm, gmh or both."),
+    workers: int | None = typer.Option(None, help="Processes for group fits (default: all CPUs)."),
+    force: bool = False,
+) -> None:
+    cfg = load_config(config)
+    ensure_dirs(cfg)
+    out_params = cfg.paths.data_processed / "srs_params.parquet"
+    out_deltas = cfg.paths.data_processed / "srs_urban_rural_deltas.parquet"
+    if out_params.exists() and out_deltas.exists() and not force:
+        print(f"[yellow]Skip[/yellow] SRS fits; outputs exist in {cfg.paths.data_processed}")
+        return
+    if model not in ("gm", "gmh", "both"):
+        raise typer.BadParameter("--model must be gm, gmh or both")
+
+    params = fit_srs_groups(
+        load_srs_fit_input(input_path),
+        adult_age_min=adult_age_min,
+        fit_age_min=fit_age_min,
+        mu_h=cfg.hump.mu,
+        sigma_h=cfg.hump.sigma,
+        min_points=min_points,
+        max_workers=workers,
+    )
+    deltas = srs_urban_rural_deltas(params, models=["gm", "gmh"] if model == "both" else [model])
+    for df, out in [(params, out_params), (deltas, out_deltas)]:
+        df.to_parquet(out, index=False)
+        df.to_csv(cfg.paths.reports_tables / f"{out.stem}.csv", index=False)
+        print(f"[green]Wrote[/green] {out} ({len(df):,} rows)")
+
+
 @app.command()
 def make_figures(config: Path = typer.Option(Path("config/project.yml"), exists=True)) -> None:
     cfg = load_config(config)
@@ -298,7 +452,11 @@ def build_report(config: Path = typer.Option(Path("config/project.yml"), exists=
 
 
 @app.command()
-def event_summary(config: Path = typer.Option(Path("config/project.yml"), exists=True)) -> None:
+def event_summary(
+    config: Path = typer.Option(Path("config/project.yml"), exists=True),
+    counts: bool = typer.Option(False, help="Add pre/crisis/post year counts ({period}_n)."),
+    se: bool = typer.Option(False, help="Add standard errors of the period means ({period}_se)."),
+) -> None:
     cfg = load_config(config)
     ensure_dirs(cfg)
     params_path = cfg.paths.data_processed / "params.parquet"
@@ -307,7 +465,9 @@ def event_summary(config: Path = typer.Option(Path("config/project.yml"), exists
         raise FileNotFoundError("Missing params or groups. Run build-panel and fit-models first.")
     params = pd.read_parquet(params_path)
     groups = pd.read_parquet(groups_path)
-    summary = summarize_event_windows(params=params, groups=groups, param_cols=["b", "c", "h", "mrdt"])
+    summary = summarize_event_windows(
+        params=params, groups=groups, param_cols=["b", "c", "h", "mrdt"], with_counts=counts, with_se=se
+    )
     out = cfg.paths.reports_tables / "event_summary.csv"
     summary.to_csv(out, index=False)
     print(f"[green]Wrote[/green] {out}")
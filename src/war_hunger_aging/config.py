@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -44,6 +44,8 @@ class WDIIndicators:
 class WDIConfig:
     indicators: WDIIndicators
     interpolate: bool
+    interpolate_method: str = "linear"
+    interpolate_max_gap: int | None = None
 
 
 @dataclass(frozen=True)
@@ -55,6 +57,25 @@ class Paths:
     reports_tables: Path
 
 
+@dataclass(frozen=True)
+class HTTPCacheConfig:
+    dir: Path = Path("data/raw/http_cache")
+    ttl_hours: float | None = 168.0
+
+
+MORTALITY_SOURCES = ("wpp", "hmd")
+
+
+@dataclass(frozen=True)
+class MortalityConfig:
+    default_source: str = "wpp"
+    hmd_dir: Path = Path("data/raw/hmd")
+    sources: dict[str, str] = field(default_factory=dict)  # iso3 -> wpp | hmd
+
+    def source_for(self, iso3: str) -> str:
+        return self.sources.get(iso3, self.default_source)
+
+
 @dataclass(frozen=True)
 class ProjectConfig:
     start_year: int
@@ -67,6 +88,8 @@ class ProjectConfig:
     cases: tuple[CaseGroup, ...]
     wdi: WDIConfig
     paths: Paths
+    http_cache: HTTPCacheConfig = HTTPCacheConfig()
+    mortality: MortalityConfig = field(default_factory=MortalityConfig)
 
     @property
     def countries(self) -> tuple[str, ...]:
@@ -136,7 +159,16 @@ def load_config(path: str | Path = DEFAULT_CONFIG_PATH) -> ProjectConfig:
         pou=str(_require(indicators_raw, "pou", ctx="wdi.indicators")),
         fies=str(_require(indicators_raw, "fies", ctx="wdi.indicators")),
     )
-    wdi = WDIConfig(indicators=indicators, interpolate=bool(wdi_raw.get("interpolate", True)))
+    interpolate_method = str(wdi_raw.get("interpolate_method", "linear"))
+    if interpolate_method not in {"linear", "ffill"}:
+        raise ValueError("wdi.interpolate_method must be 'linear' or 'ffill'.")
+    max_gap_raw = wdi_raw.get("interpolate_max_gap")
+    wdi = WDIConfig(
+        indicators=indicators,
+        interpolate=bool(wdi_raw.get("interpolate", True)),
+        interpolate_method=interpolate_method,
+        interpolate_max_gap=int(max_gap_raw) if max_gap_raw is not None else None,
+    )
 
     paths = Paths(
         data_raw=Path(_require(paths_raw, "data_raw", ctx="paths")),
@@ -146,6 +178,29 @@ def load_config(path: str | Path = DEFAULT_CONFIG_PATH) -> ProjectConfig:
         reports_tables=Path(_require(paths_raw, "reports_tables", ctx="paths")),
     )
 
+    cache_raw = raw.get("http_cache") or {}
+    if not isinstance(cache_raw, dict):
+        raise TypeError("http_cache must be a mapping.")
+    ttl_raw = cache_raw.get("ttl_hours", HTTPCacheConfig.ttl_hours)
+    http_cache = HTTPCacheConfig(
+        dir=Path(cache_raw.get("dir", paths.data_raw / "http_cache")),
+        ttl_hours=float(ttl_raw) if ttl_raw is not None else None,
+    )
+
+    mortality_raw = raw.get("mortality") or {}
+    if not isinstance(mortality_raw, dict):
+        raise TypeError("mortality must be a mapping.")
+    default_source = str(mortality_raw.get("default_source", "wpp")).lower()
+    sources = {str(k).upper(): str(v).lower() for k, v in (mortality_raw.get("sources") or {}).items()}
+    for src in [default_source, *sources.values()]:
+        if src not in MORTALITY_SOURCES:
+            raise ValueError(f"mortality sources must be one of {MORTALITY_SOURCES}, got {src!r}.")
+    mortality = MortalityConfig(
+        default_source=default_source,
+        hmd_dir=Path(mortality_raw.get("hmd_dir", paths.data_raw / "hmd")),
+        sources=sources,
+    )
+
     return ProjectConfig(
         start_year=start_year,
         end_year=end_year,
@@ -157,6 +212,8 @@ def load_config(path: str | Path = DEFAULT_CONFIG_PATH) -> ProjectConfig:
         cases=tuple(cases),
         wdi=wdi,
         paths=paths,
+        http_cache=http_cache,
+        mortality=mortality,
     )
 
 
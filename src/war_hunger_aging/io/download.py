@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import json
+import re
+import shutil
+import time
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from urllib.parse import urlparse
+
+import requests
+
+from war_hunger_aging.io.http import RetryPolicy, make_session
+
+
+MANIFEST_NAME = "download_manifest.json"
+
+
+@dataclass(frozen=True)
+class DownloadResult:
+    archive: Path
+    sha256: str
+    size: int
+    extracted: tuple[Path, ...]
+    skipped: bool  # archive and members were already up to date; nothing fetched or written
+
+
+def sha256_file(path: Path, *, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _read_manifest(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _partial_paths(dest: Path) -> tuple[Path, Path]:
+    """`dest.part` and the validator record (`dest.part.json`) kept next to it."""
+    return dest.with_name(dest.name + ".part"), dest.with_name(dest.name + ".part.json")
+
+
+def discard_partial(dest: str | Path) -> None:
+    """Drop an interrupted download of `dest` so the next one starts from zero."""
+    for path in _partial_paths(Path(dest)):
+        path.unlink(missing_ok=True)
+
+
+def _content_range(resp: requests.Response) -> tuple[int | None, int | None]:
+    """(first byte, total length) from 'bytes 100-199/1000' or 'bytes */1000'."""
+    m = re.match(r"bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)", resp.headers.get("Content-Range", ""))
+    if not m:
+        return None, None
+    start, total = m.groups()
+    return (int(start) if start else None), (int(total) if total != "*" else None)
+
+
+def download_file(
+    url: str,
+    dest: str | Path,
+    *,
+    session: requests.Session | None = None,
+    chunk_size: int = 1 << 16,
+    retry: RetryPolicy = RetryPolicy(),
+    timeout: float = 300,
+) -> Path:
+    """
+    Stream `url` into `dest` via `dest.part`, chunk by chunk.
+
+    An interrupted transfer (connection drop, timeout, truncated body) is resumed
+    with an HTTP Range request from the bytes already in `.part`. The ETag /
+    Last-Modified of the first response is stored in `.part.json` and sent as
+    If-Range, so a resource that changed in between comes back whole instead of
+    being appended to the old head; a `.part` without a validator, a Content-Range
+    that does not start at the offset, or a 416 whose total length differs from
+    `.part` also restart from zero. Servers that ignore Range get a clean restart.
+    `dest` only appears once the body is complete.
+    """
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    part, meta = _partial_paths(dest)
+    own_session = session is None
+    session = session or make_session(pool_size=1)
+
+    try:
+        attempt = 0
+        while True:
+            offset = part.stat().st_size if part.exists() else 0
+            validator = _read_manifest(meta)
+            if_range = validator.get("etag") or validator.get("last_modified")
+            if offset and (validator.get("url") != url or not if_range):
+                discard_partial(dest)  # cannot prove `.part` is the same resource
+                offset = 0
+            headers = {"Range": f"bytes={offset}-", "If-Range": if_range} if offset else {}
+            try:
+                with session.get(url, headers=headers, stream=True, timeout=timeout) as resp:
+                    if offset and resp.status_code == 416:
+                        if _content_range(resp)[1] == offset:
+                            break  # the previous attempt already got every byte
+                        discard_partial(dest)
+                        continue
+                    resp.raise_for_status()
+                    if offset and resp.status_code == 206 and _content_range(resp)[0] != offset:
+                        discard_partial(dest)
+                        continue
+                    if offset and resp.status_code == 206:
+                        mode = "ab"
+                    else:
+                        mode = "wb"
+                        validator = {
+                            "url": url,
+                            "etag": resp.headers.get("ETag"),
+                            "last_modified": resp.headers.get("Last-Modified"),
+                        }
+                        meta.write_text(json.dumps(validator) + "\n")
+                    with part.open(mode) as f:
+                        for chunk in resp.iter_content(chunk_size=chunk_size):
+                            f.write(chunk)
+                break
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError):
+                if attempt == retry.attempts - 1:
+                    raise
+                time.sleep(retry.delay(attempt))
+                attempt += 1
+    finally:
+        if own_session:
+            session.close()
+
+    part.replace(dest)
+    meta.unlink(missing_ok=True)
+    return dest
+
+
+def _safe_member_path(root: Path, name: str) -> Path:
+    rel = PurePosixPath(name)
+    if rel.is_absolute() or ".." in rel.parts:
+        raise ValueError(f"Refusing to extract unsafe zip member {name!r}")
+    return root.joinpath(*rel.parts)
+
+
+def _extract_members(archive: Path, out_dir: Path, patterns: tuple[str, ...]) -> dict[str, int]:
+    """Extract members whose base name matches any of `patterns`; returns {member: size}."""
+    extracted: dict[str, int] = {}
+    with zipfile.ZipFile(archive) as zf:
+        for info in zf.infolist():
+            base = PurePosixPath(info.filename).name
+            if info.is_dir() or not any(fnmatch.fnmatch(base.lower(), p.lower()) for p in patterns):
+                continue
+            target = _safe_member_path(out_dir, info.filename)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_name(target.name + ".tmp")
+            with zf.open(info) as src, tmp.open("wb") as dst:
+                shutil.copyfileobj(src, dst, length=1 << 20)
+            tmp.replace(target)
+            extracted[info.filename] = info.file_size
+    return extracted
+
+
+def fetch_archive(
+    url: str,
+    out_dir: str | Path,
+    *,
+    filename: str | None = None,
+    members: tuple[str, ...] = ("*.csv",),
+    expected_sha256: str | None = None,
+    force: bool = False,
+    session: requests.Session | None = None,
+    chunk_size: int = 1 << 16,
+    retry: RetryPolicy = RetryPolicy(),
+) -> DownloadResult:
+    """
+    Download a zip into `out_dir` and extract the members matching `members`.
+
+    Size, SHA-256 and the extracted members are recorded per archive in
+    `out_dir/download_manifest.json`. An archive on disk that still matches that
+    record (and `expected_sha256`, if given) is not downloaded again; if every
+    recorded member is also present with its recorded size, nothing is extracted.
+    A downloaded file that does not match `expected_sha256` is deleted and raises
+    ValueError.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    archive = out_dir / (filename or PurePosixPath(urlparse(url).path).name or "download.zip")
+    manifest_path = out_dir / MANIFEST_NAME
+    manifest = _read_manifest(manifest_path)
+    entry = manifest.get(archive.name, {})
+
+    def _members_present(recorded: dict[str, int]) -> bool:
+        return bool(recorded) and all(
+            (p := _safe_member_path(out_dir, name)).exists() and p.stat().st_size == size
+            for name, size in recorded.items()
+        )
+
+    digest = sha256_file(archive) if archive.exists() and not force else None
+    unchanged = (
+        digest is not None
+        and entry.get("url") == url
+        and entry.get("sha256") == digest
+        and entry.get("size") == archive.stat().st_size
+        and (expected_sha256 is None or digest == expected_sha256.lower())
+    )
+    if unchanged and entry.get("patterns") == list(members) and _members_present(entry.get("members", {})):
+        return DownloadResult(
+            archive=archive,
+            sha256=digest,
+            size=entry["size"],
+            extracted=tuple(_safe_member_path(out_dir, m) for m in entry["members"]),
+            skipped=True,
+        )
+
+    if not unchanged:
+        if force:
+            discard_partial(archive)
+        download_file(url, archive, session=session, chunk_size=chunk_size, retry=retry)
+        digest = sha256_file(archive)
+        if expected_sha256 is not None and digest != expected_sha256.lower():
+            archive.unlink()
+            raise ValueError(f"SHA-256 mismatch for {url}: expected {expected_sha256}, got {digest}")
+
+    extracted = _extract_members(archive, out_dir, tuple(members))
+    manifest[archive.name] = {
+        "url": url,
+        "size": archive.stat().st_size,
+        "sha256": digest,
+        "patterns": list(members),
+        "members": extracted,
+    }
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    return DownloadResult(
+        archive=archive,
+        sha256=digest,
+        size=archive.stat().st_size,
+        extracted=tuple(_safe_member_path(out_dir, m) for m in extracted),
+        skipped=False,
+    )
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable
+
+import pandas as pd
+import pyarrow.dataset as ds
+
+
+HMD_TABLES = ("Mx_1x1", "Deaths_1x1", "Exposures_1x1")
+_VALUE_COLS = {"Mx_1x1": "mx", "Deaths_1x1": "deaths", "Exposures_1x1": "exposure"}
+_SEXES = {"Female": "Female", "Male": "Male", "Total": "Both"}
+_CACHE_MANIFEST = "_hmd_manifest.json"
+_CACHE_VERSION = 1
+
+# HMD population codes that are not plain ISO3; sub-national / civilian-only series
+# (FRACNP, DEUTE, GBRTENW, ...) are left out unless listed here.
+HMD_ISO3: dict[str, str] = {
+    "FRATNP": "FRA",
+    "DEUTNP": "DEU",
+    "GBR_NP": "GBR",
+    "NZL_NP": "NZL",
+}
+
+
+def hmd_code_to_iso3(code: str) -> str | None:
+    code = code.upper()
+    if code in HMD_ISO3:
+        return HMD_ISO3[code]
+    return code if len(code) == 3 and code.isalpha() else None
+
+
+def discover_hmd_files(root: str | Path) -> dict[str, dict[str, Path]]:
+    """
+    Find HMD 1x1 tables under `root`: {hmd_code: {table: path}}.
+
+    Both layouts are understood: the bulk zips (`Mx_1x1/USA.Mx_1x1.txt`) and the
+    per-country download (`USA/STATS/Mx_1x1.txt`).
+    """
+    root = Path(root)
+    found: dict[str, dict[str, Path]] = {}
+    for table in HMD_TABLES:
+        for path in root.rglob(f"*{table}.txt"):
+            if path.name == f"{table}.txt":
+                code = path.parent.parent.name if path.parent.name.upper() == "STATS" else path.parent.name
+            else:
+                code = path.name[: -len(f".{table}.txt")]
+            found.setdefault(code.upper(), {})[table] = path
+    return found
+
+
+def parse_hmd_table(path: str | Path) -> pd.DataFrame:
+    """
+    Parse one HMD 1x1 text table into long format: year, sex, age, value.
+
+    The two header lines are skipped, '.' is missing, '110+' becomes 110 and the
+    'Total' column is labelled 'Both' (the WPP convention).
+    """
+    df = pd.read_csv(path, sep=r"\s+", skiprows=2, na_values=".", dtype=str)
+    # Years such as '1959-' / '1959+' mark territorial changes in exposures.
+    df["Year"] = pd.to_numeric(df["Year"].str.rstrip("+-"), errors="coerce")
+    df["Age"] = pd.to_numeric(df["Age"].str.rstrip("+"), errors="coerce")
+    df = df.dropna(subset=["Year", "Age"])
+    sex_cols = [c for c in _SEXES if c in df.columns]
+    long = df.melt(id_vars=["Year", "Age"], value_vars=sex_cols, var_name="sex", value_name="value")
+    long["value"] = pd.to_numeric(long["value"], errors="coerce")
+    long = long.rename(columns={"Year": "year", "Age": "age"})
+    long["year"] = long["year"].astype(int)
+    long["age"] = long["age"].astype(float)
+    long["sex"] = long["sex"].map(_SEXES)
+    # Exposures split a year at territorial changes: keep one row per key.
+    return long.groupby(["year", "sex", "age"], as_index=False, sort=True)["value"].last()
+
+
+def _parse_country(code: str, files: dict[str, Path]) -> pd.DataFrame:
+    """Worker: merge the country's tables into iso3, year, sex, age, mx, deaths, exposure."""
+    out: pd.DataFrame | None = None
+    for table in HMD_TABLES:
+        path = files.get(table)
+        if path is None:
+            continue
+        part = parse_hmd_table(path).rename(columns={"value": _VALUE_COLS[table]})
+        out = part if out is None else out.merge(part, on=["year", "sex", "age"], how="outer")
+    if out is None:
+        raise FileNotFoundError(f"No HMD 1x1 tables for {code}")
+    for col in _VALUE_COLS.values():
+        if col not in out.columns:
+            out[col] = float("nan")
+    if out["mx"].isna().all() and {"deaths", "exposure"} <= set(out.columns):
+        out["mx"] = out["deaths"] / out["exposure"].where(out["exposure"] > 0)
+    out.insert(0, "iso3", hmd_code_to_iso3(code))
+    return out[["iso3", "year", "sex", "age", "mx", "deaths", "exposure"]]
+
+
+def _source_stamp(files: dict[str, Path]) -> dict[str, list[int]]:
+    return {t: [p.stat().st_size, p.stat().st_mtime_ns] for t, p in sorted(files.items())}
+
+
+def build_hmd_cache(
+    root: str | Path,
+    cache_dir: str | Path,
+    *,
+    countries: Iterable[str] | None = None,
+    max_workers: int | None = None,
+) -> list[str]:
+    """
+    Parse HMD tables into a hive-partitioned parquet cache (`iso3=XXX/part-0.parquet`).
+
+    Countries whose source files (size, mtime) match the cache manifest are skipped;
+    the rest are parsed concurrently, one country per task, on a process pool.
+    Returns the ISO3 codes that were (re)parsed.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = cache_dir / _CACHE_MANIFEST
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        manifest = {}
+    if manifest.get("version") != _CACHE_VERSION:
+        manifest = {"version": _CACHE_VERSION, "countries": {}}
+
+    wanted = {str(c).upper() for c in countries} if countries is not None else None
+    todo: dict[str, tuple[str, dict[str, Path]]] = {}
+    for code, files in sorted(discover_hmd_files(root).items()):
+        iso3 = hmd_code_to_iso3(code)
+        if iso3 is None or ("Mx_1x1" not in files and "Deaths_1x1" not in files):
+            continue
+        if wanted is not None and iso3 not in wanted:
+            continue
+        stamp = _source_stamp(files)
+        part = cache_dir / f"iso3={iso3}" / "part-0.parquet"
+        if manifest["countries"].get(iso3) == {"code": code, "files": stamp} and part.exists():
+            continue
+        todo[iso3] = (code, files)
+
+    if todo:
+        workers = max_workers or min(len(todo), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            frames = pool.map(_parse_country, [c for c, _ in todo.values()], [f for _, f in todo.values()])
+            for iso3, df in zip(todo, frames):
+                part_dir = cache_dir / f"iso3={iso3}"
+                shutil.rmtree(part_dir, ignore_errors=True)
+                part_dir.mkdir(parents=True)
+                df.drop(columns="iso3").to_parquet(part_dir / "part-0.parquet", index=False)
+                manifest["countries"][iso3] = {"code": todo[iso3][0], "files": _source_stamp(todo[iso3][1])}
+        manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    return sorted(todo)
+
+
+def load_hmd_mx(
+    root: str | Path,
+    *,
+    cache_dir: str | Path,
+    countries: Iterable[str] | None = None,
+    start_year: int | None = None,
+    end_year: int | None = None,
+    sexes: Iterable[str] | None = None,
+    age_min: float | None = None,
+    age_max: float | None = None,
+    max_workers: int | None = None,
+) -> pd.DataFrame:
+    """
+    Load HMD single-year mortality: iso3, year, sex, age, mx, deaths, exposure.
+
+    Refreshes the parquet cache for the requested countries first (see
+    `build_hmd_cache`), then reads it with partition pruning and pushed-down
+    year / sex / age filters.
+    """
+    countries = [str(c).upper() for c in countries] if countries is not None else None
+    build_hmd_cache(root, cache_dir, countries=countries, max_workers=max_workers)
+
+    columns = ["iso3", "year", "sex", "age", "mx", "deaths", "exposure"]
+    if not any(Path(cache_dir).glob("iso3=*/part-0.parquet")):
+        return pd.DataFrame(columns=columns)
+    dataset = ds.dataset(cache_dir, format="parquet", partitioning="hive")
+    parts = []
+    if countries is not None:
+        parts.append(ds.field("iso3").isin(countries))
+    if start_year is not None:
+        parts.append(ds.field("year") >= start_year)
+    if end_year is not None:
+        parts.append(ds.field("year") <= end_year)
+    if sexes is not None:
+        parts.append(ds.field("sex").isin([str(s) for s in sexes]))
+    if age_min is not None:
+        parts.append(ds.field("age") >= age_min)
+    if age_max is not None:
+        parts.append(ds.field("age") <= age_max)
+    expr = None
+    for p in parts:
+        expr = p if expr is None else expr & p
+    df = dataset.to_table(columns=columns, filter=expr).to_pandas()
+    df["iso3"] = df["iso3"].astype(str)
+    return df.sort_values(["iso3", "year", "sex", "age"]).reset_index(drop=True)
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from war_hunger_aging.config import ProjectConfig
+
+
+_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+class OfflineCacheMiss(LookupError):
+    """Raised in offline mode when a request has no cached response."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    attempts: int = 4
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+
+    def delay(self, attempt: int) -> float:
+        return min(self.max_backoff, self.backoff * (2**attempt))
+
+
+def make_session(*, pool_size: int = 8) -> requests.Session:
+    """A session whose connection pool is large enough for `pool_size` concurrent requests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+@dataclass(frozen=True)
+class HTTPCache:
+    """
+    On-disk cache of raw response bodies keyed by (URL, params).
+
+    Entries younger than `ttl_seconds` are served without a request (`None` = never
+    expire). Stale entries are revalidated with If-None-Match / If-Modified-Since when
+    the server sent an ETag / Last-Modified. With `offline=True` only the cache is
+    consulted (regardless of age) and misses raise OfflineCacheMiss.
+    """
+
+    root: Path
+    ttl_seconds: float | None = 7 * 24 * 3600
+    offline: bool = False
+
+    @staticmethod
+    def key(url: str, params: Mapping[str, object] | None) -> str:
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items())
+        return hashlib.sha256(json.dumps([url, items]).encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        base = self.root / key[:2] / key
+        return base.with_suffix(".body"), base.with_suffix(".meta.json")
+
+    def load(self, url: str, params: Mapping[str, object] | None) -> tuple[bytes | None, dict[str, Any]]:
+        body_path, meta_path = self._paths(self.key(url, params))
+        try:
+            meta = json.loads(meta_path.read_text())
+            return body_path.read_bytes(), meta
+        except (OSError, ValueError):
+            return None, {}
+
+    def is_fresh(self, meta: Mapping[str, Any]) -> bool:
+        if self.ttl_seconds is None:
+            return True
+        return time.time() - float(meta.get("fetched_at", 0.0)) <= self.ttl_seconds
+
+    @staticmethod
+    def revalidation_headers(meta: Mapping[str, Any]) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = str(meta["etag"])
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = str(meta["last_modified"])
+        return headers
+
+    def store(
+        self,
+        url: str,
+        params: Mapping[str, object] | None,
+        body: bytes,
+        headers: Mapping[str, str],
+    ) -> None:
+        body_path, meta_path = self._paths(self.key(url, params))
+        meta = {
+            "url": url,
+            "params": {str(k): str(v) for k, v in (params or {}).items()},
+            "fetched_at": time.time(),
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        }
+        _atomic_write(body_path, body)
+        _atomic_write(meta_path, json.dumps(meta, indent=2).encode("utf-8"))
+
+    def touch(self, url: str, params: Mapping[str, object] | None, meta: Mapping[str, Any]) -> None:
+        _, meta_path = self._paths(self.key(url, params))
+        _atomic_write(meta_path, json.dumps({**meta, "fetched_at": time.time()}, indent=2).encode("utf-8"))
+
+
+def http_cache_from_config(cfg: ProjectConfig, *, offline: bool = False, enabled: bool = True) -> HTTPCache | None:
+    if not enabled:
+        if offline:
+            raise ValueError("offline mode needs the HTTP cache; drop --no-cache.")
+        return None
+    ttl_hours = cfg.http_cache.ttl_hours
+    return HTTPCache(
+        root=cfg.http_cache.dir,
+        ttl_seconds=ttl_hours * 3600.0 if ttl_hours is not None else None,
+        offline=offline,
+    )
+
+
+def _get_with_retries(
+    session: requests.Session,
+    url: str,
+    *,
+    params: Mapping[str, object] | None,
+    headers: Mapping[str, str] | None,
+    retry: RetryPolicy,
+    timeout: float,
+) -> requests.Response:
+    for attempt in range(retry.attempts):
+        last = attempt == retry.attempts - 1
+        try:
+            resp = session.get(url, params=params, headers=headers, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout):
+            if last:
+                raise
+            time.sleep(retry.delay(attempt))
+            continue
+        if resp.status_code in _RETRY_STATUS and not last:
+            time.sleep(retry.delay(attempt))
+            continue
+        return resp
+    raise RuntimeError("unreachable")
+
+
+def get_json(
+    session: requests.Session,
+    url: str,
+    *,
+    params: Mapping[str, object] | None = None,
+    cache: HTTPCache | None = None,
+    retry: RetryPolicy = RetryPolicy(),
+    timeout: float = 60,
+) -> Any:
+    """GET `url` and decode JSON, going through `cache` when given."""
+    cached: bytes | None = None
+    meta: dict[str, Any] = {}
+    headers: dict[str, str] = {}
+    if cache is not None:
+        cached, meta = cache.load(url, params)
+        if cached is not None and (cache.offline or cache.is_fresh(meta)):
+            return json.loads(cached)
+        if cache.offline:
+            raise OfflineCacheMiss(f"No cached response for {url} params={dict(params or {})} under {cache.root}")
+        if cached is not None:
+            headers = cache.revalidation_headers(meta)
+
+    resp = _get_with_retries(session, url, params=params, headers=headers or None, retry=retry, timeout=timeout)
+    if resp.status_code == 304 and cache is not None and cached is not None:
+        cache.touch(url, params, meta)
+        return json.loads(cached)
+    resp.raise_for_status()
+    data = resp.json()
+    if cache is not None:
+        cache.store(url, params, resp.content, resp.headers)
+    return data
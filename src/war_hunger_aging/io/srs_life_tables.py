@@ -2,22 +2,60 @@ from __future__ import annotations
 
 import csv
 import math
+import mmap
+import os
 import re
 import zlib
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Iterable, Iterator
 
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+
+class _Unmapped(dict):
+    """str.translate table: codes missing from the CMap decode to ''."""
+
+    def __missing__(self, key: int) -> str:
+        return ""
+
 
 @dataclass(frozen=True)
 class CMap:
     key_len: int
     mapping: dict[bytes, str]
 
+    @cached_property
+    def table(self) -> _Unmapped | None:
+        """
+        `str.translate` table for 1- and 2-byte codes: hex strings are decoded as
+        latin-1 / UTF-16-BE code units (one char per code) and translated in C.
+        """
+        if self.key_len not in (1, 2):
+            return None
+        return _Unmapped(
+            {int.from_bytes(k, "big"): v for k, v in self.mapping.items() if len(k) == self.key_len}
+        )
+
 
 _FILTER_FLATE = re.compile(rb"/Filter\s*/FlateDecode")
 _STREAM_START = re.compile(rb"stream\r?\n")
-_STREAM_END = re.compile(rb"\r?\nendstream")
+_OBJ_NUM_BEFORE = re.compile(rb"(?<![0-9])(\d+)\s+(\d+)\s+$")
+# Stream dictionaries that can never hold text or a ToUnicode CMap: images, embedded
+# font programs, XMP metadata, xref streams, attachments.
+_NON_TEXT_STREAM = re.compile(
+    rb"/Subtype\s*/(?:Image|Type1C|CIDFontType0C|OpenType|XML)\b"
+    rb"|/Length[123]\b"
+    rb"|/Type\s*/(?:XObject\s*/Subtype\s*/Image|XRef|Metadata|EmbeddedFile)\b"
+)
+# CMap streams announce themselves in their first few hundred bytes.
+_CMAP_PROBE_BYTES = 4096
+_MAX_CMAP_BLOB = 100_000
 
 _HEX_TOKEN = re.compile(rb"<([0-9A-Fa-f\s]+)>")
 _TITLE_RX = re.compile(r"^(?P<area>.+),\s*(?P<period>\d{4}-\d{2})$")
@@ -25,8 +63,38 @@ _AGE_INTERVAL_RX = re.compile(r"^(?P<x>\d+)(?:-(?P<y>\d+)|\+)")
 
 _RESIDENCE_LABELS = ("Total", "Rural", "Urban")
 
+_LABEL = pa.dictionary(pa.int32(), pa.string())
+# Typed columns of the extracted tables: labels are dictionary-encoded (pandas
+# categoricals), ages are small ints (null for the open 85+ interval).
+SRS_LIFE_TABLE_SCHEMA = pa.schema(
+    [
+        ("area", _LABEL),
+        ("period", _LABEL),
+        ("residence", _LABEL),
+        ("sex", _LABEL),
+        ("age_interval", _LABEL),
+        ("age_start", pa.int16()),
+        ("age_end", pa.int16()),
+        ("n", pa.int16()),
+        ("nqx", pa.float64()),
+        ("lx", pa.int64()),
+        ("nLx", pa.int64()),
+        ("ex", pa.float64()),
+        ("mx", pa.float64()),
+        ("age_mid", pa.float64()),
+    ]
+)
+# Nullable pandas ints for the integer columns (`to_pandas(types_mapper=...)`), so the
+# missing age_end / n of the open interval do not turn them into floats.
+SRS_PANDAS_TYPES = {pa.int16(): pd.Int16Dtype(), pa.int64(): pd.Int64Dtype()}
+
 
 def _hex_to_bytes(h: bytes) -> bytes:
+    try:
+        # Fast path: even number of digits, whitespace only between byte pairs.
+        return bytes.fromhex(h.decode("ascii"))
+    except (ValueError, UnicodeDecodeError):
+        pass
     hs = re.sub(rb"\s+", b"", h)
     if len(hs) % 2 == 1:
         hs += b"0"
@@ -43,19 +111,37 @@ def _decode_utf16be_hex(h: bytes) -> str:
     return bts.decode("utf-16-be", errors="ignore")
 
 
-def _iter_flate_decoded_streams(pdf: bytes) -> Iterator[bytes]:
+def _stream_end(pdf: bytes | mmap.mmap, pos: int) -> int:
+    """Offset of the first `\r?\nendstream` at or after `pos` (-1 if none); a literal search, not a regex scan."""
+    while True:
+        e = pdf.find(b"endstream", pos)
+        if e == -1:
+            return -1
+        if e > pos and pdf[e - 1 : e] == b"\n":
+            return e - 2 if e - 1 > pos and pdf[e - 2 : e - 1] == b"\r" else e - 1
+        pos = e + 1
+
+
+def _iter_flate_streams(pdf: bytes | mmap.mmap) -> Iterator[tuple[int | None, bytes, int, int]]:
+    """Yield (object number, dictionary, start, end) for every FlateDecode stream; nothing is decompressed."""
     for m in _FILTER_FLATE.finditer(pdf):
         s = _STREAM_START.search(pdf, m.end())
         if not s:
             continue
-        e = _STREAM_END.search(pdf, s.end())
-        if not e:
-            continue
-        comp = pdf[s.end() : e.start()]
-        try:
-            yield zlib.decompress(comp)
-        except Exception:
+        end = _stream_end(pdf, s.end())
+        if end == -1:
             continue
+        obj = pdf.rfind(b"obj", 0, m.start())
+        num = _OBJ_NUM_BEFORE.search(pdf[max(obj - 24, 0) : max(obj, 0)]) if obj != -1 else None
+        yield (int(num.group(1)) if num else None), pdf[max(obj, 0) : s.start()], s.end(), end
+
+
+def _inflate(comp: bytes, max_length: int = 0) -> bytes | None:
+    """Decompress a Flate stream (only its first `max_length` bytes if > 0); None if corrupt."""
+    try:
+        return zlib.decompressobj().decompress(comp, max_length)
+    except zlib.error:
+        return None
 
 
 def _parse_cmap_blob(blob: bytes) -> CMap | None:
@@ -108,44 +194,232 @@ def _parse_cmap_blob(blob: bytes) -> CMap | None:
     return CMap(key_len=key_len, mapping=mapping)
 
 
-def _collect_cmaps(pdf: bytes, decoded_streams: Iterable[bytes]) -> list[CMap]:
-    blobs: list[bytes] = []
-
-    for m in re.finditer(rb"begincmap", pdf):
+def _cmap_blobs(data: bytes | mmap.mmap) -> Iterator[bytes]:
+    for m in re.finditer(rb"begincmap", data):
         start = m.start()
-        end = pdf.find(b"endcmap", start)
+        end = data.find(b"endcmap", start)
         if end != -1:
-            blob = pdf[start : end + len(b"endcmap")]
-            if len(blob) < 100_000:
-                blobs.append(blob)
+            blob = data[start : end + len(b"endcmap")]
+            if len(blob) < _MAX_CMAP_BLOB:
+                yield blob
 
-    for dec in decoded_streams:
-        if b"begincmap" not in dec:
+
+def _first_cmap_blob(dec: bytes) -> bytes | None:
+    start = dec.find(b"begincmap")
+    if start == -1:
+        return None
+    end = dec.find(b"endcmap", start)
+    if end == -1:
+        return None
+    blob = dec[start : end + len(b"endcmap")]
+    return blob if len(blob) < _MAX_CMAP_BLOB else None
+
+
+_OBJ_HEADER = re.compile(rb"(?<![0-9])(\d+)\s+(\d+)\s+obj\b")
+_REF = re.compile(rb"(\d+)\s+\d+\s+R\b")
+_NAMED_REF = re.compile(rb"/([^\s/<>\[\]()]+)\s+(\d+)\s+\d+\s+R\b")
+
+
+class _PdfObjects:
+    """
+    Minimal random access to indirect objects: offsets come from the classic xref
+    tables (newest section first, following /Prev) or, for xref streams and broken
+    tables, from a scan for `N G obj`. Objects packed in object streams are added
+    with `add_object_stream`.
+    """
+
+    def __init__(self, pdf: bytes | mmap.mmap) -> None:
+        self.pdf = pdf
+        self.offsets = self._read_xref() or self._scan()
+        self.packed: dict[int, bytes] = {}
+
+    def _read_xref(self) -> dict[int, int] | None:
+        pdf = self.pdf
+        pos = pdf.rfind(b"startxref")
+        m = re.match(rb"startxref\s+(\d+)", pdf[pos : pos + 40]) if pos != -1 else None
+        offsets: dict[int, int] = {}
+        seen: set[int] = set()
+        at = int(m.group(1)) if m else -1
+        try:
+            while 0 <= at < len(pdf) and at not in seen and pdf[at : at + 4] == b"xref":
+                seen.add(at)
+                trailer = pdf.find(b"trailer", at)
+                if trailer == -1:
+                    return None
+                lines = pdf[at + 4 : trailer].split()
+                k = 0
+                while k + 1 < len(lines):
+                    first, count = int(lines[k]), int(lines[k + 1])
+                    k += 2
+                    for j in range(count):
+                        off, _, kind = lines[k + 3 * j : k + 3 * j + 3]
+                        if kind == b"n":
+                            offsets.setdefault(first + j, int(off))
+                    k += 3 * count
+                prev = re.search(rb"/Prev\s+(\d+)", pdf[trailer : trailer + 4096])
+                at = int(prev.group(1)) if prev else -1
+        except ValueError:
+            return None
+        if not offsets:
+            return None
+        # Trust the table only if a sample of its offsets really point at objects.
+        for num, off in list(offsets.items())[:: max(1, len(offsets) // 16)]:
+            hit = _OBJ_HEADER.match(pdf, off)
+            if hit is None or int(hit.group(1)) != num:
+                return None
+        return offsets
+
+    def _scan(self) -> dict[int, int]:
+        # Find the literal keyword first and look back for "N G": a regex led by \d+
+        # would be tried at every byte of the (mostly binary) file.
+        offsets: dict[int, int] = {}
+        pdf = self.pdf
+        pos = pdf.find(b"obj")
+        while pos != -1:
+            window = max(pos - 24, 0)
+            hit = _OBJ_NUM_BEFORE.search(pdf[window:pos])
+            if hit is not None and not pdf[pos + 3 : pos + 4].isalnum():
+                offsets[int(hit.group(1))] = window + hit.start()
+            pos = pdf.find(b"obj", pos + 3)
+        return offsets
+
+    def add_object_stream(self, dec: bytes, header: bytes) -> None:
+        n = re.search(rb"/N\s+(\d+)", header)
+        first = re.search(rb"/First\s+(\d+)", header)
+        if not n or not first:
+            return
+        head = dec[: int(first.group(1))].split()
+        pairs = [(int(head[2 * k]), int(head[2 * k + 1])) for k in range(min(int(n.group(1)), len(head) // 2))]
+        base = int(first.group(1))
+        for k, (num, off) in enumerate(pairs):
+            end = base + pairs[k + 1][1] if k + 1 < len(pairs) else len(dec)
+            self.packed.setdefault(num, dec[base + off : end])
+
+    def get(self, num: int) -> bytes | None:
+        """Object body without the stream data (for streams: the dictionary)."""
+        if num in self.packed:
+            return self.packed[num]
+        off = self.offsets.get(num)
+        if off is None:
+            return None
+        end = self.pdf.find(b"endobj", off)
+        end = len(self.pdf) if end == -1 else end
+        stream = self.pdf.find(b"stream", off, end)
+        return self.pdf[off : stream if stream != -1 else end]
+
+    def stream(self, num: int) -> bytes | None:
+        """Decoded data of stream object `num` (Flate or unfiltered)."""
+        off = self.offsets.get(num)
+        if off is None or num in self.packed:
+            return None
+        end = self.pdf.find(b"endobj", off)
+        s = _STREAM_START.search(self.pdf, off, end if end != -1 else len(self.pdf))
+        if not s:
+            return None
+        end = _stream_end(self.pdf, s.end())
+        if end == -1:
+            return None
+        data = self.pdf[s.end() : end]
+        return _inflate(data) if _FILTER_FLATE.search(self.pdf, off, s.start()) else data
+
+    def resolve(self, value: bytes | None) -> bytes | None:
+        if value is not None:
+            m = _REF.fullmatch(value.strip())
+            if m:
+                return self.get(int(m.group(1)))
+        return value
+
+
+def _dict_value(body: bytes, key: bytes) -> bytes | None:
+    """Raw value of `key` in a PDF dictionary body: a nested <<dict>>, [array], reference or token."""
+    m = re.search(re.escape(key) + rb"(?![A-Za-z0-9])\s*", body)
+    if not m:
+        return None
+    i = m.end()
+    if body.startswith(b"<<", i) or body.startswith(b"[", i):
+        opener, closer = (b"<<", b">>") if body.startswith(b"<<", i) else (b"[", b"]")
+        depth, j = 0, i
+        while j < len(body):
+            if body.startswith(opener, j):
+                depth += 1
+                j += len(opener)
+            elif body.startswith(closer, j):
+                depth -= 1
+                j += len(closer)
+                if depth == 0:
+                    return body[i:j]
+            else:
+                j += 1
+        return None
+    ref = _REF.match(body, i)
+    if ref:
+        return ref.group(0)
+    tok = re.match(rb"/?[^\s/<>\[\]()]+", body[i:])
+    return tok.group(0) if tok else None
+
+
+def _page_font_map(objs: _PdfObjects) -> dict[int, dict[bytes, int | None]]:
+    """
+    Content stream object -> {font resource name: ToUnicode object}, walking the
+    page tree from /Root with inherited /Resources. Empty if the tree is unreadable.
+    """
+    pos = objs.pdf.rfind(b"/Root")
+    root = re.match(rb"/Root\s+(\d+)\s+\d+\s+R", objs.pdf[pos : pos + 40]) if pos != -1 else None
+    catalog = objs.get(int(root.group(1))) if root else None
+    pages = _dict_value(catalog, b"/Pages") if catalog else None
+    if pages is None:
+        return {}
+
+    out: dict[int, dict[bytes, int | None]] = {}
+    seen: set[int] = set()
+    stack: list[tuple[bytes, bytes | None]] = [(pages, None)]
+    while stack:
+        ref, inherited = stack.pop()
+        m = _REF.fullmatch(ref.strip())
+        if not m or int(m.group(1)) in seen:
             continue
-        start = dec.find(b"begincmap")
-        end = dec.find(b"endcmap", start)
-        if end != -1:
-            blob = dec[start : end + len(b"endcmap")]
-            if len(blob) < 100_000:
-                blobs.append(blob)
-
-    uniq: list[bytes] = []
-    seen: set[bytes] = set()
-    for b in blobs:
-        if b in seen:
+        seen.add(int(m.group(1)))
+        node = objs.get(int(m.group(1)))
+        if node is None:
+            continue
+        resources = objs.resolve(_dict_value(node, b"/Resources")) or inherited
+        kids = objs.resolve(_dict_value(node, b"/Kids"))
+        if kids is not None and re.search(rb"/Type\s*/Pages\b", node):
+            # Push in reverse so pages are visited in document order.
+            stack.extend((k.group(0), resources) for k in reversed(list(_REF.finditer(kids))))
             continue
-        seen.add(b)
-        uniq.append(b)
-
-    out: list[CMap] = []
-    for b in uniq:
-        cm = _parse_cmap_blob(b)
-        if cm is not None:
-            out.append(cm)
+
+        fonts: dict[bytes, int | None] = {}
+        font_dict = objs.resolve(_dict_value(resources, b"/Font")) if resources else None
+        for name, num in _NAMED_REF.findall(font_dict or b""):
+            font = objs.get(int(num)) or b""
+            to_unicode = _REF.match(_dict_value(font, b"/ToUnicode") or b"")
+            fonts[name] = int(to_unicode.group(1)) if to_unicode else None
+        contents = _dict_value(node, b"/Contents") or b""
+        if not contents.startswith(b"["):
+            target = objs.resolve(contents) if _REF.fullmatch(contents.strip()) else None
+            # /Contents may point at an array object rather than a stream.
+            if target is not None and target.lstrip().startswith(b"["):
+                contents = target
+        for c in _REF.finditer(contents):
+            out.setdefault(int(c.group(1)), fonts)
     return out
 
 
 def _decode_hex_text(bts: bytes, *, cmap: CMap) -> str:
+    if cmap.key_len <= 0 or len(bts) % cmap.key_len != 0:
+        return ""
+    table = cmap.table
+    if table is not None:
+        if cmap.key_len == 1:
+            return bts.decode("latin-1").translate(table)
+        units = bts.decode("utf-16-be", errors="surrogatepass")
+        if len(units) * 2 == len(bts):  # no surrogate pair was merged into one char
+            return units.translate(table)
+    return _decode_hex_text_scan(bts, cmap=cmap)
+
+
+def _decode_hex_text_scan(bts: bytes, *, cmap: CMap) -> str:
     if cmap.key_len <= 0 or len(bts) % cmap.key_len != 0:
         return ""
     parts = []
@@ -282,18 +556,23 @@ def _parse_array(data: bytes, i: int) -> tuple[list[tuple[str, bytes]], int]:
     return items, i
 
 
-def _extract_text_ops(content: bytes, *, cmap: CMap | None) -> list[str]:
+def _extract_text_ops_scan(
+    content: bytes,
+    *,
+    cmap: CMap | None,
+    fonts: dict[bytes, CMap | None] | None = None,
+) -> list[str]:
     """
-    Extracts a best-effort sequence of displayed strings from a PDF content stream.
-
-    This is not a full PDF text extractor; it is tuned for this repo's SRS life-table PDFs:
-    - literal strings: ( ... ) Tj / TJ
-    - hex strings: < ... > Tj / TJ with ToUnicode decoding
+    Byte-by-byte reference implementation of `_extract_text_ops` (kept for the
+    benchmark and equivalence tests).
     """
+    decode = _decode_hex_text_scan
     out: list[str] = []
     i = 0
     n = len(content)
     stack: list[tuple[str, object]] = []
+    fallback = cmap
+    name = b""
 
     while i < n:
         i = _skip_ws_and_comments(content, i)
@@ -316,6 +595,9 @@ def _extract_text_ops(content: bytes, *, cmap: CMap | None) -> list[str]:
             arr, i = _parse_array(content, i)
             stack.append(("arr", arr))
             continue
+        if b == 0x2F:  # /Name
+            name, i = _parse_simple_token(content, i + 1)
+            continue
 
         tok, i = _parse_simple_token(content, i)
         if not tok:
@@ -328,7 +610,7 @@ def _extract_text_ops(content: bytes, *, cmap: CMap | None) -> list[str]:
             if kind == "lit":
                 out.append(bytes(val).decode("latin-1", errors="ignore"))
             elif kind == "hex" and cmap is not None:
-                out.append(_decode_hex_text(bytes(val), cmap=cmap))
+                out.append(decode(bytes(val), cmap=cmap))
         elif op == "TJ" and stack and stack[-1][0] == "arr":
             arr = stack.pop()[1]
             parts: list[str] = []
@@ -336,9 +618,11 @@ def _extract_text_ops(content: bytes, *, cmap: CMap | None) -> list[str]:
                 if k == "lit":
                     parts.append(bytes(v).decode("latin-1", errors="ignore"))
                 elif k == "hex" and cmap is not None:
-                    parts.append(_decode_hex_text(bytes(v), cmap=cmap))
+                    parts.append(decode(bytes(v), cmap=cmap))
             if parts:
                 out.append("".join(parts))
+        elif op == "Tf" and fonts is not None:
+            cmap = fonts.get(name) or fallback
         else:
             # Prevent runaway memory on streams with many operands.
             if len(stack) > 250:
@@ -347,20 +631,176 @@ def _extract_text_ops(content: bytes, *, cmap: CMap | None) -> list[str]:
     return out
 
 
-def extract_srs_pdf_segments(pdf_path: str | Path) -> list[str]:
+# Content-stream tokens. Delimiters follow the scanner above: whitespace, []()<>/{}%.
+_D = rb"\x00\t\n\r\f \[\]()<>/{}%"
+_WS_COMMENTS = rb"(?:[\x00\t\n\r\f ]+|%[^\r\n]*)*"
+_LITERAL = rb"\((?:[^()\\]|\\.)*\)"  # without nesting; nested / unterminated -> slow path
+_NOT_TEXT_OP = rb"(?!T[jJf](?![^" + _D + rb"]))"
+_END_OP = rb"(?![^" + _D + rb"])"
+_CONTENT_TOKEN = re.compile(
+    _WS_COMMENTS
+    # Run of other operators / operands (numbers, Td, Tm, BT, ET, re, ...) before the next token.
+    + rb"(?P<other>(?:" + _NOT_TEXT_OP + rb"[^" + _D + rb"]+" + _END_OP + _WS_COMMENTS + rb")*)"
+    + rb"(?:(?P<tf>/(?P<font>[^" + _D + rb"]*)" + _END_OP + _WS_COMMENTS
+    + rb"(?P<size>[-+.0-9]+" + _END_OP + _WS_COMMENTS + rb")?Tf" + _END_OP + rb")"
+    + rb"|(?P<hexj><(?!<)(?P<hj>[^>]*)>" + _WS_COMMENTS + rb"Tj" + _END_OP + rb")"
+    + rb"|(?P<litj>(?P<lj>" + _LITERAL + rb")" + _WS_COMMENTS + rb"Tj" + _END_OP + rb")"
+    + rb"|(?P<hex><(?!<)[^>]*>?)"
+    + rb"|(?P<lit>" + _LITERAL + rb")"
+    + rb"|(?P<open>\()"
+    + rb"|(?P<arr>\[)"
+    + rb"|(?P<name>/[^" + _D + rb"]*)"
+    + rb"|(?P<op>T[jJf])" + _END_OP
+    + rb"|<<|.)?",
+    re.DOTALL,
+)
+_ARRAY_TOKEN = re.compile(
+    _WS_COMMENTS
+    + rb"(?:(?P<end>\])"
+    + rb"|(?P<hex><(?=[^<])[^>]*>?)"
+    + rb"|(?P<lit>" + _LITERAL + rb")"
+    + rb"|(?P<open>\()"
+    + rb"|[^" + _D + rb"]+|.)",
+    re.DOTALL,
+)
+_ESCAPE = re.compile(rb"\\(.)", re.DOTALL)
+
+
+def _literal(token: bytes) -> bytes:
+    inner = token[1:-1]
+    return _ESCAPE.sub(rb"\1", inner) if b"\\" in inner else inner
+
+
+def _scan_array(content: bytes, i: int) -> tuple[list[tuple[str, bytes]], int]:
+    """Strings of a TJ array starting after '['; numbers and other tokens are dropped."""
+    items: list[tuple[str, bytes]] = []
+    match = _ARRAY_TOKEN.match
+    while True:
+        m = match(content, i)
+        if m is None:
+            return items, len(content)
+        i = m.end()
+        kind = m.lastgroup
+        if kind == "end":
+            return items, i
+        if kind == "hex":
+            items.append(("hex", _hex_to_bytes(m.group("hex")[1:].rstrip(b">"))))
+        elif kind == "lit":
+            items.append(("lit", _literal(m.group("lit"))))
+        elif kind == "open":
+            s, i = _parse_literal_string(content, m.start("open"))
+            items.append(("lit", s))
+
+
+def _extract_text_ops(
+    content: bytes,
+    *,
+    cmap: CMap | None,
+    fonts: dict[bytes, CMap | None] | None = None,
+) -> list[str]:
     """
-    Extract a normalized sequence of text segments from the SRS Abridged Life Tables PDF.
+    Extracts a best-effort sequence of displayed strings from a PDF content stream.
+
+    This is not a full PDF text extractor; it is tuned for this repo's SRS life-table PDFs:
+    - literal strings: ( ... ) Tj / TJ
+    - hex strings: < ... > Tj / TJ with ToUnicode decoding
+
+    With `fonts` (resource name -> ToUnicode CMap), each `Tf` switches to the CMap of
+    the selected font; `cmap` is used before the first `Tf` and for fonts without one.
+
+    A compiled tokenizer jumps from string / array / text operator to the next and
+    consumes every run of other operators in one match; the output is identical to
+    `_extract_text_ops_scan`.
     """
-    pdf_path = Path(pdf_path)
-    pdf = pdf_path.read_bytes()
-    decoded_streams = list(_iter_flate_decoded_streams(pdf))
-    cmaps = _collect_cmaps(pdf, decoded_streams)
+    out: list[str] = []
+    stack: list[tuple[str, object]] = []
+    fallback = cmap
+    name = b""
+    i = 0
+    n = len(content)
+    match = _CONTENT_TOKEN.match
 
-    segments: list[str] = []
-    for dec in decoded_streams:
-        if b"Tj" not in dec and b"TJ" not in dec:
-            continue
+    while i < n:
+        m = match(content, i)
+        i = m.end()
+        if m.group("other") and len(stack) > 250:
+            # Prevent runaway memory on streams with many operands.
+            stack = stack[-80:]
+        kind = m.lastgroup
+
+        if kind == "hexj":  # <...> Tj: push + pop in one step
+            if cmap is not None:
+                out.append(_decode_hex_text(_hex_to_bytes(m.group("hj")), cmap=cmap))
+        elif kind == "litj":  # (...) Tj
+            out.append(_literal(m.group("lj")).decode("latin-1"))
+        elif kind == "tf":  # /Name [size] Tf
+            name = m.group("font")
+            if m.group("size") and len(stack) > 250:
+                stack = stack[-80:]
+            if fonts is not None:
+                cmap = fonts.get(name) or fallback
+            elif len(stack) > 250:
+                stack = stack[-80:]
+        elif kind == "hex":
+            stack.append(("hex", _hex_to_bytes(m.group("hex")[1:].rstrip(b">"))))
+        elif kind == "lit":
+            stack.append(("lit", _literal(m.group("lit"))))
+        elif kind == "open":
+            s, i = _parse_literal_string(content, m.start("open"))
+            stack.append(("lit", s))
+        elif kind == "arr":
+            arr, i = _scan_array(content, i)
+            stack.append(("arr", arr))
+        elif kind == "name":
+            name = m.group("name")[1:]
+        elif kind == "op":
+            op = m.group("op")
+            if op == b"Tj":
+                if stack:
+                    k, val = stack.pop()
+                    if k == "lit":
+                        out.append(val.decode("latin-1"))  # type: ignore[union-attr]
+                    elif k == "hex" and cmap is not None:
+                        out.append(_decode_hex_text(val, cmap=cmap))  # type: ignore[arg-type]
+            elif op == b"TJ" and stack and stack[-1][0] == "arr":
+                parts: list[str] = []
+                for k, v in stack.pop()[1]:  # type: ignore[misc]
+                    if k == "lit":
+                        parts.append(v.decode("latin-1"))
+                    elif k == "hex" and cmap is not None:
+                        parts.append(_decode_hex_text(v, cmap=cmap))
+                if parts:
+                    out.append("".join(parts))
+            elif op == b"Tf" and fonts is not None:
+                cmap = fonts.get(name) or fallback
+            elif len(stack) > 250:
+                stack = stack[-80:]
+
+    return out
 
+
+_TF_FONT = re.compile(rb"/([^\s/<>\[\]()]+)\s+[-+]?[\d.]+\s+Tf\b")
+
+
+def _stream_segments(
+    dec: bytes,
+    *,
+    cmaps: list[CMap],
+    fonts: dict[bytes, CMap | None] | None = None,
+) -> list[str]:
+    """
+    Normalized text segments of one decoded content stream.
+
+    `fonts` are the page's resolved ToUnicode CMaps; the best-scoring CMap from
+    `cmaps` is only computed when the stream uses a font that did not resolve
+    (or the stream is not reachable from the page tree).
+    """
+    if b"Tj" not in dec and b"TJ" not in dec:
+        return []
+
+    cmap: CMap | None = None
+    used = _TF_FONT.findall(dec)
+    if fonts is None or not used or any(fonts.get(f) is None for f in used):
         sample_hex: list[bytes] = []
         for m in re.finditer(rb"<([0-9A-Fa-f\s]{4,})>", dec):
             bts = _hex_to_bytes(m.group(1))
@@ -370,14 +810,143 @@ def extract_srs_pdf_segments(pdf_path: str | Path) -> list[str]:
                 break
         cmap = _best_cmap_for_stream(cmaps=cmaps, sample_hex=sample_hex)
 
-        for t in _extract_text_ops(dec, cmap=cmap):
-            s = re.sub(r"\s+", " ", t).strip()
-            if s:
-                segments.append(s)
-
+    segments: list[str] = []
+    for t in _extract_text_ops(dec, cmap=cmap, fonts=fonts):
+        s = re.sub(r"\s+", " ", t).strip()
+        if s:
+            segments.append(s)
     return segments
 
 
+def _span_segments(
+    pdf: bytes | mmap.mmap,
+    span: tuple[int | None, int, int],
+    cmaps: list[CMap],
+    stream_fonts: dict[int, dict[bytes, CMap | None]],
+) -> list[str]:
+    num, start, end = span
+    dec = _inflate(pdf[start:end])
+    if dec is None:
+        return []
+    return _stream_segments(dec, cmaps=cmaps, fonts=stream_fonts.get(num) if num is not None else None)
+
+
+# Per-process state of extraction workers: the worker's own mapping of the PDF and
+# the CMaps, sent once per worker through the pool initializer.
+_WORKER: dict[str, object] = {}
+
+
+def _init_segment_worker(
+    pdf_path: str,
+    cmaps: list[CMap],
+    stream_fonts: dict[int, dict[bytes, CMap | None]],
+) -> None:
+    with open(pdf_path, "rb") as f:
+        _WORKER["pdf"] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    _WORKER["cmaps"] = cmaps
+    _WORKER["stream_fonts"] = stream_fonts
+
+
+def _worker_span_segments(span: tuple[int | None, int, int]) -> list[str]:
+    return _span_segments(_WORKER["pdf"], span, _WORKER["cmaps"], _WORKER["stream_fonts"])  # type: ignore[arg-type]
+
+
+def _resolve_stream_fonts(
+    objs: _PdfObjects,
+    cmap_blobs: dict[int, bytes],
+    parsed: dict[bytes, CMap | None],
+) -> dict[int, dict[bytes, CMap | None]]:
+    """Content stream object -> {font name: CMap}; each ToUnicode object is parsed once."""
+    by_object: dict[int, CMap | None] = {}
+
+    def cmap_for(num: int | None) -> CMap | None:
+        if num is None:
+            return None
+        if num not in by_object:
+            blob = cmap_blobs.get(num)
+            if blob is None:
+                data = objs.stream(num) or b""
+                blob = _first_cmap_blob(data) or data
+            if blob not in parsed:
+                parsed[blob] = _parse_cmap_blob(blob)
+            by_object[num] = parsed[blob]
+        return by_object[num]
+
+    out: dict[int, dict[bytes, CMap | None]] = {}
+    resolved: dict[tuple, dict[bytes, CMap | None]] = {}  # shared per font set (pages reuse resources)
+    for content, fonts in _page_font_map(objs).items():
+        key = tuple(sorted(fonts.items(), key=lambda kv: kv[0]))
+        if key not in resolved:
+            resolved[key] = {name: cmap_for(num) for name, num in fonts.items()}
+        out[content] = resolved[key]
+    return out
+
+
+def extract_srs_pdf_segments(pdf_path: str | Path, *, max_workers: int | None = 1) -> list[str]:
+    """
+    Extract a normalized sequence of text segments from the SRS Abridged Life Tables PDF.
+
+    The file is memory-mapped and streams are inflated one at a time. Images, font
+    programs and other non-text streams are skipped from their dictionaries alone;
+    a first pass keeps only the (small) CMap blobs, a second pass decodes each
+    remaining stream, extracts its text and drops it.
+
+    Hex strings are decoded with the ToUnicode CMap of the font selected by each
+    `Tf`, resolved through the page tree (`/Resources /Font`); streams or fonts
+    that cannot be resolved fall back to the best-scoring CMap in the file.
+
+    With `max_workers` > 1 (None = one per CPU) the second pass runs on a process
+    pool: workers map the file themselves, receive the CMaps once and only
+    (start, end) offsets per stream. Segments come back in stream order, so the
+    output is identical to the serial pass.
+    """
+    pdf_path = Path(pdf_path)
+    with pdf_path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as pdf:
+        objs = _PdfObjects(pdf)
+        blobs = list(_cmap_blobs(pdf))
+        cmap_blobs: dict[int, bytes] = {}
+        spans: list[tuple[int | None, int, int]] = []
+        for num, header, start, end in _iter_flate_streams(pdf):
+            if _NON_TEXT_STREAM.search(header):
+                continue
+            if re.search(rb"/Type\s*/ObjStm\b", header):
+                objs.add_object_stream(_inflate(pdf[start:end]) or b"", header)
+                continue
+            head = _inflate(pdf[start:end], _CMAP_PROBE_BYTES)
+            if head is None:
+                continue
+            if b"begincmap" in head:
+                blob = _first_cmap_blob(_inflate(pdf[start:end]) or b"")
+                if blob is not None:
+                    blobs.append(blob)
+                    if num is not None:
+                        cmap_blobs[num] = blob
+                continue
+            spans.append((num, start, end))
+
+        parsed: dict[bytes, CMap | None] = {}
+        cmaps: list[CMap] = []
+        for blob in blobs:
+            if blob not in parsed:
+                parsed[blob] = _parse_cmap_blob(blob)
+                if parsed[blob] is not None:
+                    cmaps.append(parsed[blob])
+        stream_fonts = _resolve_stream_fonts(objs, cmap_blobs, parsed)
+
+        workers = min(max_workers or os.cpu_count() or 1, len(spans))
+        if workers <= 1:
+            per_stream = [_span_segments(pdf, span, cmaps, stream_fonts) for span in spans]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_segment_worker,
+                initargs=(str(pdf_path), cmaps, stream_fonts),
+            ) as pool:
+                chunksize = max(1, len(spans) // (workers * 4))
+                per_stream = list(pool.map(_worker_span_segments, spans, chunksize=chunksize))
+    return [seg for segs in per_stream for seg in segs]
+
+
 def _parse_float_token(token: str) -> float | None:
     t = token.strip()
     if not t or t == "...":
@@ -494,15 +1063,13 @@ def _parse_combined_row_token(token: str) -> tuple[str, int, int | None, int | N
     return age_interval, n_years, nqx, lx, nlx
 
 
-def parse_srs_abridged_life_tables_segments(segments: list[str]) -> list[dict[str, object]]:
+def iter_srs_abridged_life_tables_segments(segments: list[str]) -> Iterator[dict[str, object]]:
     """
-    Parse the SRS 'Abridged Life Tables, 2018-22' blocks into long-form rows.
+    Parse the SRS 'Abridged Life Tables, 2018-22' blocks into long-form rows, lazily.
 
     Output rows:
     - area, period, residence, sex, age_interval, age_start, age_end, n, nqx, lx, nLx, ex, mx, age_mid
     """
-    rows: list[dict[str, object]] = []
-
     i = 0
     while i + 1 < len(segments):
         m = _TITLE_RX.match(segments[i])
@@ -575,7 +1142,7 @@ def parse_srs_abridged_life_tables_segments(segments: list[str]) -> list[dict[st
                     ("Male", male_nqx, male_lx, male_nlx, male_ex),
                     ("Female", female_nqx, female_lx, female_nlx, female_ex),
                 ]:
-                    rows.append(
+                    yield (
                         {
                             "area": area,
                             "period": period,
@@ -596,14 +1163,83 @@ def parse_srs_abridged_life_tables_segments(segments: list[str]) -> list[dict[st
 
         # Continue scanning for more tables.
 
-    return rows
 
+def parse_srs_abridged_life_tables_segments(segments: list[str]) -> list[dict[str, object]]:
+    return list(iter_srs_abridged_life_tables_segments(segments))
+
+
+def iter_srs_record_batches(
+    rows: Iterable[dict[str, object]],
+    *,
+    schema: pa.Schema = SRS_LIFE_TABLE_SCHEMA,
+    batch_size: int = 4096,
+) -> Iterator[pa.RecordBatch]:
+    """Pack parsed rows into typed record batches of at most `batch_size` rows."""
+    buf: list[dict[str, object]] = []
+    for row in rows:
+        buf.append(row)
+        if len(buf) >= batch_size:
+            yield pa.RecordBatch.from_pylist(buf, schema=schema)
+            buf = []
+    if buf:
+        yield pa.RecordBatch.from_pylist(buf, schema=schema)
+
+
+def srs_rows_to_table(rows: Iterable[dict[str, object]], *, schema: pa.Schema = SRS_LIFE_TABLE_SCHEMA) -> pa.Table:
+    return pa.Table.from_batches(list(iter_srs_record_batches(rows, schema=schema)), schema=schema)
 
-def load_srs_abridged_life_tables_pdf(pdf_path: str | Path) -> list[dict[str, object]]:
-    segments = extract_srs_pdf_segments(pdf_path)
+
+def load_srs_abridged_life_tables_pdf(pdf_path: str | Path, *, max_workers: int | None = 1) -> list[dict[str, object]]:
+    segments = extract_srs_pdf_segments(pdf_path, max_workers=max_workers)
     return parse_srs_abridged_life_tables_segments(segments)
 
 
+def load_srs_abridged_life_tables_table(
+    pdf_path: str | Path,
+    *,
+    max_workers: int | None = 1,
+    schema: pa.Schema = SRS_LIFE_TABLE_SCHEMA,
+) -> pa.Table:
+    """Extract + parse one SRS PDF straight into a typed Arrow table (`SRS_LIFE_TABLE_SCHEMA` by default)."""
+    segments = extract_srs_pdf_segments(pdf_path, max_workers=max_workers)
+    return srs_rows_to_table(iter_srs_abridged_life_tables_segments(segments), schema=schema)
+
+
+def write_srs_parquet(rows: Iterable[dict[str, object]], out_path: str | Path, *, batch_size: int = 4096) -> int:
+    """
+    Stream parsed rows into a typed parquet file (`SRS_LIFE_TABLE_SCHEMA`), one
+    record batch at a time; the file is replaced atomically. Returns the row count.
+    """
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_path.with_name(f".{out_path.name}.{os.getpid()}.tmp")
+    n = 0
+    try:
+        with pq.ParquetWriter(tmp, SRS_LIFE_TABLE_SCHEMA) as writer:
+            for batch in iter_srs_record_batches(rows, batch_size=batch_size):
+                writer.write_batch(batch)
+                n += batch.num_rows
+        tmp.replace(out_path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return n
+
+
+def read_srs_life_tables(path: str | Path) -> pd.DataFrame:
+    """
+    Read extracted SRS rows (parquet, or a CSV from `write_rows_csv`) with the typed
+    schema applied: categorical labels, numeric ages and rates, no coercion needed.
+    """
+    path = Path(path)
+    if path.suffix == ".csv":
+        types = {f.name: (pa.string() if pa.types.is_dictionary(f.type) else f.type) for f in SRS_LIFE_TABLE_SCHEMA}
+        table = pacsv.read_csv(path, convert_options=pacsv.ConvertOptions(column_types=types))
+        table = table.select(SRS_LIFE_TABLE_SCHEMA.names).cast(SRS_LIFE_TABLE_SCHEMA)
+    else:
+        table = pq.read_table(path)
+    return table.to_pandas(types_mapper=SRS_PANDAS_TYPES.get)
+
+
 def write_rows_csv(rows: list[dict[str, object]], out_path: str | Path) -> None:
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from war_hunger_aging.io.srs_life_tables import (
+    SRS_LIFE_TABLE_SCHEMA,
+    SRS_PANDAS_TYPES,
+    load_srs_abridged_life_tables_table,
+)
+
+
+# Partition keys are plain strings (they live in the directory names); the other
+# columns keep the typed extraction schema.
+SRS_SCHEMA = pa.schema(
+    [pa.field("release", pa.string()), pa.field("area", pa.string())]
+    + [f for f in SRS_LIFE_TABLE_SCHEMA if f.name != "area"]
+)
+_PARTITIONS = ("release", "area")
+_MANIFEST = "_srs_manifest.json"
+_MANIFEST_VERSION = 1
+_RELEASE_RX = re.compile(r"((?:19|20)\d{2})\s*[-_–]\s*(?:(?:19|20)(\d{2})|(\d{2}))(?!\d)")
+
+
+def srs_release_from_name(name: str) -> str | None:
+    """'SRS-Abridged_Life_Tables_2018-2022.pdf' -> '2018-22' (the period label used in the tables)."""
+    m = _RELEASE_RX.search(name)
+    if not m:
+        return None
+    return f"{m.group(1)}-{m.group(2) or m.group(3)}"
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _extract_release(pdf: Path, release: str | None) -> tuple[str, pa.Table]:
+    """Worker: parse one PDF into a typed table tagged with its release."""
+    table = load_srs_abridged_life_tables_table(pdf, max_workers=1, schema=SRS_SCHEMA.remove(0))
+    if table.num_rows == 0:
+        raise ValueError(f"No SRS life tables found in {pdf}")
+    if release is None:
+        release = Counter(table["period"].to_pylist()).most_common(1)[0][0]
+    return release, table.add_column(0, SRS_SCHEMA.field("release"), pa.array([release] * table.num_rows))
+
+
+def build_srs_dataset(
+    pdf_dir: str | Path,
+    out_dir: str | Path,
+    *,
+    pattern: str = "*.pdf",
+    max_workers: int | None = None,
+    force: bool = False,
+) -> list[str]:
+    """
+    Extract every SRS life-table PDF in `pdf_dir` into a hive-partitioned parquet
+    dataset (`release=2018-22/area=Bihar/...`).
+
+    The release comes from the file name (or, failing that, the period printed in
+    the table titles). PDFs whose SHA-256 matches the manifest are skipped; the rest
+    are extracted concurrently, one PDF per task. Releases are resolved for every
+    PDF, skipped ones included, and two PDFs of the same release raise before
+    anything is written. Partitions of PDFs that were removed, renamed to another
+    release or re-labelled are dropped. Returns the releases (re)written.
+    """
+    pdf_dir, out_dir = Path(pdf_dir), Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / _MANIFEST
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        manifest = {}
+    if manifest.get("version") != _MANIFEST_VERSION:
+        manifest = {"version": _MANIFEST_VERSION, "pdfs": {}}
+    old = manifest["pdfs"]
+
+    releases: dict[str, str] = {}  # pdf name -> release, for every PDF present
+    todo: dict[Path, tuple[str | None, str]] = {}
+    for pdf in sorted(pdf_dir.glob(pattern)):
+        digest = _sha256(pdf)
+        entry = old.get(pdf.name)
+        if not force and entry and entry["sha256"] == digest and (out_dir / f"release={entry['release']}").is_dir():
+            releases[pdf.name] = entry["release"]
+            continue
+        todo[pdf] = (srs_release_from_name(pdf.name), digest)
+
+    tables: dict[Path, pa.Table] = {}
+    if todo:
+        workers = max_workers or min(len(todo), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_extract_release, list(todo), [r for r, _ in todo.values()])
+            for pdf, (release, table) in zip(todo, results):
+                releases[pdf.name] = release
+                tables[pdf] = table
+
+    by_release: dict[str, list[str]] = {}
+    for name, release in sorted(releases.items()):
+        by_release.setdefault(release, []).append(name)
+    clashes = {r: names for r, names in by_release.items() if len(names) > 1}
+    if clashes:
+        detail = "; ".join(f"{r}: {', '.join(names)}" for r, names in sorted(clashes.items()))
+        raise ValueError(f"Several PDFs map to the same SRS release ({detail}); remove or rename one")
+
+    # Releases no current PDF maps to any more (PDF deleted, renamed or re-labelled).
+    for release in {e["release"] for e in old.values()} - set(by_release):
+        shutil.rmtree(out_dir / f"release={release}", ignore_errors=True)
+    stale = set(old) - set(releases)
+
+    manifest["pdfs"] = {name: e for name, e in old.items() if name in releases}
+    for pdf, table in tables.items():
+        release = releases[pdf.name]
+        shutil.rmtree(out_dir / f"release={release}", ignore_errors=True)
+        ds.write_dataset(
+            table,
+            out_dir,
+            format="parquet",
+            partitioning=list(_PARTITIONS),
+            partitioning_flavor="hive",
+            basename_template="part-{i}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+        manifest["pdfs"][pdf.name] = {"sha256": todo[pdf][1], "release": release, "rows": table.num_rows}
+    if tables or stale:
+        manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    return sorted(releases[pdf.name] for pdf in tables)
+
+
+def load_srs_dataset(
+    root: str | Path,
+    *,
+    releases: Iterable[str] | None = None,
+    areas: Iterable[str] | None = None,
+) -> pd.DataFrame:
+    """Read the SRS dataset written by `build_srs_dataset`, pruning release / area partitions."""
+    columns = SRS_SCHEMA.names
+    if not any(Path(root).glob("release=*/area=*/*.parquet")):
+        return SRS_SCHEMA.empty_table().to_pandas(types_mapper=SRS_PANDAS_TYPES.get)
+    partitioning = ds.partitioning(pa.schema([SRS_SCHEMA.field(p) for p in _PARTITIONS]), flavor="hive")
+    dataset = ds.dataset(root, format="parquet", partitioning=partitioning, schema=SRS_SCHEMA)
+    expr = None
+    if releases is not None:
+        expr = ds.field("release").isin([str(r) for r in releases])
+    if areas is not None:
+        part = ds.field("area").isin([str(a) for a in areas])
+        expr = part if expr is None else expr & part
+    df = dataset.to_table(columns=columns, filter=expr).to_pandas(types_mapper=SRS_PANDAS_TYPES.get)
+    return df.sort_values(["release", "area", "residence", "sex", "age_start"], kind="stable").reset_index(drop=True)
@@ -2,11 +2,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 
-from war_hunger_aging.iso import iso3_from_name
+from war_hunger_aging.iso import iso3_from_names
+
+
+# How deaths of a multi-country location ("Syria, Turkey") are split across countries.
+ALLOCATIONS = ("equal", "full", "first")
 
 
 @dataclass(frozen=True)
@@ -75,17 +82,48 @@ def infer_ucdp_columns(
     return UCDPColumns(year=year_col, country=country_col, deaths=deaths_col)
 
 
+def _assign_iso3(df: pd.DataFrame, *, allocation: str) -> pd.DataFrame:
+    """
+    Add `iso3`. Locations that do not map as a whole and contain commas are split
+    into one row per listed country, with battle_deaths allocated per `allocation`:
+    'equal' divides by the number of listed countries, 'full' gives each country the
+    full count, 'first' keeps only the first listed country.
+    """
+    if allocation not in ALLOCATIONS:
+        raise ValueError(f"allocation must be one of {ALLOCATIONS}, got {allocation!r}")
+    df["iso3"] = iso3_from_names(df["country"])
+    multi = df["iso3"].isna() & df["country"].astype(str).str.contains(",", regex=False)
+    if not multi.any():
+        return df
+
+    parts = df.loc[multi].drop(columns="iso3")
+    parts["country"] = parts["country"].astype(str).str.split(",")
+    parts = parts.explode("country")
+    parts["country"] = parts["country"].str.strip()
+    if allocation == "equal":
+        n_listed = parts.groupby(level=0)["country"].transform("size")
+        parts["battle_deaths"] = parts["battle_deaths"] / n_listed
+    elif allocation == "first":
+        parts = parts[parts.groupby(level=0).cumcount() == 0]
+    parts["iso3"] = iso3_from_names(parts["country"])
+    return pd.concat([df.loc[~multi], parts]).sort_index(kind="stable")
+
+
 def standardize_ucdp_brd(
     df_raw: pd.DataFrame,
     *,
     cols: UCDPColumns,
     start_year: int,
     end_year: int,
+    allocation: str = "equal",
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Returns (standardized, unmapped):
     - standardized: iso3, year, battle_deaths
     - unmapped: rows that failed country->iso3 mapping
+
+    Each distinct location string is mapped once through the prebuilt name index;
+    multi-country locations are split per `allocation` (see ALLOCATIONS).
     """
     df = df_raw[[cols.year, cols.country, cols.deaths]].copy()
     df = df.rename(columns={cols.year: "year", cols.country: "country", cols.deaths: "battle_deaths"})
@@ -95,15 +133,7 @@ def standardize_ucdp_brd(
     df = df[(df["year"] >= start_year) & (df["year"] <= end_year)]
     df["battle_deaths"] = pd.to_numeric(df["battle_deaths"], errors="coerce").fillna(0.0)
 
-    def _map_country(x: object) -> Optional[str]:
-        if x is None:
-            return None
-        s = str(x).strip()
-        if not s:
-            return None
-        return iso3_from_name(s)
-
-    df["iso3"] = df["country"].map(_map_country)
+    df = _assign_iso3(df, allocation=allocation)
     unmapped = df[df["iso3"].isna()].copy()
     mapped = df.dropna(subset=["iso3"]).copy()
 
@@ -126,11 +156,151 @@ def load_and_standardize_ucdp_brd(
     year_col: str | None = None,
     country_col: str | None = None,
     deaths_col: str | None = None,
+    allocation: str = "equal",
 ) -> tuple[pd.DataFrame, pd.DataFrame, UCDPColumns]:
     df_raw = _read_any(path)
     if year_col and country_col and deaths_col:
         cols = UCDPColumns(year=year_col, country=country_col, deaths=deaths_col)
     else:
         cols = infer_ucdp_columns(df_raw)
-    std, unmapped = standardize_ucdp_brd(df_raw, cols=cols, start_year=start_year, end_year=end_year)
+    std, unmapped = standardize_ucdp_brd(
+        df_raw, cols=cols, start_year=start_year, end_year=end_year, allocation=allocation
+    )
     return std, unmapped, cols
+
+
+GED_MEASURES = ("best", "low", "high")
+_GED_CANDIDATES: dict[str, tuple[str, ...]] = {
+    "year": ("year",),
+    "country": ("country",),
+    "admin1": ("adm_1", "adm1"),
+    "best": ("best", "best_est"),
+    "low": ("low", "low_est"),
+    "high": ("high", "high_est"),
+}
+
+
+def _ged_columns(names: list[str], *, admin1: bool) -> dict[str, str]:
+    wanted = ["year", "country", *(["admin1"] if admin1 else []), *GED_MEASURES]
+    cols: dict[str, str] = {}
+    for key in wanted:
+        found = next((c for c in _GED_CANDIDATES[key] if c in names), None)
+        if found is None:
+            raise KeyError(f"GED file has no {key!r} column (tried {_GED_CANDIDATES[key]}). Available: {names}")
+        cols[key] = found
+    return cols
+
+
+def _ged_partials(path: Path, *, start_year: int, end_year: int, admin1: bool, block_size: int) -> list[pa.Table]:
+    read_options = pa_csv.ReadOptions(block_size=block_size)
+    probe = pa_csv.open_csv(path, read_options=read_options)
+    cols = _ged_columns(probe.schema.names, admin1=admin1)
+    probe.close()
+
+    text = {cols["country"]: pa.string(), **({cols["admin1"]: pa.string()} if admin1 else {})}
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=list(cols.values()),
+        column_types={**text, cols["year"]: pa.int64(), **{cols[m]: pa.float64() for m in GED_MEASURES}},
+    )
+    keys = ["country", "year", *(["admin1"] if admin1 else [])]
+    rename = {v: k for k, v in cols.items()}
+    year_ok = (pc.field("year") >= start_year) & (pc.field("year") <= end_year)
+
+    partials: list[pa.Table] = []
+    for batch in pa_csv.open_csv(path, read_options=read_options, convert_options=convert_options):
+        chunk = pa.Table.from_batches([batch])
+        chunk = chunk.rename_columns([rename[n] for n in chunk.column_names]).filter(year_ok)
+        if not chunk.num_rows:
+            continue
+        agg = chunk.group_by(keys).aggregate([(m, "sum") for m in GED_MEASURES])
+        partials.append(agg.rename_columns([c.removesuffix("_sum") for c in agg.column_names]))
+    return partials
+
+
+def aggregate_ged(
+    paths: Path | Iterable[Path],
+    *,
+    start_year: int,
+    end_year: int,
+    admin1: bool = False,
+    block_size: int = 16 << 20,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Stream UCDP GED event CSVs (CSV / CSV.gz) and sum deaths per country-year.
+
+    Each `block_size` block is reduced to (country, year[, admin1]) partial sums
+    right away, so the event table is never materialized. Country names are mapped
+    once per distinct name after the partials are combined.
+
+    Returns (aggregated, unmapped):
+    - aggregated: iso3, year, [admin1,] deaths_best, deaths_low, deaths_high
+    - unmapped: the same sums for country names that failed iso3 mapping
+    """
+    paths = [Path(paths)] if isinstance(paths, (str, Path)) else [Path(p) for p in paths]
+    keys = ["country", "year", *(["admin1"] if admin1 else [])]
+    partials = [
+        t
+        for p in paths
+        for t in _ged_partials(p, start_year=start_year, end_year=end_year, admin1=admin1, block_size=block_size)
+    ]
+    measure_cols = [f"deaths_{m}" for m in GED_MEASURES]
+    out_keys = ["iso3", "year", *(["admin1"] if admin1 else [])]
+    if not partials:
+        empty = pd.DataFrame(columns=[*out_keys, *measure_cols])
+        return empty, pd.DataFrame(columns=[*keys, *measure_cols])
+
+    combined = pa.concat_tables(partials).group_by(keys).aggregate([(m, "sum") for m in GED_MEASURES])
+    df = combined.to_pandas().rename(columns={f"{m}_sum": f"deaths_{m}" for m in GED_MEASURES})
+    df["iso3"] = iso3_from_names(df["country"])
+
+    unmapped = df[df["iso3"].isna()].drop(columns="iso3").sort_values(keys).reset_index(drop=True)
+    mapped = df.dropna(subset=["iso3"])
+    out = (
+        mapped.groupby(out_keys, as_index=False, dropna=False)[measure_cols]
+        .sum()
+        .sort_values(out_keys)
+        .reset_index(drop=True)
+    )
+    out["year"] = out["year"].astype(int)
+    return out, unmapped
+
+
+def discover_ged_files(raw_dir: Path) -> list[Path]:
+    files = sorted([*raw_dir.glob("*.csv"), *raw_dir.glob("*.csv.gz")]) if raw_dir.exists() else []
+    if not files:
+        raise FileNotFoundError(f"No UCDP GED CSV files in {raw_dir}. Put the GED download (CSV) there.")
+    return files
+
+
+def write_ged_aggregates(
+    paths: Path | Iterable[Path],
+    out_dir: Path,
+    *,
+    start_year: int,
+    end_year: int,
+) -> dict[str, Path]:
+    """Write ucdp_ged_country.parquet, ucdp_ged_admin1.parquet and ucdp_ged_unmapped.parquet."""
+    paths = [Path(paths)] if isinstance(paths, (str, Path)) else [Path(p) for p in paths]
+    out_dir.mkdir(parents=True, exist_ok=True)
+    admin1, unmapped = aggregate_ged(paths, start_year=start_year, end_year=end_year, admin1=True)
+    measure_cols = [f"deaths_{m}" for m in GED_MEASURES]
+    country = admin1.groupby(["iso3", "year"], as_index=False)[measure_cols].sum()
+    written = {
+        "country": out_dir / "ucdp_ged_country.parquet",
+        "admin1": out_dir / "ucdp_ged_admin1.parquet",
+        "unmapped": out_dir / "ucdp_ged_unmapped.parquet",
+    }
+    country.to_parquet(written["country"], index=False)
+    admin1.to_parquet(written["admin1"], index=False)
+    unmapped.to_parquet(written["unmapped"], index=False)
+    return written
+
+
+def ged_battle_deaths(ged_country: pd.DataFrame, *, measure: str = "best") -> pd.DataFrame:
+    """Country-year GED aggregate -> the iso3, year, battle_deaths frame `build_panels` takes."""
+    if measure not in GED_MEASURES:
+        raise ValueError(f"measure must be one of {GED_MEASURES}, got {measure!r}")
+    out = ged_country[["iso3", "year", f"deaths_{measure}"]].rename(columns={f"deaths_{measure}": "battle_deaths"})
+    if "admin1" in ged_country.columns:
+        out = out.groupby(["iso3", "year"], as_index=False)["battle_deaths"].sum()
+    return out.astype({"year": int, "battle_deaths": float}).reset_index(drop=True)
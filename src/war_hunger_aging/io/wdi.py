@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Iterable
 
 import pandas as pd
 import requests
 
+from war_hunger_aging.io.http import HTTPCache, RetryPolicy, get_json, make_session
+
 
 WDI_API_BASE = "https://api.worldbank.org/v2"
 
@@ -18,71 +21,137 @@ class WDIRecord:
     value: float | None
 
 
-def _fetch_json(url: str, *, params: dict[str, str | int]) -> list:
-    resp = requests.get(url, params=params, timeout=60)
-    resp.raise_for_status()
-    data = resp.json()
+def _fetch_json(
+    session: requests.Session,
+    url: str,
+    *,
+    params: dict[str, str | int],
+    retry: RetryPolicy = RetryPolicy(),
+    cache: HTTPCache | None = None,
+    timeout: float = 60,
+) -> list:
+    data = get_json(session, url, params=params, cache=cache, retry=retry, timeout=timeout)
     if not isinstance(data, list) or len(data) < 2:
-        raise ValueError(f"Unexpected WDI response shape for {resp.url}")
+        raise ValueError(f"Unexpected WDI response shape for {url}")
     return data
 
 
-def fetch_indicator(
-    indicator: str,
+def _records(indicator: str, observations: object) -> list[WDIRecord]:
+    rows: list[WDIRecord] = []
+    if not isinstance(observations, list):
+        return rows
+    for obs in observations:
+        if not isinstance(obs, dict):
+            continue
+        iso3 = obs.get("countryiso3code")
+        year = obs.get("date")
+        value = obs.get("value")
+        if not iso3 or not year:
+            continue
+        try:
+            year_i = int(year)
+        except ValueError:
+            continue
+        rows.append(
+            WDIRecord(
+                iso3=str(iso3).upper(),
+                year=year_i,
+                indicator=indicator,
+                value=float(value) if value is not None else None,
+            )
+        )
+    return rows
+
+
+def _records_frame(rows: list[WDIRecord]) -> pd.DataFrame:
+    df = pd.DataFrame([r.__dict__ for r in rows])
+    if df.empty:
+        return df
+    return df.sort_values(["iso3", "year"]).reset_index(drop=True)
+
+
+def _fetch_all(
+    indicators: list[str],
     *,
     countries: Iterable[str],
     start_year: int,
     end_year: int,
-    api_base: str = WDI_API_BASE,
-) -> pd.DataFrame:
+    api_base: str,
+    session: requests.Session | None,
+    max_workers: int,
+    retry: RetryPolicy,
+    cache: HTTPCache | None,
+) -> dict[str, pd.DataFrame]:
     """
-    Fetch a single WDI indicator for the given ISO3 country codes.
+    Fetch several indicators on one bounded thread pool.
 
-    Returns long-format: iso3, year, indicator, value.
+    Page 1 of every indicator is requested first; its metadata gives the page
+    count, its observations are kept, and only pages 2..N are requested next.
     """
     country_str = ";".join(countries)
-    url = f"{api_base}/country/{country_str}/indicator/{indicator}"
     params: dict[str, str | int] = {
         "format": "json",
         "per_page": 20000,
         "date": f"{start_year}:{end_year}",
     }
+    own_session = session is None
+    session = session or make_session(pool_size=max_workers)
+
+    def _page(indicator: str, page: int) -> list:
+        url = f"{api_base}/country/{country_str}/indicator/{indicator}"
+        return _fetch_json(session, url, params={**params, "page": page}, retry=retry, cache=cache)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            first: dict[str, Future] = {ind: pool.submit(_page, ind, 1) for ind in indicators}
+            pages: dict[str, list[Future]] = {}
+            firsts: dict[str, list] = {}
+            for ind, fut in first.items():
+                data = fut.result()
+                firsts[ind] = data
+                n_pages = int(data[0].get("pages", 1) or 1) if isinstance(data[0], dict) else 1
+                pages[ind] = [pool.submit(_page, ind, p) for p in range(2, n_pages + 1)]
+
+            out: dict[str, pd.DataFrame] = {}
+            for ind in indicators:
+                rows = _records(ind, firsts[ind][1])
+                for fut in pages[ind]:
+                    rows.extend(_records(ind, fut.result()[1]))
+                out[ind] = _records_frame(rows)
+            return out
+    finally:
+        if own_session:
+            session.close()
 
-    data = _fetch_json(url, params=params)
-    meta = data[0]
-    pages = int(meta.get("pages", 1))
 
-    rows: list[WDIRecord] = []
-    for page in range(1, pages + 1):
-        params_page = dict(params)
-        params_page["page"] = page
-        page_data = _fetch_json(url, params=params_page)
-        observations = page_data[1]
-        for obs in observations:
-            if not isinstance(obs, dict):
-                continue
-            iso3 = obs.get("countryiso3code")
-            year = obs.get("date")
-            value = obs.get("value")
-            if not iso3 or not year:
-                continue
-            try:
-                year_i = int(year)
-            except ValueError:
-                continue
-            rows.append(
-                WDIRecord(
-                    iso3=str(iso3).upper(),
-                    year=year_i,
-                    indicator=indicator,
-                    value=float(value) if value is not None else None,
-                )
-            )
+def fetch_indicator(
+    indicator: str,
+    *,
+    countries: Iterable[str],
+    start_year: int,
+    end_year: int,
+    api_base: str = WDI_API_BASE,
+    session: requests.Session | None = None,
+    max_workers: int = 4,
+    retry: RetryPolicy = RetryPolicy(),
+    cache: HTTPCache | None = None,
+) -> pd.DataFrame:
+    """
+    Fetch a single WDI indicator for the given ISO3 country codes.
 
-    df = pd.DataFrame([r.__dict__ for r in rows])
-    if df.empty:
-        return df
-    return df.sort_values(["iso3", "year"]).reset_index(drop=True)
+    Returns long-format: iso3, year, indicator, value.
+    """
+    return _fetch_all(
+        [indicator],
+        countries=countries,
+        start_year=start_year,
+        end_year=end_year,
+        api_base=api_base,
+        session=session,
+        max_workers=max_workers,
+        retry=retry,
+        cache=cache,
+    )[indicator]
 
 
 def fetch_indicators(
@@ -92,18 +161,32 @@ def fetch_indicators(
     start_year: int,
     end_year: int,
     api_base: str = WDI_API_BASE,
+    session: requests.Session | None = None,
+    max_workers: int = 4,
+    retry: RetryPolicy = RetryPolicy(),
+    cache: HTTPCache | None = None,
 ) -> pd.DataFrame:
-    frames: list[pd.DataFrame] = []
-    for ind in indicators:
-        frames.append(
-            fetch_indicator(
-                ind,
-                countries=countries,
-                start_year=start_year,
-                end_year=end_year,
-                api_base=api_base,
-            )
-        )
+    """
+    Fetch several WDI indicators concurrently (indicators and their pages share
+    one pool of `max_workers` threads and one pooled session).
+
+    Requests that fail with a connection error, a timeout, 429 or 5xx are retried
+    with exponential backoff per `retry`. With `cache`, raw responses are read from /
+    written to disk (see HTTPCache).
+    """
+    inds = list(dict.fromkeys(indicators))
+    fetched = _fetch_all(
+        inds,
+        countries=list(countries),
+        start_year=start_year,
+        end_year=end_year,
+        api_base=api_base,
+        session=session,
+        max_workers=max_workers,
+        retry=retry,
+        cache=cache,
+    )
+    frames = [fetched[ind] for ind in inds]
     if not frames:
         return pd.DataFrame(columns=["iso3", "year", "indicator", "value"])
     df = pd.concat(frames, ignore_index=True)
@@ -126,4 +209,3 @@ def wdi_long_to_wide(
         .rename_axis(None, axis=1)
     )
     return wide
-
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import json
+import re
+import zipfile
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+
+
+WDI_BULK_URL = "https://databank.worldbank.org/data/download/WDI_CSV.zip"
+
+# The data table is WDIData.csv in older archives and WDICSV.csv in newer ones.
+_DATA_MEMBER = re.compile(r"(^|/)WDI(Data|CSV)\.csv$", re.IGNORECASE)
+_COUNTRY_COL = "Country Code"
+_INDICATOR_COL = "Indicator Code"
+
+
+def _data_member(zf: zipfile.ZipFile) -> str:
+    for name in zf.namelist():
+        if _DATA_MEMBER.search(name):
+            return name
+    raise FileNotFoundError(f"No WDIData.csv / WDICSV.csv member in {zf.filename}")
+
+
+def _year_columns(header: list[str], start_year: int | None, end_year: int | None) -> list[str]:
+    years = [h for h in header if h.isdigit()]
+    if start_year is not None:
+        years = [y for y in years if int(y) >= start_year]
+    if end_year is not None:
+        years = [y for y in years if int(y) <= end_year]
+    return years
+
+
+def _melt(table: pa.Table, years: list[str]) -> pa.Table:
+    """Wide year columns -> long (iso3, year, indicator, value) without leaving Arrow/numpy."""
+    n = table.num_rows
+    rows = pa.array(np.tile(np.arange(n), len(years)))
+    return pa.table(
+        {
+            "iso3": pc.take(table[_COUNTRY_COL], rows),
+            "year": pa.array(np.repeat(np.array([int(y) for y in years], dtype=np.int64), n)),
+            "indicator": pc.take(table[_INDICATOR_COL], rows),
+            "value": pa.chunked_array(
+                [chunk for y in years for chunk in table[y].cast(pa.float64()).chunks], type=pa.float64()
+            ),
+        }
+    )
+
+
+def read_wdi_bulk(
+    archive: str | Path,
+    indicators: Iterable[str],
+    *,
+    countries: Iterable[str] | None = None,
+    start_year: int | None = None,
+    end_year: int | None = None,
+    block_size: int = 16 << 20,
+) -> pd.DataFrame:
+    """
+    Read indicators from the World Bank bulk WDI CSV archive (WDI_CSV.zip).
+
+    The data member is streamed straight out of the zip with a pyarrow CSV reader,
+    projected to the code columns plus the requested years and filtered block by
+    block; only matching rows are melted. Returns the same long format as
+    `wdi.fetch_indicators`: iso3, year, indicator, value (sorted by indicator,
+    iso3, year; missing values kept as NaN).
+    """
+    archive = Path(archive)
+    inds = sorted(dict.fromkeys(str(i) for i in indicators))
+    with zipfile.ZipFile(archive) as zf:
+        member = _data_member(zf)
+        with zf.open(member) as f:
+            header = next(csv.reader(io.TextIOWrapper(f, encoding="utf-8-sig", newline="")))
+        missing = {_COUNTRY_COL, _INDICATOR_COL} - set(header)
+        if missing:
+            raise KeyError(f"WDI bulk file missing columns {sorted(missing)} in {archive}:{member}")
+        years = _year_columns(header, start_year, end_year)
+
+        convert_options = pa_csv.ConvertOptions(
+            include_columns=[_COUNTRY_COL, _INDICATOR_COL, *years],
+            column_types={_COUNTRY_COL: pa.string(), _INDICATOR_COL: pa.string(), **{y: pa.float64() for y in years}},
+        )
+        expr = pc.field(_INDICATOR_COL).isin(inds)
+        if countries is not None:
+            expr = expr & pc.field(_COUNTRY_COL).isin(sorted({str(c).upper() for c in countries}))
+
+        tables: list[pa.Table] = []
+        with zf.open(member) as f:
+            reader = pa_csv.open_csv(
+                f, read_options=pa_csv.ReadOptions(block_size=block_size), convert_options=convert_options
+            )
+            for batch in reader:
+                chunk = pa.Table.from_batches([batch]).filter(expr)
+                if chunk.num_rows:
+                    tables.append(_melt(chunk, years))
+
+    if not tables:
+        return pd.DataFrame(columns=["iso3", "year", "indicator", "value"])
+    df = pa.concat_tables(tables).to_pandas()
+    return df.sort_values(["indicator", "iso3", "year"]).reset_index(drop=True)
+
+
+def _cache_key(archive: Path, **selection: object) -> str:
+    st = archive.stat()
+    payload = {"archive": str(archive.resolve()), "size": st.st_size, "mtime_ns": st.st_mtime_ns, **selection}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def load_wdi_bulk(
+    archive: str | Path,
+    indicators: Iterable[str],
+    *,
+    countries: Iterable[str] | None = None,
+    start_year: int | None = None,
+    end_year: int | None = None,
+    cache_dir: str | Path | None = None,
+) -> pd.DataFrame:
+    """
+    `read_wdi_bulk` with a parquet cache in `cache_dir`.
+
+    The cache entry is keyed by the archive (path, size, mtime) and the selection,
+    so a new archive or a different indicator/country/year set is re-read.
+    """
+    archive = Path(archive)
+    inds = sorted(dict.fromkeys(str(i) for i in indicators))
+    codes = sorted({str(c).upper() for c in countries}) if countries is not None else None
+    cached: Path | None = None
+    if cache_dir is not None:
+        key = _cache_key(archive, indicators=inds, countries=codes, start_year=start_year, end_year=end_year)
+        cached = Path(cache_dir) / f"wdi_bulk_{key}.parquet"
+        if cached.exists():
+            return pd.read_parquet(cached)
+
+    df = read_wdi_bulk(archive, inds, countries=codes, start_year=start_year, end_year=end_year)
+    if cached is not None:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cached.with_name(cached.name + ".tmp")
+        df.to_parquet(tmp, index=False)
+        tmp.replace(cached)
+    return df
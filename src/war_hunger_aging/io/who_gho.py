@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Iterable
+from functools import partial
+from pathlib import Path
+from typing import Any, Iterable, Iterator
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
 
+from war_hunger_aging.io.http import HTTPCache, RetryPolicy, get_json, make_session
+
 
 GHO_API_BASE = "https://ghoapi.azureedge.net/api"
 
@@ -19,21 +27,82 @@ class GHORecord:
     raw: dict[str, Any]
 
 
-def _get_json(url: str, *, params: dict[str, str] | None = None) -> dict[str, Any]:
-    resp = requests.get(url, params=params, timeout=60)
-    resp.raise_for_status()
-    data = resp.json()
+def _get_json(
+    session: requests.Session,
+    url: str,
+    *,
+    params: dict[str, str] | None = None,
+    cache: HTTPCache | None = None,
+    retry: RetryPolicy = RetryPolicy(),
+) -> dict[str, Any]:
+    data = get_json(session, url, params=params, cache=cache, retry=retry)
     if not isinstance(data, dict):
-        raise ValueError(f"Unexpected WHO GHO response shape for {resp.url}")
+        raise ValueError(f"Unexpected WHO GHO response shape for {url}")
     return data
 
 
+def _iter_pages(
+    session: requests.Session,
+    url: str,
+    *,
+    params: dict[str, str] | None,
+    cache: HTTPCache | None,
+    retry: RetryPolicy,
+) -> Iterator[list]:
+    """Yield the 'value' array of each page, following '@odata.nextLink'."""
+    next_url: str | None = url
+    next_params = params
+    while next_url is not None:
+        data = _get_json(session, next_url, params=next_params, cache=cache, retry=retry)
+        values = data.get("value")
+        if not isinstance(values, list):
+            raise ValueError(f"Missing 'value' array in WHO GHO response for {next_url}")
+        next_link = data.get("@odata.nextLink") or data.get("odata.nextLink")
+        del data
+        yield values
+
+        if isinstance(next_link, str) and next_link:
+            next_url = next_link
+            next_params = None  # nextLink already includes query params
+        else:
+            next_url = None
+
+
+def _record(indicator: str, obs: object) -> GHORecord | None:
+    if not isinstance(obs, dict):
+        return None
+    spatial = obs.get("SpatialDim") or obs.get("SpatialDimValueCode") or obs.get("COUNTRY")
+    time = obs.get("TimeDim") or obs.get("YEAR")
+    numeric = obs.get("NumericValue") or obs.get("Value")
+
+    try:
+        year = int(time) if time is not None else None
+    except Exception:
+        year = None
+
+    try:
+        val = float(numeric) if numeric is not None else None
+    except Exception:
+        val = None
+
+    return GHORecord(
+        indicator=indicator,
+        spatial=str(spatial).upper() if spatial else None,
+        time=year,
+        value=val,
+        raw=obs,
+    )
+
+
 def fetch_gho_indicator(
     indicator: str,
     *,
     api_base: str = GHO_API_BASE,
     select: Iterable[str] | None = None,
     where: str | None = None,
+    session: requests.Session | None = None,
+    cache: HTTPCache | None = None,
+    retry: RetryPolicy = RetryPolicy(),
 ) -> pd.DataFrame:
     """
     Fetch a WHO GHO indicator table via the public OData API.
@@ -44,6 +113,9 @@ def fetch_gho_indicator(
 
     Returns a long-format DataFrame with best-effort normalized columns:
       indicator, iso3, year, value, plus raw fields.
+
+    With `cache`, every page (including nextLink pages) is served from / stored in
+    the on-disk HTTP cache.
     """
     url = f"{api_base.rstrip('/')}/{indicator}"
 
@@ -53,52 +125,276 @@ def fetch_gho_indicator(
     if where:
         params["$filter"] = where
 
+    own_session = session is None
+    session = session or make_session(pool_size=1)
     rows: list[GHORecord] = []
-    next_url: str | None = url
-    next_params: dict[str, str] | None = params or None
-
-    while next_url is not None:
-        data = _get_json(next_url, params=next_params)
-        values = data.get("value")
-        if not isinstance(values, list):
-            raise ValueError(f"Missing 'value' array in WHO GHO response for {next_url}")
-
-        for obs in values:
-            if not isinstance(obs, dict):
-                continue
-            spatial = obs.get("SpatialDim") or obs.get("SpatialDimValueCode") or obs.get("COUNTRY")
-            time = obs.get("TimeDim") or obs.get("YEAR")
-            numeric = obs.get("NumericValue") or obs.get("Value")
-
-            try:
-                year = int(time) if time is not None else None
-            except Exception:
-                year = None
-
-            try:
-                val = float(numeric) if numeric is not None else None
-            except Exception:
-                val = None
-
-            rows.append(
-                GHORecord(
-                    indicator=indicator,
-                    spatial=str(spatial).upper() if spatial else None,
-                    time=year,
-                    value=val,
-                    raw=obs,
-                )
-            )
-
-        next_link = data.get("@odata.nextLink") or data.get("odata.nextLink")
-        if isinstance(next_link, str) and next_link:
-            next_url = next_link
-            next_params = None  # nextLink already includes query params
-        else:
-            next_url = None
+    try:
+        for values in _iter_pages(session, url, params=params or None, cache=cache, retry=retry):
+            rows.extend(r for r in map(partial(_record, indicator), values) if r is not None)
+    finally:
+        if own_session:
+            session.close()
 
     df = pd.DataFrame([{"indicator": r.indicator, "iso3": r.spatial, "year": r.time, "value": r.value, **r.raw} for r in rows])
     if df.empty:
         return df
     return df.sort_values(["indicator", "iso3", "year"], na_position="last").reset_index(drop=True)
 
+
+# Raw OData fields kept by the streaming writer, with their Arrow types. Anything else
+# the API returns (Comments, TimeDimensionBegin, ...) is dropped page by page.
+GHO_STREAM_FIELDS: dict[str, pa.DataType] = {
+    "Id": pa.int64(),
+    "IndicatorCode": pa.string(),
+    "SpatialDimType": pa.string(),
+    "SpatialDim": pa.string(),
+    "ParentLocationCode": pa.string(),
+    "TimeDimType": pa.string(),
+    "TimeDim": pa.int64(),
+    "Dim1Type": pa.string(),
+    "Dim1": pa.string(),
+    "Dim2Type": pa.string(),
+    "Dim2": pa.string(),
+    "Value": pa.string(),
+    "NumericValue": pa.float64(),
+    "Low": pa.float64(),
+    "High": pa.float64(),
+    "Date": pa.string(),
+}
+
+_NORMALIZED_FIELDS = (
+    pa.field("indicator", pa.string()),
+    pa.field("iso3", pa.string()),
+    pa.field("year", pa.int64()),
+    pa.field("value", pa.float64()),
+)
+
+
+def gho_stream_schema(columns: Iterable[str] = GHO_STREAM_FIELDS) -> pa.Schema:
+    """Normalized columns followed by the projected raw fields (unknown fields as strings)."""
+    raw = [pa.field(c, GHO_STREAM_FIELDS.get(c, pa.string())) for c in dict.fromkeys(columns)]
+    return pa.schema([*_NORMALIZED_FIELDS, *raw])
+
+
+def _coerce(value: object, typ: pa.DataType) -> object:
+    if value is None:
+        return None
+    try:
+        if pa.types.is_integer(typ):
+            return int(value)
+        if pa.types.is_floating(typ):
+            return float(value)
+    except (TypeError, ValueError):
+        return None
+    return str(value)
+
+
+def _page_batch(indicator: str, values: list, schema: pa.Schema) -> pa.RecordBatch:
+    cols: dict[str, list] = {name: [] for name in schema.names}
+    raw_fields = list(schema)[len(_NORMALIZED_FIELDS) :]
+    for obs in values:
+        rec = _record(indicator, obs)
+        if rec is None:
+            continue
+        cols["indicator"].append(rec.indicator)
+        cols["iso3"].append(rec.spatial)
+        cols["year"].append(rec.time)
+        cols["value"].append(rec.value)
+        for f in raw_fields:
+            cols[f.name].append(_coerce(rec.raw.get(f.name), f.type))
+    return pa.record_batch([pa.array(cols[f.name], type=f.type) for f in schema], schema=schema)
+
+
+def iter_gho_batches(
+    indicator: str,
+    *,
+    api_base: str = GHO_API_BASE,
+    columns: Iterable[str] = GHO_STREAM_FIELDS,
+    where: str | None = None,
+    session: requests.Session | None = None,
+    cache: HTTPCache | None = None,
+    retry: RetryPolicy = RetryPolicy(),
+) -> Iterator[pa.RecordBatch]:
+    """
+    Yield one typed record batch per API page (schema: `gho_stream_schema(columns)`).
+
+    Only the current page's JSON is alive at any time; rows keep the API's page order.
+    """
+    schema = gho_stream_schema(columns)
+    url = f"{api_base.rstrip('/')}/{indicator}"
+    params = {"$filter": where} if where else None
+    own_session = session is None
+    session = session or make_session(pool_size=1)
+    try:
+        for values in _iter_pages(session, url, params=params, cache=cache, retry=retry):
+            yield _page_batch(indicator, values, schema)
+    finally:
+        if own_session:
+            session.close()
+
+
+def write_gho_parquet(
+    indicators: Iterable[str],
+    out_path: str | Path,
+    *,
+    api_base: str = GHO_API_BASE,
+    columns: Iterable[str] = GHO_STREAM_FIELDS,
+    where: str | None = None,
+    max_workers: int = 4,
+    session: requests.Session | None = None,
+    cache: HTTPCache | None = None,
+    retry: RetryPolicy = RetryPolicy(),
+) -> int:
+    """
+    Stream several indicators into one parquet file; returns the row count.
+
+    Indicators are fetched concurrently, each into its own part file page by page;
+    the parts are then concatenated batch-wise in indicator order, so the output is
+    deterministic and memory stays bounded by a page per worker.
+    """
+    inds = list(dict.fromkeys(indicators))
+    columns = tuple(columns)
+    schema = gho_stream_schema(columns)
+    out_path = Path(out_path)
+    parts_dir = out_path.parent / f".{out_path.name}.parts"
+    parts_dir.mkdir(parents=True, exist_ok=True)
+    own_session = session is None
+    session = session or make_session(pool_size=max_workers)
+
+    def _write_part(i: int, indicator: str) -> Path:
+        part = parts_dir / f"{i:04d}.parquet"
+        with pq.ParquetWriter(part, schema) as writer:
+            for batch in iter_gho_batches(
+                indicator, api_base=api_base, columns=columns, where=where, session=session, cache=cache, retry=retry
+            ):
+                writer.write_batch(batch)
+        return part
+
+    tmp = out_path.with_name(out_path.name + ".tmp")
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            parts = list(pool.map(_write_part, range(len(inds)), inds))
+
+        rows = 0
+        with pq.ParquetWriter(tmp, schema) as writer:
+            for part in parts:
+                for batch in pq.ParquetFile(part).iter_batches():
+                    writer.write_batch(batch)
+                    rows += batch.num_rows
+        tmp.replace(out_path)
+        return rows
+    finally:
+        shutil.rmtree(parts_dir, ignore_errors=True)
+        tmp.unlink(missing_ok=True)
+        if own_session:
+            session.close()
+
+
+def country_filter(iso3s: Iterable[str]) -> str:
+    parts = [f"SpatialDim eq '{c}'" for c in iso3s]
+    if not parts:
+        return ""
+    if len(parts) == 1:
+        return parts[0]
+    return "(" + " or ".join(parts) + ")"
+
+
+def year_filter(start_year: int, end_year: int) -> str:
+    return f"(TimeDim ge {start_year} and TimeDim le {end_year})"
+
+
+@dataclass(frozen=True)
+class GHOShard:
+    countries: tuple[str, ...]  # empty = no country filter
+    start_year: int
+    end_year: int
+
+    @property
+    def where(self) -> str:
+        parts = [year_filter(self.start_year, self.end_year), country_filter(self.countries)]
+        return " and ".join(p for p in parts if p)
+
+
+def plan_shards(
+    countries: Iterable[str],
+    *,
+    start_year: int,
+    end_year: int,
+    countries_per_shard: int = 10,
+    years_per_shard: int = 10,
+) -> list[GHOShard]:
+    """Split a request into (country batch x year range) shards; inclusive, non-overlapping."""
+    if countries_per_shard < 1 or years_per_shard < 1:
+        raise ValueError("countries_per_shard and years_per_shard must be >= 1.")
+    codes = sorted(dict.fromkeys(str(c).upper() for c in countries))
+    batches = [tuple(codes[i : i + countries_per_shard]) for i in range(0, len(codes), countries_per_shard)] or [()]
+    years = [(y, min(y + years_per_shard - 1, end_year)) for y in range(start_year, end_year + 1, years_per_shard)]
+    return [GHOShard(countries=b, start_year=lo, end_year=hi) for b in batches for lo, hi in years]
+
+
+def fetch_gho_sharded(
+    indicators: Iterable[str],
+    *,
+    countries: Iterable[str],
+    start_year: int,
+    end_year: int,
+    api_base: str = GHO_API_BASE,
+    columns: Iterable[str] = GHO_STREAM_FIELDS,
+    countries_per_shard: int = 10,
+    years_per_shard: int = 10,
+    max_workers: int = 8,
+    session: requests.Session | None = None,
+    cache: HTTPCache | None = None,
+    retry: RetryPolicy = RetryPolicy(),
+) -> pd.DataFrame:
+    """
+    Fetch indicators as many small (indicator x shard) queries on one bounded pool.
+
+    Each shard is usually a single page, so wall time scales with shards / workers
+    rather than with the sequential nextLink chain of one large filter. Records seen
+    in more than one shard are dropped by 'Id' (or by the full row without one), and
+    the result is sorted by indicator, iso3, year, Id regardless of completion order.
+    Columns follow `gho_stream_schema(columns)`.
+    """
+    inds = list(dict.fromkeys(indicators))
+    columns = tuple(columns)
+    schema = gho_stream_schema(columns)
+    shards = plan_shards(
+        countries,
+        start_year=start_year,
+        end_year=end_year,
+        countries_per_shard=countries_per_shard,
+        years_per_shard=years_per_shard,
+    )
+    own_session = session is None
+    session = session or make_session(pool_size=max_workers)
+
+    def _fetch(task: tuple[str, GHOShard]) -> pa.Table:
+        indicator, shard = task
+        batches = list(
+            iter_gho_batches(
+                indicator,
+                api_base=api_base,
+                columns=columns,
+                where=shard.where,
+                session=session,
+                cache=cache,
+                retry=retry,
+            )
+        )
+        return pa.Table.from_batches(batches, schema=schema)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            tables = list(pool.map(_fetch, [(ind, shard) for ind in inds for shard in shards]))
+    finally:
+        if own_session:
+            session.close()
+
+    df = pa.concat_tables(tables).to_pandas() if tables else schema.empty_table().to_pandas()
+    if "Id" in df.columns and df["Id"].notna().all():
+        df = df.drop_duplicates(subset=["Id"])
+    else:
+        df = df.drop_duplicates()
+    order = ["indicator", "iso3", "year", *(["Id"] if "Id" in df.columns else [])]
+    return df.sort_values(order, na_position="last", kind="stable").reset_index(drop=True)
@@ -1,11 +1,153 @@
 from __future__ import annotations
 
+import gzip
+import os
 from pathlib import Path
+from typing import Iterable, Iterator
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 
+from war_hunger_aging.iso import name_index
 
-def load_wpp_mx(path: str | Path) -> pd.DataFrame:
+
+_WPP_COLUMNS = ("iso3", "year", "sex", "mx", "age", "age_start", "age_end")
+
+# Official UN WPP bulk life-table CSVs (WPP2024_Life_Table_{Complete,Abridged}_*.csv.gz).
+_BULK_TYPES = {
+    "ISO3_code": pa.string(),
+    "LocID": pa.int64(),
+    "Variant": pa.string(),
+    "Time": pa.int64(),
+    "Sex": pa.string(),
+    "AgeGrpStart": pa.float64(),
+    "AgeGrpSpan": pa.float64(),
+    "mx": pa.float64(),
+}
+_BULK_SEXES = {"Female": "Female", "Male": "Male", "Total": "Both"}
+WPP_SCHEMA = pa.schema(
+    [("iso3", pa.string()), ("year", pa.int32()), ("sex", pa.string()), ("age", pa.float64()), ("mx", pa.float64())]
+)
+
+
+def _is_csv(path: Path) -> bool:
+    name = path.name.lower()
+    return name.endswith(".csv") or name.endswith(".csv.gz")
+
+
+def _open_csv_source(path: Path):
+    """
+    Open a CSV / CSV.gz as a Python file object. Given a path, Arrow's streaming
+    CSV reader reads ahead far beyond the current block (close to the whole
+    file); a Python stream makes it pull one block at a time.
+    """
+    return gzip.open(path, "rb") if path.name.lower().endswith(".gz") else path.open("rb")
+
+
+def _scan_filter(
+    schema: pa.Schema,
+    *,
+    countries: Iterable[str] | None,
+    start_year: int | None,
+    end_year: int | None,
+    sexes: Iterable[str] | None,
+    age_min: float | None,
+    age_max: float | None,
+) -> pc.Expression | None:
+    """
+    Build a pyarrow filter for the columns whose stored type allows a pushdown.
+
+    Filters on columns with unexpected types (e.g. years stored as strings) are
+    skipped here and applied after standardization instead.
+    """
+    def _typed(name: str, check) -> bool:
+        idx = schema.get_field_index(name)
+        return idx >= 0 and check(schema.field(idx).type)
+
+    def _is_text(t: pa.DataType) -> bool:
+        return pa.types.is_string(t) or pa.types.is_large_string(t) or pa.types.is_dictionary(t)
+
+    def _is_number(t: pa.DataType) -> bool:
+        return pa.types.is_integer(t) or pa.types.is_floating(t)
+
+    parts: list[pc.Expression] = []
+    if countries is not None and _typed("iso3", _is_text):
+        codes = sorted({str(c).upper() for c in countries})
+        # Exports are upper-case, but lower-case codes are normalized later; keep both.
+        parts.append(pc.field("iso3").isin(codes + [c.lower() for c in codes]))
+    if _typed("year", _is_number):
+        if start_year is not None:
+            parts.append(pc.field("year") >= start_year)
+        if end_year is not None:
+            parts.append(pc.field("year") <= end_year)
+    if sexes is not None and _typed("sex", _is_text):
+        parts.append(pc.field("sex").isin([str(s) for s in sexes]))
+    if _typed("age", _is_number):
+        if age_min is not None:
+            parts.append(pc.field("age") >= age_min)
+        if age_max is not None:
+            parts.append(pc.field("age") <= age_max)
+
+    if not parts:
+        return None
+    expr = parts[0]
+    for p in parts[1:]:
+        expr = expr & p
+    return expr
+
+
+def _read_csv_filtered(path: Path, *, block_size: int, **filters) -> pa.Table:
+    read_options = pa_csv.ReadOptions(block_size=block_size)
+    # Pin text columns so type inference on the first block cannot flip them.
+    text_types = {"iso3": pa.string(), "sex": pa.string()}
+
+    # First open only to learn the header, then reopen projecting the needed columns.
+    with _open_csv_source(path) as f:
+        probe = pa_csv.open_csv(f, read_options=read_options)
+        names = [n for n in probe.schema.names if n in _WPP_COLUMNS]
+        probe.close()
+
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=names,
+        column_types={k: v for k, v in text_types.items() if k in names},
+    )
+    tables: list[pa.Table] = []
+    with _open_csv_source(path) as f:
+        reader = pa_csv.open_csv(f, read_options=read_options, convert_options=convert_options)
+        expr = _scan_filter(reader.schema, **filters)
+        for batch in reader:
+            chunk = pa.Table.from_batches([batch])
+            if expr is not None:
+                chunk = chunk.filter(expr)
+            if chunk.num_rows:
+                tables.append(chunk)
+    if not tables:
+        return reader.schema.empty_table()
+    return pa.concat_tables(tables, promote_options="permissive")
+
+
+def _read_parquet_filtered(path: Path, **filters) -> pa.Table:
+    dataset = ds.dataset(path, format="parquet")
+    names = [n for n in dataset.schema.names if n in _WPP_COLUMNS]
+    expr = _scan_filter(dataset.schema, **filters)
+    return dataset.to_table(columns=names, filter=expr)
+
+
+def load_wpp_mx(
+    path: str | Path,
+    *,
+    countries: Iterable[str] | None = None,
+    start_year: int | None = None,
+    end_year: int | None = None,
+    sexes: Iterable[str] | None = None,
+    age_min: float | None = None,
+    age_max: float | None = None,
+    block_size: int = 16 << 20,
+) -> pd.DataFrame:
     """
     Load WPP age-specific death rates exported to parquet.
 
@@ -18,20 +160,32 @@ def load_wpp_mx(path: str | Path) -> pd.DataFrame:
     Age can be either:
     - age (single-age int/float), OR
     - age_start, age_end (bin bounds) -> we compute age as midpoint.
+
+    Optional filters (countries, year range, sexes, age range) are pushed down
+    into the scan: parquet goes through a pyarrow dataset, CSV / CSV.gz through a
+    streaming pyarrow reader that drops non-matching rows block by block
+    (`block_size` bytes at a time), so only the study subset is materialized.
     """
     path = Path(path)
-    if path.suffix.lower() in {".csv"}:
-        df = pd.read_csv(path)
-    elif path.suffix.lower() in {".gz"} and path.name.lower().endswith(".csv.gz"):
-        df = pd.read_csv(path, compression="gzip")
+    filters = dict(
+        countries=list(countries) if countries is not None else None,
+        start_year=start_year,
+        end_year=end_year,
+        sexes=list(sexes) if sexes is not None else None,
+        age_min=age_min,
+        age_max=age_max,
+    )
+    if _is_csv(path):
+        table = _read_csv_filtered(path, block_size=block_size, **filters)
     else:
-        df = pd.read_parquet(path)
+        table = _read_parquet_filtered(path, **filters)
+    df = table.to_pandas()
     required = {"iso3", "year", "sex", "mx"}
     missing = required - set(df.columns)
     if missing:
         raise KeyError(f"WPP file missing columns {sorted(missing)} at {path}")
 
-    out = df.copy()
+    out = df
     out["iso3"] = out["iso3"].astype(str).str.upper()
     out["year"] = pd.to_numeric(out["year"], errors="coerce").astype("Int64")
     out = out.dropna(subset=["year"])
@@ -47,5 +201,167 @@ def load_wpp_mx(path: str | Path) -> pd.DataFrame:
         raise KeyError("WPP parquet must include either 'age' or ('age_start','age_end').")
 
     out = out.dropna(subset=["age", "mx"])
+    # Re-apply every filter on the standardized columns; this covers filters that
+    # could not be pushed down (e.g. derived midpoint ages, string-typed years).
+    keep = pd.Series(True, index=out.index)
+    if filters["countries"] is not None:
+        keep &= out["iso3"].isin({str(c).upper() for c in filters["countries"]})
+    if start_year is not None:
+        keep &= out["year"] >= start_year
+    if end_year is not None:
+        keep &= out["year"] <= end_year
+    if filters["sexes"] is not None:
+        keep &= out["sex"].isin([str(s) for s in filters["sexes"]])
+    if age_min is not None:
+        keep &= out["age"] >= age_min
+    if age_max is not None:
+        keep &= out["age"] <= age_max
+    out = out[keep]
     out = out.sort_values(["iso3", "year", "sex", "age"]).reset_index(drop=True)
     return out[["iso3", "year", "sex", "age", "mx"]]
+
+
+def _m49_to_iso3(loc_ids: pa.Array) -> pa.Array:
+    """UN M49 location codes -> ISO3 (null for regions and other aggregates)."""
+    keys = pc.unique(loc_ids.drop_null())
+    index = name_index()
+    values = pa.array([index.get(f"{k:03d}") for k in keys.to_pylist()], type=pa.string())
+    return values.take(pc.index_in(loc_ids, value_set=keys))
+
+
+def _bulk_batch(
+    chunk: pa.Table,
+    *,
+    countries: set[str] | None,
+    start_year: int | None,
+    end_year: int | None,
+    sexes: set[str] | None,
+    age_min: float | None,
+    age_max: float | None,
+    variant: str | None,
+) -> pa.Table:
+    """Filter one block of a WPP bulk CSV and project it onto `WPP_SCHEMA`."""
+    names = chunk.column_names
+    mask = pc.is_valid(chunk["mx"])
+    if start_year is not None:
+        mask = pc.and_kleene(mask, pc.greater_equal(chunk["Time"], start_year))
+    if end_year is not None:
+        mask = pc.and_kleene(mask, pc.less_equal(chunk["Time"], end_year))
+    if variant is not None and "Variant" in names:
+        mask = pc.and_kleene(mask, pc.equal(chunk["Variant"], variant))
+    if sexes is not None:
+        raw = [k for k, v in _BULK_SEXES.items() if v in sexes]
+        mask = pc.and_kleene(mask, pc.is_in(chunk["Sex"], value_set=pa.array(raw, type=pa.string())))
+    chunk = chunk.filter(pc.fill_null(mask, False))
+    if not chunk.num_rows:
+        return WPP_SCHEMA.empty_table()
+
+    # Age = start of single-year groups (and the open interval), midpoint of wider ones.
+    start = chunk["AgeGrpStart"]
+    if "AgeGrpSpan" in names:
+        span = chunk["AgeGrpSpan"]
+        age = pc.if_else(pc.greater(span, 1), pc.add(start, pc.divide(span, 2.0)), start)
+    else:
+        age = start
+    if "ISO3_code" in names:
+        iso3 = chunk["ISO3_code"].combine_chunks()
+        if "LocID" in names and iso3.null_count:
+            iso3 = pc.coalesce(iso3, _m49_to_iso3(chunk["LocID"].combine_chunks()))
+    else:
+        iso3 = _m49_to_iso3(chunk["LocID"].combine_chunks())
+    sex = pc.if_else(pc.equal(chunk["Sex"], "Total"), "Both", chunk["Sex"])
+
+    out = pa.table(
+        [iso3, pc.cast(chunk["Time"], pa.int32()), sex, age, chunk["mx"]],
+        schema=WPP_SCHEMA,
+    )
+    keep = pc.is_valid(out["iso3"])
+    if countries is not None:
+        keep = pc.and_kleene(keep, pc.is_in(out["iso3"], value_set=pa.array(sorted(countries), type=pa.string())))
+    if age_min is not None:
+        keep = pc.and_kleene(keep, pc.greater_equal(out["age"], age_min))
+    if age_max is not None:
+        keep = pc.and_kleene(keep, pc.less_equal(out["age"], age_max))
+    return out.filter(pc.fill_null(keep, False))
+
+
+def iter_wpp_bulk(
+    path: str | Path,
+    *,
+    countries: Iterable[str] | None = None,
+    start_year: int | None = None,
+    end_year: int | None = None,
+    sexes: Iterable[str] | None = None,
+    age_min: float | None = None,
+    age_max: float | None = None,
+    variant: str | None = None,
+    block_size: int = 16 << 20,
+) -> Iterator[pa.Table]:
+    """
+    Stream an official WPP bulk life-table CSV (plain or .gz) as canonical tables
+    (iso3, year, sex, age, mx), one per `block_size` block of input.
+
+    Only the location / time / sex / age / mx columns are parsed; rows are filtered
+    block by block, aggregates (no ISO3) are dropped, LocID (UN M49) is mapped to
+    ISO3 where ISO3_code is empty and 'Total' is labelled 'Both'.
+    """
+    path = Path(path)
+    read_options = pa_csv.ReadOptions(block_size=block_size)
+    with _open_csv_source(path) as f:
+        probe = pa_csv.open_csv(f, read_options=read_options)
+        header = probe.schema.names
+        probe.close()
+    missing = {"Time", "Sex", "AgeGrpStart", "mx"} - set(header)
+    if missing or not {"ISO3_code", "LocID"} & set(header):
+        raise KeyError(f"Not a WPP bulk life table (missing {sorted(missing) or 'ISO3_code/LocID'}): {path}")
+
+    names = [n for n in header if n in _BULK_TYPES]
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=names,
+        column_types={n: _BULK_TYPES[n] for n in names},
+        strings_can_be_null=True,
+    )
+    filters = dict(
+        countries={str(c).upper() for c in countries} if countries is not None else None,
+        start_year=start_year,
+        end_year=end_year,
+        sexes={str(s) for s in sexes} if sexes is not None else None,
+        age_min=age_min,
+        age_max=age_max,
+        variant=variant,
+    )
+    with _open_csv_source(path) as f:
+        reader = pa_csv.open_csv(f, read_options=read_options, convert_options=convert_options)
+        for batch in reader:
+            table = _bulk_batch(pa.Table.from_batches([batch]), **filters)
+            if table.num_rows:
+                yield table
+
+
+def write_wpp_bulk_parquet(
+    paths: Iterable[str | Path],
+    out_path: str | Path,
+    **filters,
+) -> int:
+    """
+    Convert WPP bulk CSVs (e.g. the Female / Male / Both files of one release) into
+    the canonical `wpp_mx.parquet` read by `load_wpp_mx`; returns the row count.
+
+    Blocks are appended to a parquet writer as they are filtered, so peak memory is
+    bounded by `block_size`, not by the size of the release. See `iter_wpp_bulk`
+    for the accepted filters.
+    """
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_path.with_name(f".{out_path.name}.{os.getpid()}.tmp")
+    rows = 0
+    try:
+        with pq.ParquetWriter(tmp, WPP_SCHEMA) as writer:
+            for path in paths:
+                for table in iter_wpp_bulk(path, **filters):
+                    writer.write_table(table)
+                    rows += table.num_rows
+        tmp.replace(out_path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return rows
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-import re
+import json
 from functools import lru_cache
-from typing import Optional
+from importlib import metadata, resources
+from typing import Any, Optional
 
-import pycountry
+import numpy as np
+import pandas as pd
+
+
+# Bump when the layout of data/iso3_table.json changes.
+ISO_TABLE_VERSION = 1
+_ISO_TABLE_FILE = "iso3_table.json"
 
 
 _NAME_OVERRIDES: dict[str, str] = {
@@ -26,18 +33,103 @@ _NAME_OVERRIDES: dict[str, str] = {
     "BOSNIA AND HERZEGOVINA": "BIH",
 }
 
+# Common / historical spellings used by conflict datasets (UCDP uses Gleditsch-Ward
+# names such as "Russia (Soviet Union)"); historical states map to their successor.
+_COMMON_NAMES: dict[str, str] = {
+    "RUSSIA": "RUS",
+    "RUSSIA (SOVIET UNION)": "RUS",
+    "SOVIET UNION": "RUS",
+    "TURKEY": "TUR",
+    "SERBIA (YUGOSLAVIA)": "SRB",
+    "YUGOSLAVIA": "SRB",
+    "YEMEN (NORTH YEMEN)": "YEM",
+    "SOUTH YEMEN": "YEM",
+    "CAMBODIA (KAMPUCHEA)": "KHM",
+    "DR CONGO (ZAIRE)": "COD",
+    "DR CONGO": "COD",
+    "ZAIRE": "COD",
+    "MYANMAR (BURMA)": "MMR",
+    "BURMA": "MMR",
+    "ZIMBABWE (RHODESIA)": "ZWE",
+    "RHODESIA": "ZWE",
+    "MADAGASCAR (MALAGASY)": "MDG",
+    "VIETNAM (NORTH VIETNAM)": "VNM",
+    "SOUTH VIETNAM": "VNM",
+    "CZECHOSLOVAKIA": "CZE",
+    "IVORY COAST": "CIV",
+    "BOSNIA-HERZEGOVINA": "BIH",
+    "MACEDONIA": "MKD",
+    "MACEDONIA, FYR": "MKD",
+    "SWAZILAND": "SWZ",
+    "EAST TIMOR": "TLS",
+    "CAPE VERDE": "CPV",
+    "KOSOVO": "XKX",
+    "PALESTINE": "PSE",
+    "GAMBIA, THE": "GMB",
+    "EGYPT, ARAB REP.": "EGY",
+}
+
 
 def normalize_country_name(name: str) -> str:
-    name = name.strip()
-    name = re.sub(r"\s+", " ", name)
-    return name.upper()
+    # Same as strip + collapsing runs of whitespace, without the regex engine.
+    return " ".join(name.split()).upper()
+
+
+def build_iso_table() -> dict[str, Any]:
+    """
+    Build the compact lookup table shipped as `war_hunger_aging/data/iso3_table.json`
+    (regenerate with `python scripts/01_build_iso_table.py` after upgrading pycountry).
+
+    `names` covers what `pycountry.countries.lookup` matches (codes, name, official
+    and common names), keyed by `normalize_country_name`; `alpha_2` maps to ISO3.
+    """
+    import pycountry
+
+    names: dict[str, str] = {}
+    alpha_2: dict[str, str] = {}
+    for country in pycountry.countries:
+        alpha_3 = country.alpha_3
+        alpha_2[country.alpha_2] = alpha_3
+        for attr in ("alpha_2", "alpha_3", "numeric", "name", "official_name", "common_name"):
+            value = getattr(country, attr, None)
+            if value:
+                names.setdefault(normalize_country_name(str(value)), alpha_3)
+    return {
+        "version": ISO_TABLE_VERSION,
+        "source": f"pycountry {metadata.version('pycountry')}",
+        "alpha_2": dict(sorted(alpha_2.items())),
+        "names": dict(sorted(names.items())),
+    }
+
+
+@lru_cache(maxsize=1)
+def _iso_table() -> dict[str, Any]:
+    try:
+        table = json.loads(resources.files("war_hunger_aging").joinpath("data", _ISO_TABLE_FILE).read_text("utf-8"))
+    except (OSError, ValueError):
+        table = None
+    if not isinstance(table, dict) or table.get("version") != ISO_TABLE_VERSION:
+        # Missing or stale table (e.g. a source checkout): derive it from pycountry.
+        table = build_iso_table()
+    return table
+
+
+@lru_cache(maxsize=1)
+def name_index() -> dict[str, str]:
+    """
+    Normalized name -> ISO3, loaded once from the static table, then `_COMMON_NAMES`,
+    then `_NAME_OVERRIDES` (highest priority).
+    """
+    index = dict(_iso_table()["names"])
+    index.update(_COMMON_NAMES)
+    index.update(_NAME_OVERRIDES)
+    return index
 
 
 @lru_cache(maxsize=2048)
-def iso3_from_name(name: str) -> Optional[str]:
-    key = normalize_country_name(name)
-    if key in _NAME_OVERRIDES:
-        return _NAME_OVERRIDES[key]
+def _pycountry_lookup(name: str) -> Optional[str]:
+    import pycountry
+
     try:
         country = pycountry.countries.lookup(name)
     except LookupError:
@@ -45,11 +137,31 @@ def iso3_from_name(name: str) -> Optional[str]:
     return getattr(country, "alpha_3", None)
 
 
+def iso3_from_name(name: str) -> Optional[str]:
+    key = normalize_country_name(name)
+    if not key:
+        return None
+    return name_index().get(key) or _pycountry_lookup(key)
+
+
+def iso3_from_names(names: pd.Series) -> pd.Series:
+    """Vectorized `iso3_from_name`: each distinct raw value is normalized and looked up once."""
+    codes, uniques = pd.factorize(names, use_na_sentinel=True)
+    mapped = np.array([iso3_from_name(str(u)) for u in uniques] + [None], dtype=object)
+    # codes == -1 (missing) picks the trailing None.
+    return pd.Series(mapped[codes], index=names.index, dtype=object)
+
+
 def iso3_from_code(code: str) -> Optional[str]:
     code = code.strip().upper()
     if len(code) == 3 and code.isalpha():
         return code
     if len(code) == 2 and code.isalpha():
+        mapped = _iso_table()["alpha_2"].get(code)
+        if mapped:
+            return mapped
+        import pycountry
+
         try:
             c = pycountry.countries.get(alpha_2=code)
         except LookupError:
@@ -67,4 +179,3 @@ def ensure_iso3(code_or_name: str) -> str:
     if mapped:
         return mapped
     raise ValueError(f"Could not map country '{code_or_name}' to ISO3.")
-
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable
 
 import numpy as np
 import pandas as pd
 
 from war_hunger_aging.config import ProjectConfig
 from war_hunger_aging.io.wdi import wdi_long_to_wide
+from war_hunger_aging.pipeline.cube import MortalityCube
+
+
+MANIFEST_VERSION = 1
 
 
 @dataclass(frozen=True)
@@ -15,36 +22,85 @@ class PanelPaths:
     panel_base: Path
     panel_event: Path
     groups: Path
+    manifest: Path
+    cube: Path
+    rebuilt: tuple[str, ...] = ()
+    up_to_date: bool = False
+
+
+INTERPOLATION_METHODS = ("linear", "ffill")
+
+
+def _fill_year_axis(grid: np.ndarray, *, method: str, max_gap: int | None) -> np.ndarray:
+    """
+    Fill NaNs along axis 1 (years) of a (country, year, column) grid.
+
+    - linear: inside-only linear interpolation between the nearest observed years
+    - ffill: carry the last observation forward (never backwards)
 
+    `max_gap` limits fills to gaps of at most that many consecutive missing years
+    (linear) or to at most that many years after the last observation (ffill).
+    """
+    n_years = grid.shape[1]
+    valid = ~np.isnan(grid)
+    pos = np.arange(n_years).reshape(1, n_years, 1)
+
+    prev = np.maximum.accumulate(np.where(valid, pos, -1), axis=1)
+    y_prev = np.take_along_axis(grid, np.clip(prev, 0, None), axis=1)
+    if method == "ffill":
+        fill = ~valid & (prev >= 0)
+        if max_gap is not None:
+            fill &= (pos - prev) <= max_gap
+        return np.where(fill, y_prev, grid)
+
+    nxt = np.flip(np.minimum.accumulate(np.flip(np.where(valid, pos, n_years), axis=1), axis=1), axis=1)
+    y_next = np.take_along_axis(grid, np.clip(nxt, None, n_years - 1), axis=1)
+    fill = ~valid & (prev >= 0) & (nxt < n_years)
+    if max_gap is not None:
+        fill &= (nxt - prev - 1) <= max_gap
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weight = (pos - prev) / (nxt - prev)
+        interp = y_prev + (y_next - y_prev) * weight
+    return np.where(fill, interp, grid)
+
+
+def _interpolate_by_country(
+    df: pd.DataFrame,
+    cols: list[str],
+    *,
+    method: str = "linear",
+    max_gap: int | None = None,
+) -> pd.DataFrame:
+    """
+    Fill covariate gaps within each country, all columns in one pass.
 
-def _interpolate_by_country(df: pd.DataFrame, cols: list[str]) -> pd.DataFrame:
+    Values are scattered onto a dense iso3 x year x column array so gaps are measured
+    in calendar years (years absent from `df` count as missing), filled with
+    `_fill_year_axis`, then gathered back to the original rows.
+    """
+    if method not in INTERPOLATION_METHODS:
+        raise ValueError(f"Unknown interpolation method {method!r}; expected one of {INTERPOLATION_METHODS}.")
     out = df.sort_values(["iso3", "year"]).copy()
-    for col in cols:
-        out[col] = out.groupby("iso3")[col].transform(
-            lambda s: s.astype(float).interpolate(limit_area="inside")
-        )
+    if out.empty or not cols:
+        return out
+
+    iso_idx, iso_labels = pd.factorize(out["iso3"])
+    years = out["year"].to_numpy(dtype=np.int64)
+    year_idx = years - years.min()
+    grid = np.full((len(iso_labels), int(year_idx.max()) + 1, len(cols)), np.nan)
+    grid[iso_idx, year_idx] = out[cols].to_numpy(dtype=float)
+
+    filled = _fill_year_axis(grid, method=method, max_gap=max_gap)
+    out[cols] = filled[iso_idx, year_idx]
     return out
 
 
-def build_panels(
-    *,
+def _filter_inputs(
     cfg: ProjectConfig,
     mortality: pd.DataFrame,
     wdi_long: pd.DataFrame,
     ucdp: pd.DataFrame,
-    out_dir: Path,
-) -> PanelPaths:
-    """
-    Writes:
-    - panel_base.parquet: iso3-year-sex-age with covariates
-    - panel.parquet (event): case_group-iso3-year-sex-age with event_time/period metadata
-    - groups.parquet: case_group-iso3 with t0/t1/is_case
-    """
-    out_dir.mkdir(parents=True, exist_ok=True)
-    panel_base_path = out_dir / "panel_base.parquet"
-    panel_event_path = out_dir / "panel.parquet"
-    groups_path = out_dir / "groups.parquet"
-
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     countries = set(cfg.countries)
     mortality = mortality[
         (mortality["iso3"].isin(countries))
@@ -64,19 +120,117 @@ def build_panels(
         & (ucdp["year"] >= cfg.start_year)
         & (ucdp["year"] <= cfg.end_year)
     ].copy()
+    return mortality, wdi_long, ucdp
+
 
-    indicator_map = {
+def _indicator_map(cfg: ProjectConfig) -> dict[str, str]:
+    return {
         cfg.wdi.indicators.population: "population",
         cfg.wdi.indicators.pou: "pou",
         cfg.wdi.indicators.fies: "fies",
     }
+
+
+def _config_slice(cfg: ProjectConfig) -> dict[str, object]:
+    """Config settings that shape every country's base rows."""
+    return {
+        "start_year": cfg.start_year,
+        "end_year": cfg.end_year,
+        "sexes": list(cfg.sexes),
+        "fit_ages": [cfg.fit_ages.min, cfg.fit_ages.max],
+        "indicators": _indicator_map(cfg),
+        "interpolate": cfg.wdi.interpolate,
+        "interpolate_method": cfg.wdi.interpolate_method,
+        "interpolate_max_gap": cfg.wdi.interpolate_max_gap,
+    }
+
+
+def _groups_slice(cfg: ProjectConfig) -> dict[str, object]:
+    """Config settings that shape groups.parquet and the event panel."""
+    return {
+        "start_year": cfg.start_year,
+        "end_year": cfg.end_year,
+        "cases": [[g.id, g.iso3, g.t0, g.t1, list(g.controls)] for g in cfg.cases],
+    }
+
+
+def _digest(obj: object) -> str:
+    return hashlib.sha256(json.dumps(obj, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _row_hashes_by_iso3(df: pd.DataFrame, cols: list[str]) -> dict[str, bytes]:
+    if df.empty:
+        return {}
+    df = df[cols].sort_values(cols, kind="mergesort")
+    hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    codes, uniques = pd.factorize(df["iso3"].to_numpy())
+    bounds = np.flatnonzero(np.diff(codes)) + 1
+    return {str(iso3): chunk.tobytes() for iso3, chunk in zip(uniques, np.split(hashes, bounds))}
+
+
+def fingerprint_inputs(
+    *,
+    cfg: ProjectConfig,
+    mortality: pd.DataFrame,
+    wdi_long: pd.DataFrame,
+    ucdp: pd.DataFrame,
+) -> dict[str, str]:
+    """
+    Per-iso3 fingerprints of everything that feeds a country's panel_base rows:
+    its WPP rows, WDI values, UCDP rows and the shared config slice.
+    Inputs are expected to be filtered to the study set already.
+    """
+    config_digest = _digest(_config_slice(cfg))
+    parts = [
+        _row_hashes_by_iso3(mortality, ["iso3", "year", "sex", "age", "mx"]),
+        _row_hashes_by_iso3(wdi_long, ["iso3", "year", "indicator", "value"]),
+        _row_hashes_by_iso3(ucdp, ["iso3", "year", "battle_deaths"]),
+    ]
+    out: dict[str, str] = {}
+    for iso3 in cfg.countries:
+        h = hashlib.sha256(config_digest.encode("ascii"))
+        for part in parts:
+            chunk = part.get(iso3, b"")
+            h.update(len(chunk).to_bytes(8, "little"))
+            h.update(chunk)
+        out[iso3] = h.hexdigest()
+    return out
+
+
+def _read_manifest(path: Path) -> dict[str, object]:
+    if not path.exists():
+        return {}
+    try:
+        manifest = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def _build_base(
+    *,
+    cfg: ProjectConfig,
+    mortality: pd.DataFrame,
+    wdi_long: pd.DataFrame,
+    ucdp: pd.DataFrame,
+) -> pd.DataFrame:
+    indicator_map = _indicator_map(cfg)
     wdi_wide = wdi_long_to_wide(wdi_long, indicator_map=indicator_map)
+    # A subset of countries may lack an indicator entirely; keep a stable column layout.
+    wdi_wide = wdi_wide.reindex(columns=["iso3", "year", *sorted(set(indicator_map.values()))])
 
     cov = wdi_wide.merge(ucdp, on=["iso3", "year"], how="left")
     cov["battle_deaths"] = cov["battle_deaths"].fillna(0.0)
 
     if cfg.wdi.interpolate:
-        cov = _interpolate_by_country(cov, cols=["population", "pou", "fies"])
+        cov = _interpolate_by_country(
+            cov,
+            cols=["population", "pou", "fies"],
+            method=cfg.wdi.interpolate_method,
+            max_gap=cfg.wdi.interpolate_max_gap,
+        )
 
     cov["battle_deaths_per_100k"] = np.where(
         cov["population"] > 0,
@@ -86,10 +240,10 @@ def build_panels(
 
     base = mortality.merge(cov, on=["iso3", "year"], how="left")
     base["log_mx"] = np.where(base["mx"] > 0, np.log(base["mx"]), np.nan)
-    base = base.sort_values(["iso3", "year", "sex", "age"]).reset_index(drop=True)
+    return base.sort_values(["iso3", "year", "sex", "age"]).reset_index(drop=True)
 
-    base.to_parquet(panel_base_path, index=False)
 
+def _build_groups(cfg: ProjectConfig) -> pd.DataFrame:
     groups_rows: list[dict[str, object]] = []
     for group in cfg.cases:
         for iso3 in group.all_countries:
@@ -103,8 +257,10 @@ def build_panels(
                 }
             )
     groups = pd.DataFrame(groups_rows)
-    groups.to_parquet(groups_path, index=False)
+    return groups
+
 
+def _build_event(*, cfg: ProjectConfig, groups: pd.DataFrame, base: pd.DataFrame) -> pd.DataFrame:
     # Expand to an event-study panel by duplicating rows per case_group.
     years = np.arange(cfg.start_year, cfg.end_year + 1, dtype=int)
     expanded_rows: list[dict[str, object]] = []
@@ -139,6 +295,150 @@ def build_panels(
     event = expanded.merge(base, on=["iso3", "year"], how="left")
     event = event.dropna(subset=["sex", "age", "mx"])
     event = event.sort_values(["case_group", "iso3", "year", "sex", "age"]).reset_index(drop=True)
+    return event
+
+
+ENGINES = ("pandas", "polars")
+
+
+@dataclass(frozen=True)
+class _Backend:
+    build_base: Callable[..., pd.DataFrame]
+    build_event: Callable[..., pd.DataFrame]
+
+
+def _backend(engine: str) -> _Backend:
+    if engine == "pandas":
+        return _Backend(build_base=_build_base, build_event=_build_event)
+    if engine == "polars":
+        try:
+            from war_hunger_aging.pipeline import build_panel_polars
+        except ModuleNotFoundError as exc:
+            raise ModuleNotFoundError(
+                "engine='polars' needs the optional polars dependency: pip install 'war-hunger-aging[polars]'"
+            ) from exc
+        return _Backend(build_base=build_panel_polars.build_base, build_event=build_panel_polars.build_event)
+    raise ValueError(f"Unknown panel engine {engine!r}; expected one of {ENGINES}.")
+
+
+def build_panels(
+    *,
+    cfg: ProjectConfig,
+    mortality: pd.DataFrame,
+    wdi_long: pd.DataFrame,
+    ucdp: pd.DataFrame,
+    out_dir: Path,
+    incremental: bool = True,
+    engine: str = "pandas",
+) -> PanelPaths:
+    """
+    Writes:
+    - panel_base.parquet: iso3-year-sex-age with covariates
+    - panel.parquet (event): case_group-iso3-year-sex-age with event_time/period metadata
+    - groups.parquet: case_group-iso3 with t0/t1/is_case
+    - mortality_cube/: panel_base mx as a dense iso3 x year x sex x age array (see MortalityCube)
+    - panel_base_parts/{iso3}.parquet + panel_manifest.json: per-country partitions and
+      the input fingerprints they were built from
+
+    With `incremental=True` only countries whose fingerprint changed (or that are new)
+    are recomputed; the other partitions are reused from disk. If nothing changed and
+    all outputs exist, nothing is written and `up_to_date` is set.
+
+    `engine="polars"` runs the pivot/joins/sort of the base and event panels as Polars
+    lazy queries; outputs are identical to the default pandas engine.
+    """
+    backend = _backend(engine)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    panel_base_path = out_dir / "panel_base.parquet"
+    panel_event_path = out_dir / "panel.parquet"
+    groups_path = out_dir / "groups.parquet"
+    manifest_path = out_dir / "panel_manifest.json"
+    cube_path = out_dir / "mortality_cube"
+    parts_dir = out_dir / "panel_base_parts"
+
+    mortality, wdi_long, ucdp = _filter_inputs(cfg, mortality, wdi_long, ucdp)
+    fingerprints = fingerprint_inputs(cfg=cfg, mortality=mortality, wdi_long=wdi_long, ucdp=ucdp)
+    groups_digest = _digest(_groups_slice(cfg))
+
+    previous = _read_manifest(manifest_path) if incremental else {}
+    prev_countries: dict[str, dict[str, object]] = dict(previous.get("countries", {}))  # type: ignore[arg-type]
+
+    def _is_current(iso3: str) -> bool:
+        entry = prev_countries.get(iso3)
+        if not entry or entry.get("fingerprint") != fingerprints[iso3]:
+            return False
+        return int(entry.get("rows", 0)) == 0 or (parts_dir / f"{iso3}.parquet").exists()
+
+    stale = [iso3 for iso3 in cfg.countries if not _is_current(iso3)]
+    removed = sorted(set(prev_countries) - set(fingerprints))
+    outputs_exist = all(
+        p.exists() for p in [panel_base_path, panel_event_path, groups_path, cube_path / "mx.npy"]
+    )
+    if not stale and not removed and outputs_exist and previous.get("groups") == groups_digest:
+        return PanelPaths(
+            panel_base=panel_base_path,
+            panel_event=panel_event_path,
+            groups=groups_path,
+            manifest=manifest_path,
+            cube=cube_path,
+            up_to_date=True,
+        )
+
+    parts_dir.mkdir(parents=True, exist_ok=True)
+    for iso3 in removed:
+        (parts_dir / f"{iso3}.parquet").unlink(missing_ok=True)
+
+    countries: dict[str, dict[str, object]] = {}
+    if stale:
+        stale_set = set(stale)
+        fresh = backend.build_base(
+            cfg=cfg,
+            mortality=mortality[mortality["iso3"].isin(stale_set)],
+            wdi_long=wdi_long[wdi_long["iso3"].isin(stale_set)],
+            ucdp=ucdp[ucdp["iso3"].isin(stale_set)],
+        )
+        by_iso3 = dict(tuple(fresh.groupby("iso3", sort=False)))
+        for iso3 in stale:
+            part = by_iso3.get(iso3)
+            part_path = parts_dir / f"{iso3}.parquet"
+            if part is None or part.empty:
+                part_path.unlink(missing_ok=True)
+                countries[iso3] = {"fingerprint": fingerprints[iso3], "rows": 0}
+                continue
+            part.reset_index(drop=True).to_parquet(part_path, index=False)
+            countries[iso3] = {"fingerprint": fingerprints[iso3], "rows": int(len(part))}
+    for iso3 in cfg.countries:
+        if iso3 not in countries:
+            countries[iso3] = prev_countries[iso3]
+
+    frames = [
+        pd.read_parquet(parts_dir / f"{iso3}.parquet")
+        for iso3 in cfg.countries
+        if int(countries[iso3]["rows"]) > 0
+    ]
+    if frames:
+        base = pd.concat(frames, ignore_index=True)
+        base = base.sort_values(["iso3", "year", "sex", "age"]).reset_index(drop=True)
+    else:
+        base = backend.build_base(cfg=cfg, mortality=mortality, wdi_long=wdi_long, ucdp=ucdp)
+
+    base.to_parquet(panel_base_path, index=False)
+    MortalityCube.from_panel(base).save(cube_path)
+
+    groups = _build_groups(cfg)
+    groups.to_parquet(groups_path, index=False)
+
+    event = backend.build_event(cfg=cfg, groups=groups, base=base)
     event.to_parquet(panel_event_path, index=False)
 
-    return PanelPaths(panel_base=panel_base_path, panel_event=panel_event_path, groups=groups_path)
+    manifest = {"version": MANIFEST_VERSION, "groups": groups_digest, "countries": countries}
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+
+    return PanelPaths(
+        panel_base=panel_base_path,
+        panel_event=panel_event_path,
+        groups=groups_path,
+        manifest=manifest_path,
+        cube=cube_path,
+        rebuilt=tuple(stale),
+    )
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from war_hunger_aging.config import ProjectConfig
+from war_hunger_aging.pipeline.build_panel import _indicator_map, _interpolate_by_country
+
+
+def _to_pandas(df: pl.DataFrame) -> pd.DataFrame:
+    # Go through Arrow so string/float/int columns land on the same pandas dtypes
+    # the pandas engine produces (and hence byte-identical parquet).
+    return df.rechunk().to_arrow().to_pandas()
+
+
+def _wdi_wide(cfg: ProjectConfig, wdi_long: pd.DataFrame) -> pl.LazyFrame:
+    indicator_map = _indicator_map(cfg)
+    value_cols = sorted(set(indicator_map.values()))
+    wdi = pl.from_pandas(wdi_long[["iso3", "year", "indicator", "value"]]).lazy()
+    # Mirrors pivot_table(aggfunc="first"): first non-null value per cell, and
+    # iso3-years without any value are dropped.
+    firsts = (
+        wdi.filter(pl.col("indicator").is_in(list(indicator_map)))
+        .with_columns(pl.col("indicator").replace_strict(indicator_map).alias("col"))
+        .group_by(["iso3", "year", "col"])
+        .agg(pl.col("value").fill_nan(None).drop_nulls().first())
+        .filter(pl.col("value").is_not_null())
+    )
+    wide = firsts.group_by(["iso3", "year"]).agg(
+        [pl.col("value").filter(pl.col("col") == c).first().cast(pl.Float64).alias(c) for c in value_cols]
+    )
+    return wide.sort(["iso3", "year"])
+
+
+def build_base(
+    *,
+    cfg: ProjectConfig,
+    mortality: pd.DataFrame,
+    wdi_long: pd.DataFrame,
+    ucdp: pd.DataFrame,
+) -> pd.DataFrame:
+    """Polars counterpart of build_panel._build_base."""
+    cov = _wdi_wide(cfg, wdi_long).join(
+        pl.from_pandas(ucdp).lazy(), on=["iso3", "year"], how="left", maintain_order="left"
+    )
+    cov = cov.with_columns(pl.col("battle_deaths").cast(pl.Float64).fill_null(0.0))
+    if cfg.wdi.interpolate:
+        # The covariate table is only iso3 x year; reuse the vectorized numpy fill.
+        filled = _interpolate_by_country(
+            _to_pandas(cov.collect()),
+            cols=["population", "pou", "fies"],
+            method=cfg.wdi.interpolate_method,
+            max_gap=cfg.wdi.interpolate_max_gap,
+        )
+        cov = pl.from_pandas(filled).lazy()
+    cov = cov.with_columns(
+        pl.when(pl.col("population") > 0)
+        .then(pl.col("battle_deaths") / pl.col("population") * 100_000.0)
+        .otherwise(None)
+        .alias("battle_deaths_per_100k")
+    )
+
+    base = (
+        pl.from_pandas(mortality[["iso3", "year", "sex", "age", "mx"]])
+        .lazy()
+        .join(cov, on=["iso3", "year"], how="left", maintain_order="left")
+        .sort(["iso3", "year", "sex", "age"])
+    )
+    out = _to_pandas(base.collect())
+    float_cols = [c for c in out.columns if c not in {"iso3", "year", "sex"}]
+    out[float_cols] = out[float_cols].astype(float)
+    # numpy's log, not Polars', so values match the pandas engine bit for bit.
+    out["log_mx"] = np.where(out["mx"] > 0, np.log(out["mx"]), np.nan)
+    return out
+
+
+def build_event(*, cfg: ProjectConfig, groups: pd.DataFrame, base: pd.DataFrame) -> pd.DataFrame:
+    """Polars counterpart of build_panel._build_event."""
+    years = pl.LazyFrame({"year": pl.int_range(cfg.start_year, cfg.end_year + 1, eager=True).cast(pl.Int64)})
+    t0 = pl.col("t0")
+    t1 = pl.col("t1")
+    year = pl.col("year")
+    expanded = (
+        pl.from_pandas(groups)
+        .lazy()
+        .with_columns(t0.cast(pl.Int64), t1.cast(pl.Int64))
+        .join(years, how="cross")
+        .select(
+            "case_group",
+            "iso3",
+            "year",
+            (year - t0).alias("event_time"),
+            pl.when((year >= t0 - 5) & (year <= t0 - 1))
+            .then(pl.lit("pre"))
+            .when((year >= t0) & (year <= t1))
+            .then(pl.lit("crisis"))
+            .when(year >= t1 + 1)
+            .then(pl.lit("post"))
+            .otherwise(pl.lit("other"))
+            .alias("period"),
+            "t0",
+            "t1",
+            "is_case_country",
+        )
+    )
+    event = (
+        expanded.join(pl.from_pandas(base).lazy(), on=["iso3", "year"], how="inner")
+        .drop_nulls(subset=["sex", "age", "mx"])
+        .sort(["case_group", "iso3", "year", "sex", "age"])
+    )
+    return _to_pandas(event.collect())
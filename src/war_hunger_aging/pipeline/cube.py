@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+CUBE_VERSION = 1
+_AXES = ("iso3", "year", "sex", "age")
+
+
+@dataclass(frozen=True)
+class MortalityCube:
+    """
+    Dense mortality array with shape (iso3, year, sex, age).
+
+    Axis labels are sorted; cells without an observation are NaN (see `mask`).
+    `sel` only uses basic slicing, so the returned cube is a view of the same
+    buffer (including a memory-mapped one) rather than a copy.
+    """
+
+    mx: np.ndarray
+    iso3: tuple[str, ...]
+    years: np.ndarray
+    sexes: tuple[str, ...]
+    ages: np.ndarray
+
+    def __post_init__(self) -> None:
+        expected = (len(self.iso3), len(self.years), len(self.sexes), len(self.ages))
+        if self.mx.shape != expected:
+            raise ValueError(f"mx shape {self.mx.shape} does not match axis lengths {expected}.")
+
+    @property
+    def shape(self) -> tuple[int, int, int, int]:
+        return self.mx.shape  # type: ignore[return-value]
+
+    @property
+    def mask(self) -> np.ndarray:
+        """True where a cell holds an observed value."""
+        return ~np.isnan(self.mx)
+
+    @classmethod
+    def from_panel(cls, panel: pd.DataFrame, *, value_col: str = "mx") -> MortalityCube:
+        """Build from long-format rows (e.g. panel_base): iso3, year, sex, age, mx."""
+        missing = {*_AXES, value_col} - set(panel.columns)
+        if missing:
+            raise KeyError(f"panel missing columns: {sorted(missing)}")
+
+        # Hash-based factorize with sorted labels (np.unique would argsort the string columns).
+        iso3_idx, iso3 = pd.factorize(panel["iso3"].astype(str), sort=True)
+        year_idx, years = pd.factorize(panel["year"].astype(np.int64), sort=True)
+        sex_idx, sexes = pd.factorize(panel["sex"].astype(str), sort=True)
+        age_idx, ages = pd.factorize(panel["age"].astype(float), sort=True)
+
+        mx = np.full((len(iso3), len(years), len(sexes), len(ages)), np.nan)
+        mx[iso3_idx, year_idx, sex_idx, age_idx] = panel[value_col].to_numpy(dtype=float)
+        return cls(
+            mx=mx,
+            iso3=tuple(str(x) for x in iso3),
+            years=np.asarray(years, dtype=np.int64),
+            sexes=tuple(str(x) for x in sexes),
+            ages=np.asarray(ages, dtype=float),
+        )
+
+    def save(self, path: str | Path) -> Path:
+        """Write `mx.npy` plus `axes.json` into the directory `path`."""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        tmp = path / "mx.npy.tmp"
+        with tmp.open("wb") as f:
+            np.save(f, np.ascontiguousarray(self.mx, dtype=np.float64))
+        tmp.replace(path / "mx.npy")
+        axes = {
+            "version": CUBE_VERSION,
+            "shape": list(self.shape),
+            "iso3": list(self.iso3),
+            "years": [int(y) for y in self.years],
+            "sexes": list(self.sexes),
+            "ages": [float(a) for a in self.ages],
+        }
+        (path / "axes.json").write_text(json.dumps(axes, indent=2) + "\n")
+        return path
+
+    @classmethod
+    def open(cls, path: str | Path, *, mmap: bool = True) -> MortalityCube:
+        """Open a saved cube; with `mmap=True` the array is a read-only memory map."""
+        path = Path(path)
+        axes = json.loads((path / "axes.json").read_text())
+        if axes.get("version") != CUBE_VERSION:
+            raise ValueError(f"Unsupported cube version {axes.get('version')!r} at {path}")
+        mx = np.load(path / "mx.npy", mmap_mode="r" if mmap else None)
+        return cls(
+            mx=mx,
+            iso3=tuple(axes["iso3"]),
+            years=np.asarray(axes["years"], dtype=np.int64),
+            sexes=tuple(axes["sexes"]),
+            ages=np.asarray(axes["ages"], dtype=float),
+        )
+
+    def _label_slice(self, labels: tuple[str, ...], value: str | None, axis: str) -> slice:
+        if value is None:
+            return slice(None)
+        try:
+            i = labels.index(value)
+        except ValueError:
+            raise KeyError(f"{value!r} not in cube {axis} axis") from None
+        return slice(i, i + 1)
+
+    @staticmethod
+    def _range_slice(values: np.ndarray, lo: float | None, hi: float | None) -> slice:
+        start = int(np.searchsorted(values, lo, side="left")) if lo is not None else 0
+        stop = int(np.searchsorted(values, hi, side="right")) if hi is not None else len(values)
+        return slice(start, stop)
+
+    def sel(
+        self,
+        *,
+        iso3: str | None = None,
+        sex: str | None = None,
+        year_min: int | None = None,
+        year_max: int | None = None,
+        age_min: float | None = None,
+        age_max: float | None = None,
+    ) -> MortalityCube:
+        """Zero-copy selection of one country / one sex and inclusive year / age ranges."""
+        s_iso = self._label_slice(self.iso3, iso3, "iso3")
+        s_sex = self._label_slice(self.sexes, sex, "sex")
+        s_year = self._range_slice(self.years, year_min, year_max)
+        s_age = self._range_slice(self.ages, age_min, age_max)
+        return MortalityCube(
+            mx=self.mx[s_iso, s_year, s_sex, s_age],
+            iso3=self.iso3[s_iso],
+            years=self.years[s_year],
+            sexes=self.sexes[s_sex],
+            ages=self.ages[s_age],
+        )
+
+    def to_frame(self, *, dropna: bool = True) -> pd.DataFrame:
+        """Back to long format: iso3, year, sex, age, mx."""
+        idx = pd.MultiIndex.from_product(
+            [list(self.iso3), self.years, list(self.sexes), self.ages],
+            names=list(_AXES),
+        )
+        df = pd.DataFrame({"mx": np.asarray(self.mx).reshape(-1)}, index=idx).reset_index()
+        if dropna:
+            df = df.dropna(subset=["mx"]).reset_index(drop=True)
+        return df
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+from war_hunger_aging.config import ProjectConfig
+from war_hunger_aging.io.hmd import load_hmd_mx
+from war_hunger_aging.io.wpp import load_wpp_mx
+
+
+MORTALITY_COLUMNS = ["iso3", "year", "sex", "age", "mx"]
+
+
+def load_mortality(cfg: ProjectConfig, *, wpp_path: Path | None) -> pd.DataFrame:
+    """
+    Study mortality (iso3, year, sex, age, mx) with each country taken from the
+    source `cfg.mortality` selects for it: the WPP export or the HMD 1x1 tables
+    (cached as parquet under data_intermediate/hmd).
+    """
+    by_source: dict[str, list[str]] = {"wpp": [], "hmd": []}
+    for iso3 in cfg.countries:
+        by_source[cfg.mortality.source_for(iso3)].append(iso3)
+
+    filters = dict(
+        start_year=cfg.start_year,
+        end_year=cfg.end_year,
+        sexes=cfg.sexes,
+        age_min=cfg.fit_ages.min,
+        age_max=cfg.fit_ages.max,
+    )
+    frames: list[pd.DataFrame] = []
+    if by_source["wpp"]:
+        if wpp_path is None or not wpp_path.exists():
+            raise FileNotFoundError(f"Missing WPP export: {wpp_path}. Run scripts/30_export_wpp_from_r.R")
+        frames.append(load_wpp_mx(wpp_path, countries=by_source["wpp"], **filters))
+    if by_source["hmd"]:
+        hmd = load_hmd_mx(
+            cfg.mortality.hmd_dir,
+            cache_dir=cfg.paths.data_intermediate / "hmd",
+            countries=by_source["hmd"],
+            **filters,
+        )
+        missing = sorted(set(by_source["hmd"]) - set(hmd["iso3"]))
+        if missing:
+            raise FileNotFoundError(f"No HMD tables for {missing} under {cfg.mortality.hmd_dir}")
+        frames.append(hmd.dropna(subset=["mx"])[MORTALITY_COLUMNS])
+
+    out = pd.concat(frames, ignore_index=True)
+    return out.sort_values(["iso3", "year", "sex", "age"]).reset_index(drop=True)
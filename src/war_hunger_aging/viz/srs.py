@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from war_hunger_aging.model.gm import gm_hazard
+from war_hunger_aging.model.gmh import gmh_hazard
+
+
+OVERLAY_RESIDENCES = (("Rural", "tab:green"), ("Urban", "tab:purple"), ("Total", "tab:gray"))
+
+# One overlay layer: residence, color, observed (age, mx), GM and GMH (ages, hazard) curves
+# (None = no converged fit).
+_Curve = tuple[np.ndarray, np.ndarray]
+_Layer = tuple[str, str, np.ndarray, np.ndarray, _Curve | None, _Curve | None]
+
+
+def _curves(
+    params: pd.DataFrame,
+    model: str,
+    keys: list[str],
+    ages: np.ndarray,
+    *,
+    mu_h: float,
+    sigma_h: float,
+) -> dict[tuple, _Curve]:
+    """(keys..., residence) -> hazard on `ages` for every converged fit of `model`, in one array pass."""
+    p = params[(params["model"] == model) & params["converged"].astype(bool)]
+    p = p.drop_duplicates(keys + ["residence"])
+    if p.empty:
+        return {}
+    a, b, c = (p[k].to_numpy(float)[:, None] for k in "abc")
+    if model == "gm":
+        curves = gm_hazard(ages[None, :], a=a, b=b, c=c)
+    else:
+        h = p["h"].to_numpy(float)[:, None]
+        curves = gmh_hazard(ages[None, :], a=a, b=b, c=c, h=h, mu=mu_h, sigma=sigma_h)
+    index = pd.MultiIndex.from_frame(p[keys + ["residence"]].astype(str))
+    return {k: (ages, curve) for k, curve in zip(index, curves)}
+
+
+def srs_overlay_specs(
+    obs: pd.DataFrame,
+    params: pd.DataFrame,
+    *,
+    out_dir: str | Path,
+    adult_age_min: float,
+    fit_age_min: float,
+    mu_h: float,
+    sigma_h: float,
+    include_gmh: bool = True,
+) -> list[tuple[str, Path, list[_Layer]]]:
+    """
+    Everything needed to draw the hazard overlays, one (title, outpath, layers)
+    per (release,) area x sex: observed mx from `fit_age_min` on, plus the GM
+    (from `adult_age_min`) and GMH curves of each residence.
+
+    Parameters are indexed by (release, area, sex, residence) once and all curves
+    of a model are evaluated in a single broadcast, so no frame is scanned per plot.
+    """
+    keys = (["release"] if "release" in obs.columns else []) + ["area", "sex"]
+    obs = obs[obs["age_mid"] >= fit_age_min]
+    max_age = float(obs["age_mid"].max())
+    gm_ages = np.linspace(float(adult_age_min), max_age, 120)
+    gmh_ages = np.linspace(float(fit_age_min), max_age, 160)
+    gm = _curves(params, "gm", keys, gm_ages, mu_h=mu_h, sigma_h=sigma_h)
+    gmh = _curves(params, "gmh", keys, gmh_ages, mu_h=mu_h, sigma_h=sigma_h) if include_gmh else {}
+
+    points: dict[tuple, dict[str, tuple[np.ndarray, np.ndarray]]] = {}
+    obs = obs.sort_values("age_mid", kind="stable")
+    for key, g in obs.groupby(keys + ["residence"], observed=True, sort=True):
+        key = tuple(str(k) for k in key)
+        points.setdefault(key[:-1], {})[key[-1]] = (g["age_mid"].to_numpy(float), g["mx"].to_numpy(float))
+
+    out_dir = Path(out_dir)
+    specs = []
+    for fig_key in sorted(points, key=lambda k: (k[:-2], k[-1], k[-2])):  # sex-major, as before
+        *release, area, sex = fig_key
+        layers: list[_Layer] = []
+        for residence, color in OVERLAY_RESIDENCES:
+            if residence not in points[fig_key]:
+                continue
+            age, mx = points[fig_key][residence]
+            k = (*fig_key, residence)
+            layers.append((residence, color, age, mx, gm.get(k), gmh.get(k)))
+        stem = "_".join([*release, area, sex])
+        title = f"SRS hazard overlays — {area} — {sex}" + (f" ({release[0]})" if release else "")
+        specs.append((title, out_dir / f"overlay_{stem}.png", layers))
+    return specs
+
+
+def _init_render_worker() -> None:
+    plt.switch_backend("Agg")
+
+
+def _render_overlay(spec: tuple[str, Path, list[_Layer]]) -> Path:
+    title, outpath, layers = spec
+    fig, ax = plt.subplots(figsize=(8, 5))
+    for residence, color, age, mx, gm_curve, gmh_curve in layers:
+        ax.scatter(age, mx, s=25, alpha=0.85, color=color, label=f"obs {residence}")
+        if gm_curve is not None:
+            ax.plot(*gm_curve, color=color, lw=2, alpha=0.9)
+        if gmh_curve is not None:
+            ax.plot(*gmh_curve, color=color, lw=1.5, ls="--", alpha=0.8)
+    ax.set_yscale("log")
+    ax.set_title(title)
+    ax.set_xlabel("Age (midpoint)")
+    ax.set_ylabel("mx (from nqx)")
+    ax.legend(ncol=2, fontsize=9)
+    outpath.parent.mkdir(parents=True, exist_ok=True)
+    fig.tight_layout()
+    fig.savefig(outpath, dpi=200)
+    plt.close(fig)
+    return outpath
+
+
+def plot_srs_hazard_overlays(
+    obs: pd.DataFrame,
+    params: pd.DataFrame,
+    *,
+    out_dir: str | Path,
+    adult_age_min: float,
+    fit_age_min: float,
+    mu_h: float,
+    sigma_h: float,
+    include_gmh: bool = True,
+    max_workers: int | None = None,
+) -> list[Path]:
+    """
+    Observed SRS mx vs fitted GM / GMH hazards, one PNG per (release,) area x sex.
+
+    Specs are built in one vectorized pass (`srs_overlay_specs`); figures are
+    rendered on a process pool with the Agg backend (None = one worker per CPU,
+    1 = serial). Returns the written paths.
+    """
+    specs = srs_overlay_specs(
+        obs,
+        params,
+        out_dir=out_dir,
+        adult_age_min=adult_age_min,
+        fit_age_min=fit_age_min,
+        mu_h=mu_h,
+        sigma_h=sigma_h,
+        include_gmh=include_gmh,
+    )
+    workers = min(max_workers or os.cpu_count() or 1, len(specs))
+    if workers <= 1:
+        return [_render_overlay(s) for s in specs]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker) as pool:
+        return list(pool.map(_render_overlay, specs))
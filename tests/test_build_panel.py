@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+
+from war_hunger_aging.config import load_config
+from war_hunger_aging.pipeline.build_panel import build_panels
+
+
+def _write_config(tmp_path: Path, controls: list[str]) -> Path:
+    raw = {
+        "project": {
+            "start_year": 2000,
+            "end_year": 2005,
+            "sexes": ["Female", "Male"],
+            "ages": {"adult": {"min": 40, "max": 89}, "hump": {"min": 15, "max": 44}, "fit": {"min": 15, "max": 89}},
+            "hump": {"enabled": True, "mu": 28, "sigma": 10},
+        },
+        "cases": [{"id": "AAA_2003", "iso3": "AAA", "t0": 2003, "t1": 2005, "controls": controls}],
+        "wdi": {"indicators": {"population": "POP", "pou": "POU", "fies": "FIES"}, "interpolate": True},
+        "paths": {k: str(tmp_path / k) for k in ["data_raw", "data_intermediate", "data_processed", "reports_figures", "reports_tables"]},
+    }
+    path = tmp_path / "project.yml"
+    path.write_text(yaml.safe_dump(raw))
+    return path
+
+
+def _inputs(countries: list[str]) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    rng = np.random.default_rng(1)
+    mort = [
+        {"iso3": c, "year": y, "sex": s, "age": float(a), "mx": float(rng.uniform(1e-4, 1e-1))}
+        for c in countries
+        for y in range(2000, 2006)
+        for s in ["Female", "Male"]
+        for a in range(15, 90, 5)
+    ]
+    wdi = [
+        {"iso3": c, "year": y, "indicator": ind, "value": (float(rng.uniform(1, 50)) if (y + len(ind)) % 3 else None)}
+        for c in countries
+        for y in range(2000, 2006)
+        for ind in ["POP", "POU", "FIES"]
+    ]
+    ucdp = [{"iso3": countries[0], "year": 2004, "battle_deaths": 120.0}]
+    return pd.DataFrame(mort), pd.DataFrame(wdi), pd.DataFrame(ucdp)
+
+
+def test_incremental_build_rebuilds_only_changed_countries(tmp_path: Path) -> None:
+    cfg = load_config(_write_config(tmp_path, ["BBB", "CCC"]))
+    mort, wdi, ucdp = _inputs(["AAA", "BBB", "CCC", "DDD"])
+    out_dir = tmp_path / "out"
+
+    first = build_panels(cfg=cfg, mortality=mort, wdi_long=wdi, ucdp=ucdp, out_dir=out_dir)
+    assert first.rebuilt == ("AAA", "BBB", "CCC")
+
+    again = build_panels(cfg=cfg, mortality=mort, wdi_long=wdi, ucdp=ucdp, out_dir=out_dir)
+    assert again.up_to_date and again.rebuilt == ()
+
+    wdi2 = wdi.copy()
+    wdi2.loc[(wdi2["iso3"] == "BBB") & (wdi2["indicator"] == "POP"), "value"] *= 2.0
+    changed = build_panels(cfg=cfg, mortality=mort, wdi_long=wdi2, ucdp=ucdp, out_dir=out_dir)
+    assert changed.rebuilt == ("BBB",)
+
+    cfg_more = load_config(_write_config(tmp_path, ["BBB", "CCC", "DDD"]))
+    added = build_panels(cfg=cfg_more, mortality=mort, wdi_long=wdi2, ucdp=ucdp, out_dir=out_dir)
+    assert added.rebuilt == ("DDD",)
+
+    full = build_panels(cfg=cfg_more, mortality=mort, wdi_long=wdi2, ucdp=ucdp, out_dir=tmp_path / "full", incremental=False)
+    for name in ["panel_base.parquet", "panel.parquet", "groups.parquet"]:
+        pd.testing.assert_frame_equal(pd.read_parquet(out_dir / name), pd.read_parquet(full.panel_base.parent / name))
+
+
+def test_interpolation_matches_pandas_and_respects_max_gap() -> None:
+    from war_hunger_aging.pipeline.build_panel import _interpolate_by_country
+
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame(
+        {
+            "iso3": np.repeat(["AAA", "BBB", "CCC"], 10),
+            "year": np.tile(np.arange(2000, 2010), 3),
+            "x": rng.uniform(0, 1, 30),
+            "y": rng.uniform(0, 1, 30),
+        }
+    )
+    df.loc[rng.uniform(size=30) < 0.4, "x"] = np.nan
+    df.loc[rng.uniform(size=30) < 0.4, "y"] = np.nan
+    df = df.sample(frac=1.0, random_state=0)
+
+    got = _interpolate_by_country(df, cols=["x", "y"])
+    expected = df.sort_values(["iso3", "year"]).copy()
+    for col in ["x", "y"]:
+        expected[col] = expected.groupby("iso3")[col].transform(lambda s: s.astype(float).interpolate(limit_area="inside"))
+    pd.testing.assert_frame_equal(got, expected)
+
+    gappy = pd.DataFrame({"iso3": ["AAA"] * 6, "year": range(2000, 2006), "x": [1.0, np.nan, np.nan, np.nan, 5.0, np.nan]})
+    ff = _interpolate_by_country(gappy, cols=["x"], method="ffill", max_gap=2)
+    np.testing.assert_array_equal(ff["x"].to_numpy(), [1.0, 1.0, 1.0, np.nan, 5.0, 5.0])
+    lin = _interpolate_by_country(gappy, cols=["x"], max_gap=2)
+    assert lin["x"].isna().sum() == 4
+    lin_all = _interpolate_by_country(gappy, cols=["x"])
+    np.testing.assert_allclose(lin_all["x"].to_numpy()[:5], [1.0, 2.0, 3.0, 4.0, 5.0])
+
+
+def test_polars_engine_writes_identical_parquet(tmp_path: Path) -> None:
+    pytest.importorskip("polars")
+    cfg = load_config(_write_config(tmp_path, ["BBB", "CCC"]))
+    mort, wdi, ucdp = _inputs(["AAA", "BBB", "CCC"])
+    outs = {}
+    for engine in ["pandas", "polars"]:
+        outs[engine] = build_panels(
+            cfg=cfg, mortality=mort, wdi_long=wdi, ucdp=ucdp, out_dir=tmp_path / engine, incremental=False, engine=engine
+        )
+    for attr in ["panel_base", "panel_event", "groups"]:
+        assert getattr(outs["pandas"], attr).read_bytes() == getattr(outs["polars"], attr).read_bytes()
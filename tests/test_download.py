@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from war_hunger_aging.io.download import download_file, fetch_archive
+from war_hunger_aging.io.http import RetryPolicy
+
+
+def _zip_bytes() -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_STORED) as zf:
+        zf.writestr("ucdp-brd-conf-251.csv", "year,location,bd_best\n" + "2015,Yemen,10\n" * 5000)
+        zf.writestr("docs/codebook.pdf", b"%PDF-1.4" + b"\0" * 4096)
+    return buf.getvalue()
+
+
+def _serve(bodies: list[bytes], requests_seen: list[str | None], *, cut_first: bool) -> ThreadingHTTPServer:
+    """Serves bodies[i] on request i (the last one from then on), honouring Range / If-Range by ETag."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802
+            rng = self.headers.get("Range")
+            requests_seen.append(rng)
+            body = bodies[min(len(requests_seen), len(bodies)) - 1]
+            etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+            if rng and self.headers.get("If-Range") not in (None, etag):
+                rng = None  # resource changed: send it whole
+            start = int(rng.split("=")[1].rstrip("-")) if rng else 0
+            if start >= len(body) and rng:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(body)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            chunk = body[start:]
+            self.send_response(206 if rng else 200)
+            if rng:
+                self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(chunk)))
+            self.send_header("Connection", "close")
+            self.end_headers()
+            if cut_first and len(requests_seen) == 1:
+                self.wfile.write(chunk[: len(chunk) // 3])  # drop the connection mid-body
+                return
+            self.wfile.write(chunk)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_fetch_archive_resumes_verifies_and_skips_when_unchanged(tmp_path: Path) -> None:
+    body = _zip_bytes()
+    sha = hashlib.sha256(body).hexdigest()
+    seen: list[str | None] = []
+    server = _serve([body], seen, cut_first=True)
+    url = f"http://127.0.0.1:{server.server_port}/ucdp-brd-conf-251-csv.zip"
+    retry = RetryPolicy(attempts=3, backoff=0.01)
+    try:
+        first = fetch_archive(url, tmp_path, expected_sha256=sha, retry=retry, chunk_size=4096)
+        assert not first.skipped and first.sha256 == sha
+        assert seen[0] is None and seen[1] is not None
+        resumed_from = int(seen[1].removeprefix("bytes=").rstrip("-"))
+        assert 0 < resumed_from <= len(body) // 3
+        assert [p.name for p in first.extracted] == ["ucdp-brd-conf-251.csv"]
+        assert not (tmp_path / "docs").exists()
+        assert not list(tmp_path.glob("*.part"))
+
+        n_requests = len(seen)
+        again = fetch_archive(url, tmp_path, expected_sha256=sha, retry=retry)
+        assert again.skipped and len(seen) == n_requests
+
+        with pytest.raises(ValueError, match="SHA-256 mismatch"):
+            fetch_archive(url, tmp_path / "bad", expected_sha256="0" * 64, retry=retry)
+        assert not (tmp_path / "bad" / "ucdp-brd-conf-251-csv.zip").exists()
+    finally:
+        server.shutdown()
+
+
+def test_download_file_restarts_when_the_resource_changed(tmp_path: Path) -> None:
+    old, new = _zip_bytes(), _zip_bytes().replace(b"Yemen", b"Syria")
+    seen: list[str | None] = []
+    server = _serve([old, new], seen, cut_first=True)
+    url = f"http://127.0.0.1:{server.server_port}/brd.zip"
+    retry = RetryPolicy(attempts=3, backoff=0.01)
+    try:
+        dest = download_file(url, tmp_path / "brd.zip", retry=retry, chunk_size=4096)
+        assert seen[1] is not None  # resume was attempted, but If-Range no longer matched
+        assert dest.read_bytes() == new
+        assert not list(tmp_path.glob("brd.zip.part*"))
+
+        # A stale `.part` longer than the remote file is not taken as complete on 416.
+        part = tmp_path / "again.zip.part"
+        part.write_bytes(new + b"junk")
+        etag = f'"{hashlib.sha256(new).hexdigest()[:16]}"'
+        (tmp_path / "again.zip.part.json").write_text(f'{{"url": "{url}", "etag": {json.dumps(etag)}}}')
+        n = len(seen)
+        assert download_file(url, tmp_path / "again.zip", retry=retry).read_bytes() == new
+        assert seen[n] == f"bytes={len(new) + 4}-" and seen[n + 1] is None
+    finally:
+        server.shutdown()
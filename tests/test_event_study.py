@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from war_hunger_aging.analysis.event_study import summarize_event_windows
+
+
+def test_event_windows_means_counts_and_se() -> None:
+    years = np.arange(2005, 2016)
+    params = pd.DataFrame(
+        {
+            "iso3": ["YEM"] * len(years) + ["OMN"] * len(years),
+            "year": np.concatenate([years, years]),
+            "sex": "Female",
+            "b": np.concatenate([years - 2000.0, np.full(len(years), 0.1)]),
+            "h": np.nan,
+        }
+    )
+    params.loc[(params["iso3"] == "OMN") & (params["year"] == 2006), "b"] = np.nan
+    groups = pd.DataFrame({"case_group": ["YEM_2010"] * 2, "iso3": ["YEM", "OMN"], "t0": [2010, 2010], "t1": [2012, 2012]})
+
+    out = summarize_event_windows(params=params, groups=groups, param_cols=["b", "h"], with_counts=True, with_se=True)
+    # 'h' is all-missing: no row, as before.
+    assert out[["iso3", "param"]].values.tolist() == [["OMN", "b"], ["YEM", "b"]]
+
+    yem = out[out["iso3"] == "YEM"].iloc[0]
+    assert (yem["pre_mean"], yem["crisis_mean"], yem["post_mean"]) == (7.0, 11.0, 14.0)  # 2005-09, 2010-12, 2013-15
+    assert yem["crisis_minus_pre"] == 4.0
+    assert (yem["pre_n"], yem["crisis_n"], yem["post_n"]) == (5, 3, 3)
+    assert np.isclose(yem["pre_se"], np.std([5, 6, 7, 8, 9], ddof=1) / np.sqrt(5))
+    assert out.loc[out["iso3"] == "OMN", "pre_n"].item() == 4
+
+    plain = summarize_event_windows(params=params, groups=groups, param_cols=["b", "h"])
+    assert list(plain.columns) == [
+        "case_group", "iso3", "sex", "param", "pre_mean", "crisis_mean", "post_mean", "crisis_minus_pre",
+    ]
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from war_hunger_aging.io.hmd import build_hmd_cache, load_hmd_mx, parse_hmd_table
+
+
+def _write_table(path: Path, country: str, title: str, rows: list[tuple[str, str, str, str, str]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [
+        f"{country}, {title} (period 1x1)\tLast modified: 01 Jan 2025;  Methods Protocol: v6 (2017)",
+        "",
+        "  Year          Age             Female            Male           Total",
+    ]
+    lines += [f"  {y:<8}{a:>8}{f:>16}{m:>16}{t:>16}" for y, a, f, m, t in rows]
+    path.write_text("\n".join(lines) + "\n")
+
+
+def _rows(value: str) -> list[tuple[str, str, str, str, str]]:
+    rows = []
+    for year in ["1990", "1991"]:
+        for age in ["0", "1", "50", "110+"]:
+            rows.append((year, age, value, value, value))
+    return rows
+
+
+def test_parse_hmd_table_handles_open_age_and_missing(tmp_path: Path) -> None:
+    path = tmp_path / "Mx_1x1" / "USA.Mx_1x1.txt"
+    _write_table(path, "U.S.A.", "Death rates", [("1990", "0", "0.009", ".", "0.010"), ("1990", "110+", "0.7", "0.8", "0.75")])
+    df = parse_hmd_table(path)
+    assert set(df["sex"]) == {"Female", "Male", "Both"}
+    assert df["age"].max() == 110.0
+    assert df.loc[(df["sex"] == "Male") & (df["age"] == 0), "value"].isna().all()
+
+
+def test_hmd_cache_layouts_filters_and_skip(tmp_path: Path) -> None:
+    root = tmp_path / "hmd"
+    # Bulk layout for USA, per-country layout for FRATNP (mx derived from deaths / exposures).
+    _write_table(root / "Mx_1x1" / "USA.Mx_1x1.txt", "U.S.A.", "Death rates", _rows("0.01"))
+    _write_table(root / "Deaths_1x1" / "USA.Deaths_1x1.txt", "U.S.A.", "Deaths", _rows("10"))
+    _write_table(root / "FRATNP" / "STATS" / "Deaths_1x1.txt", "France", "Deaths", _rows("5"))
+    _write_table(root / "FRATNP" / "STATS" / "Exposures_1x1.txt", "France", "Exposure to risk", _rows("1000"))
+    cache = tmp_path / "cache"
+
+    assert build_hmd_cache(root, cache, max_workers=1) == ["FRA", "USA"]
+    assert (cache / "iso3=FRA" / "part-0.parquet").exists()
+    assert build_hmd_cache(root, cache, max_workers=1) == []
+
+    df = load_hmd_mx(root, cache_dir=cache, countries=["FRA"], start_year=1991, sexes=["Female"], age_max=60)
+    assert list(df.columns) == ["iso3", "year", "sex", "age", "mx", "deaths", "exposure"]
+    assert set(df["iso3"]) == {"FRA"} and set(df["year"]) == {1991} and set(df["sex"]) == {"Female"}
+    assert df["age"].tolist() == [0.0, 1.0, 50.0]
+    assert (df["mx"] == 0.005).all()
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from war_hunger_aging.iso import ISO_TABLE_VERSION, _iso_table, iso3_from_code, iso3_from_name
+
+
+def test_static_table_maps_without_importing_pycountry() -> None:
+    code = (
+        "import sys\n"
+        "from war_hunger_aging.iso import ensure_iso3, iso3_from_name\n"
+        "assert iso3_from_name('Syrian Arab Republic') == 'SYR'\n"
+        "assert ensure_iso3('us') == 'USA'\n"
+        "assert 'pycountry' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    assert _iso_table()["version"] == ISO_TABLE_VERSION
+    assert iso3_from_name("  russia  (soviet union) ") == "RUS"
+    assert iso3_from_code("FR") == "FRA"
+    assert iso3_from_name("Atlantis") is None
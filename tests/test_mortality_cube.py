@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from war_hunger_aging.pipeline.cube import MortalityCube
+
+
+def test_cube_roundtrip_mmap_and_zero_copy_slicing(tmp_path: Path) -> None:
+    rows = [
+        {"iso3": iso3, "year": year, "sex": sex, "age": float(age), "mx": 1e-4 * (age + 1) * (1 + i)}
+        for i, iso3 in enumerate(["UKR", "POL"])
+        for year in [2020, 2021, 2022]
+        for sex in ["Female", "Male"]
+        for age in range(15, 25)
+    ]
+    panel = pd.DataFrame(rows[:-1])  # drop one cell to exercise the NaN mask
+
+    cube = MortalityCube.from_panel(panel)
+    assert cube.shape == (2, 3, 2, 10)
+    assert cube.iso3 == ("POL", "UKR")
+    assert int((~cube.mask).sum()) == 1
+
+    opened = MortalityCube.open(cube.save(tmp_path / "cube"))
+    assert isinstance(opened.mx, np.memmap)
+    np.testing.assert_array_equal(opened.mx, cube.mx)
+
+    sub = opened.sel(iso3="UKR", sex="Male", age_min=18, age_max=20)
+    assert sub.shape == (1, 3, 1, 3)
+    assert np.shares_memory(sub.mx, opened.mx)
+    np.testing.assert_allclose(sub.mx[0, 0, 0], [1e-4 * 19, 1e-4 * 20, 1e-4 * 21])
+
+    back = cube.to_frame().sort_values(["iso3", "year", "sex", "age"]).reset_index(drop=True)
+    expected = panel.sort_values(["iso3", "year", "sex", "age"]).reset_index(drop=True)
+    np.testing.assert_allclose(back["mx"].to_numpy(), expected["mx"].to_numpy())
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from war_hunger_aging.analysis.srs import fit_srs_groups, srs_urban_rural_deltas
+from war_hunger_aging.model.gm import gm_hazard
+from war_hunger_aging.viz.srs import plot_srs_hazard_overlays, srs_overlay_specs
+
+
+def _srs_rows() -> pd.DataFrame:
+    ages = np.array([0.5, 3, 7.5, 12.5, 17.5, 22.5, 27.5, 32.5, 37.5, 42.5, 47.5, 52.5, 57.5, 62.5, 67.5, 72.5, 77.5, 82.5])
+    rows = []
+    for k, area in enumerate(["India", "Bihar", "Kerala"]):
+        for residence, scale in [("Total", 1.0), ("Rural", 1.1), ("Urban", 0.9)]:
+            for sex, b in [("Male", 0.085), ("Female", 0.09)]:
+                mx = gm_hazard(ages, a=2e-4 * scale, b=b + 0.002 * k, c=1e-3 * scale)
+                rows += [
+                    {"area": area, "period": "2018-22", "residence": residence, "sex": sex, "age_mid": x, "mx": m}
+                    for x, m in zip(ages, mx)
+                ]
+    return pd.DataFrame(rows)
+
+
+def _pivot_deltas(params: pd.DataFrame) -> pd.DataFrame:
+    """The original pivot_table + column-flattening implementation, for reference."""
+    pivot = params.pivot_table(
+        index=["area", "period", "sex", "model"], columns="residence", values=list("bch") + ["mrdt", "rmse_log"], aggfunc="first"
+    ).reset_index()
+    pivot.columns = [f"{m}_{r}" if r else str(m) for m, r in pivot.columns]
+    for metric in ["b", "c", "h", "mrdt", "rmse_log"]:
+        if f"{metric}_Urban" in pivot.columns and f"{metric}_Rural" in pivot.columns:
+            d = pivot[f"{metric}_Urban"] - pivot[f"{metric}_Rural"]
+            pivot[f"delta_{metric}_urban_minus_rural"] = d
+            pivot[f"delta_{metric}_urban_minus_rural_pct"] = np.where(pivot[f"{metric}_Rural"] != 0, d / pivot[f"{metric}_Rural"], np.nan)
+    return pivot
+
+
+def test_parallel_fit_matches_serial_and_recovers_b() -> None:
+    df = _srs_rows()
+    serial = fit_srs_groups(df, max_workers=1)
+    assert len(serial) == 2 * 3 * 3 * 2
+    pd.testing.assert_frame_equal(fit_srs_groups(df, max_workers=2), serial)
+    gm = serial[(serial["model"] == "gm") & (serial["area"] == "India") & (serial["sex"] == "Male")]
+    assert np.allclose(gm["b"], 0.085, rtol=0.05)
+
+
+def test_vectorized_deltas_match_pivot_table() -> None:
+    params = fit_srs_groups(_srs_rows(), max_workers=1)
+    for models in (["gm", "gmh"], ["gm"]):
+        sub = params[params["model"].isin(models)]
+        got = srs_urban_rural_deltas(params, models=models)
+        pd.testing.assert_frame_equal(got, _pivot_deltas(sub), check_names=False)
+
+
+def test_overlay_specs_index_params_and_render_in_parallel(tmp_path: Path) -> None:
+    obs = _srs_rows()
+    params = fit_srs_groups(obs, max_workers=1)
+    opts = dict(adult_age_min=35.0, fit_age_min=15.0, mu_h=28.0, sigma_h=10.0)
+    specs = srs_overlay_specs(obs, params, out_dir=tmp_path, **opts)
+    assert [path.name for _, path, _ in specs][:2] == ["overlay_Bihar_Female.png", "overlay_India_Female.png"]
+
+    _, _, layers = specs[1]
+    assert [layer[0] for layer in layers] == ["Rural", "Urban", "Total"]
+    residence, _, age, mx, (gm_ages, gm_curve), _ = layers[0]
+    assert age.min() >= 15.0 and gm_ages[0] == 35.0
+    p = params[(params["model"] == "gm") & (params["area"] == "India") & (params["sex"] == "Female") & (params["residence"] == residence)]
+    assert np.allclose(gm_curve, gm_hazard(gm_ages, a=p["a"].iloc[0], b=p["b"].iloc[0], c=p["c"].iloc[0]))
+
+    written = plot_srs_hazard_overlays(obs, params, out_dir=tmp_path, include_gmh=False, max_workers=2, **opts)
+    assert len(written) == 6 and all(path.stat().st_size > 0 for path in written)
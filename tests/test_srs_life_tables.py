@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import zlib
+from pathlib import Path
+
+import pandas as pd
+
+from war_hunger_aging.io.srs_life_tables import (
+    CMap,
+    _extract_text_ops,
+    _extract_text_ops_scan,
+    extract_srs_pdf_segments,
+    iter_srs_abridged_life_tables_segments,
+    parse_srs_abridged_life_tables_segments,
+    read_srs_life_tables,
+    write_rows_csv,
+    write_srs_parquet,
+)
+
+
+# Two subset-style fonts whose ToUnicode CMaps send the same 2-byte codes to different characters.
+_CHARS = "".join(chr(c) for c in range(32, 127))
+_FONTS = {"F1": 0x0003, "F2": 0x0203}
+
+
+def _encode(text: str, font: str) -> str:
+    return "<" + "".join(f"{_FONTS[font] + _CHARS.index(ch):04X}" for ch in text) + ">"
+
+
+def _cmap(font: str) -> bytes:
+    lines = ["/CIDInit /ProcSet findresource begin", "12 dict begin", "begincmap", "/CMapName /Sub-UCS def"]
+    lines += ["1 begincodespacerange", "<0000> <FFFF>", "endcodespacerange", f"{len(_CHARS)} beginbfchar"]
+    lines += [f"<{_FONTS[font] + i:04X}> <{ord(ch):04X}>" for i, ch in enumerate(_CHARS)]
+    lines += ["endbfchar", "endcmap", "CMapName currentdict /CMap defineresource pop", "end", "end"]
+    return "\n".join(lines).encode("ascii")
+
+
+def _table(area: str, rows: list[tuple[str, list[str]]]) -> list[tuple[str, str]]:
+    """Text runs (font, text) for one SRS table: title, header, then residence blocks."""
+    runs = [("F1", f"{area}, 2018-22"), ("F1", "Age-Interval"), ("F1", "(x to x+n)")]
+    for residence in ["Total", "Rural"]:
+        runs.append(("F1", residence))
+        for token, values in rows:
+            runs.append(("F1", token))
+            runs += [("F1", v) for v in values]
+    return runs
+
+
+def _rows() -> list[tuple[str, list[str]]]:
+    values = ["69.8", "0.03001", "100000", "97391", "69.5", "0.03170", "100000", "97246", "70.1"]
+    return [
+        ("0-10.0308510000097320", values),
+        ("1-50.0050097000387000", values),
+        ("85+ ...19979113568", values),
+    ]
+
+
+def _content(runs: list[tuple[str, str]]) -> bytes:
+    ops = []
+    for k, (font, text) in enumerate(runs):
+        if k % 3 == 2 and len(text) > 2:
+            # Kerned TJ array split in two pieces.
+            ops.append(f"BT /{font} 8 Tf 40 {700 - 10 * k} Td [{_encode(text[:2], font)} -12 {_encode(text[2:], font)}] TJ ET")
+        else:
+            ops.append(f"BT /{font} 8 Tf 40 {700 - 10 * k} Td {_encode(text, font)} Tj ET")
+    ops.append("BT /F1 6 Tf (Sample Registration System) Tj ET")
+    return "\n".join(ops).encode("ascii")
+
+
+def make_srs_pdf(path: Path, pages: list[list[tuple[str, str]]], *, objstm: bool = False) -> Path:
+    """
+    Write a minimal PDF in the layout of the SRS tables: Type0 fonts + ToUnicode, hex text, images.
+
+    With `objstm`, catalog, pages and fonts are packed into an /ObjStm and the classic
+    xref table is replaced by an /XRef stream, as in PDF 1.5+ files.
+    """
+    objects: dict[int, bytes] = {}
+
+    def stream(num: int, data: bytes, extra: str = "") -> None:
+        comp = zlib.compress(data)
+        objects[num] = f"<< /Length {len(comp)} /Filter /FlateDecode{extra} >>\nstream\n".encode() + comp + b"\nendstream"
+
+    stream(3, _cmap("F1"))
+    stream(4, _cmap("F2"))
+    objects[5] = b"<< /Type /Font /Subtype /Type0 /BaseFont /AAAAAA+Arial /Encoding /Identity-H /ToUnicode 3 0 R >>"
+    objects[6] = b"<< /Type /Font /Subtype /Type0 /BaseFont /BBBBBB+Arial /Encoding /Identity-H /ToUnicode 4 0 R >>"
+    # An image whose pixels happen to look like a text operator must not leak into the output.
+    stream(7, b"BT (IMAGE-NOISE) Tj ET" + bytes(range(256)) * 64, " /Type /XObject /Subtype /Image /Width 64 /Height 64")
+
+    kids = []
+    for k, runs in enumerate(pages):
+        page, content = 10 + 2 * k, 11 + 2 * k
+        kids.append(f"{page} 0 R")
+        objects[page] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {content} 0 R "
+            "/Resources << /Font << /F1 5 0 R /F2 6 0 R >> /XObject << /Im1 7 0 R >> >> >>"
+        ).encode()
+        stream(content, _content(runs))
+    objects[1] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode()
+
+    packed: dict[int, bytes] = {}
+    if objstm:
+        packed = {num: objects.pop(num) for num in sorted(objects) if b"stream" not in objects[num]}
+        head, body = "", b""
+        for num, obj in packed.items():
+            head += f"{num} {len(body)} "
+            body += obj + b"\n"
+        stream(max(objects | packed) + 1, head.encode() + body, f" /Type /ObjStm /N {len(packed)} /First {len(head)}")
+
+    out = bytearray(f"%PDF-{'1.5' if objstm else '1.4'}\n%\xe2\xe3\xcf\xd3\n".encode("latin-1"))
+    offsets = {}
+    for num in sorted(objects):
+        offsets[num] = len(out)
+        out += f"{num} 0 obj\n".encode() + objects[num] + b"\nendobj\n"
+    size = max(objects) + 1
+    xref = len(out)
+    if objstm:
+        # Entries: type 1 = offset in the file, type 2 = (object stream, index in it); W [1 4 2].
+        stm, size = size - 1, size + 1
+        offsets[size - 1] = xref
+        index = {num: k for k, num in enumerate(packed)}
+        rows = b""
+        for n in range(size):
+            if n in offsets:
+                rows += bytes([1]) + offsets[n].to_bytes(4, "big") + bytes(2)
+            elif n in index:
+                rows += bytes([2]) + stm.to_bytes(4, "big") + index[n].to_bytes(2, "big")
+            else:
+                rows += bytes([0]) + bytes(4) + (65535 if n == 0 else 0).to_bytes(2, "big")
+        comp = zlib.compress(rows)
+        out += (
+            f"{size - 1} 0 obj\n<< /Type /XRef /Size {size} /W [1 4 2] /Index [0 {size}] /Root 1 0 R "
+            f"/Length {len(comp)} /Filter /FlateDecode >>\nstream\n"
+        ).encode() + comp + f"\nendstream\nendobj\nstartxref\n{xref}\n%%EOF\n".encode()
+        path.write_bytes(bytes(out))
+        return path
+    out += f"xref\n0 {size}\n0000000000 65535 f \n".encode()
+    for num in range(1, size):
+        out += f"{offsets[num]:010d} 00000 n \n".encode() if num in offsets else b"0000000000 65535 f \n"
+    out += f"trailer\n<< /Size {size} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(bytes(out))
+    return path
+
+
+def test_extract_and_parse_synthetic_srs_pdf(tmp_path: Path) -> None:
+    pdf = make_srs_pdf(tmp_path / "srs.pdf", [_table("India", _rows()), _table("Bihar", _rows())])
+    segments = extract_srs_pdf_segments(pdf)
+    assert segments[:3] == ["India, 2018-22", "Age-Interval", "(x to x+n)"]
+    assert "Sample Registration System" in segments
+    assert "IMAGE-NOISE" not in segments
+
+    rows = parse_srs_abridged_life_tables_segments(segments)
+    assert len(rows) == 2 * 2 * 3 * 3  # areas x residences x ages x sexes
+    first = rows[0]
+    assert (first["area"], first["residence"], first["sex"], first["age_interval"]) == ("India", "Total", "Total", "0-1")
+    assert (first["nqx"], first["lx"], first["nLx"], first["ex"]) == (0.03085, 100000, 97320, 69.8)
+    open_row = [r for r in rows if r["age_interval"] == "85+"][0]
+    assert open_row["nqx"] is None and open_row["lx"] == 19979 and open_row["nLx"] == 113568
+
+
+def test_typed_parquet_and_csv_load_without_coercion(tmp_path: Path) -> None:
+    pdf = make_srs_pdf(tmp_path / "srs.pdf", [_table("India", _rows()), _table("Bihar", _rows())])
+    segments = extract_srs_pdf_segments(pdf)
+    out = tmp_path / "srs.parquet"
+    assert write_srs_parquet(iter_srs_abridged_life_tables_segments(segments), out, batch_size=7) == 36
+
+    df = read_srs_life_tables(out)
+    assert {c: str(df[c].dtype) for c in ["area", "sex", "age_start", "age_end", "n", "lx", "mx"]} == {
+        "area": "category", "sex": "category", "age_start": "Int16", "age_end": "Int16", "n": "Int16",
+        "lx": "Int64", "mx": "float64",
+    }
+    assert df["age_end"].isna().sum() == df["n"].isna().sum() == 2 * 2 * 3  # the 85+ rows
+    write_rows_csv(parse_srs_abridged_life_tables_segments(segments), tmp_path / "srs.csv")
+    pd.testing.assert_frame_equal(read_srs_life_tables(tmp_path / "srs.csv"), df, check_categorical=False)
+
+
+def test_parallel_extraction_matches_serial(tmp_path: Path) -> None:
+    pdf = make_srs_pdf(tmp_path / "srs.pdf", [_table(f"Area {k}", _rows()) for k in range(6)])
+    assert extract_srs_pdf_segments(pdf, max_workers=2) == extract_srs_pdf_segments(pdf, max_workers=1)
+
+
+def test_hex_text_is_decoded_with_the_font_selected_by_tf(tmp_path: Path) -> None:
+    # F2 draws the same glyph codes as F1 shifted; a single per-stream CMap would garble one of them.
+    runs = _table("India", _rows())
+    runs.insert(3, ("F2", "Note: SRS based"))
+    runs.append(("F2", "Source: Office of the Registrar General"))
+    pdf = make_srs_pdf(tmp_path / "srs.pdf", [runs])
+    segments = extract_srs_pdf_segments(pdf)
+    assert segments[3] == "Note: SRS based"
+    assert "Source: Office of the Registrar General" in segments
+    assert len(parse_srs_abridged_life_tables_segments(segments)) == 2 * 3 * 3
+
+
+def test_object_and_xref_streams_decode_like_a_classic_xref(tmp_path: Path) -> None:
+    runs = _table("India", _rows())
+    runs.insert(3, ("F2", "Note: SRS based"))
+    pages = [runs, _table("Bihar", _rows())]
+    packed = make_srs_pdf(tmp_path / "packed.pdf", pages, objstm=True)
+    assert b"/Type /ObjStm" in packed.read_bytes() and b"\nxref\n" not in packed.read_bytes()
+    segments = extract_srs_pdf_segments(packed)
+    assert segments == extract_srs_pdf_segments(make_srs_pdf(tmp_path / "classic.pdf", pages))
+    assert segments[3] == "Note: SRS based"
+    assert len(parse_srs_abridged_life_tables_segments(segments)) == 2 * 2 * 3 * 3
+
+
+def test_regex_tokenizer_matches_byte_scanner() -> None:
+    f1 = CMap(key_len=2, mapping={(_FONTS["F1"] + i).to_bytes(2, "big"): ch for i, ch in enumerate(_CHARS)})
+    f2 = CMap(key_len=2, mapping={(_FONTS["F2"] + i).to_bytes(2, "big"): ch for i, ch in enumerate(_CHARS)})
+    content = _content(_table("India", _rows()) + [("F2", "Note")]) + (
+        b"\nq 1 0 0 1 0 0 cm /F2Tf (a\\)b (nested (x) y)) Tj % comment Tj\n"
+        b"[<0003 0004> -5 (kern) <3>] TJ <<\n/Im1 Do>> /F3 9 Tf <0044> Tj (\\101\\n) Tj xTj Q"
+    )
+    for fonts in (None, {b"F1": f1, b"F2": f2, b"F3": None}):
+        assert _extract_text_ops(content, cmap=f1, fonts=fonts) == _extract_text_ops_scan(content, cmap=f1, fonts=fonts)
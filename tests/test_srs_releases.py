@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from war_hunger_aging.io.srs_releases import build_srs_dataset, load_srs_dataset
+
+from test_srs_life_tables import _rows, _table, make_srs_pdf  # synthetic SRS PDF builder
+
+
+def test_build_srs_dataset_partitions_releases_and_skips_unchanged(tmp_path: Path) -> None:
+    pdfs = tmp_path / "pdfs"
+    pdfs.mkdir()
+    make_srs_pdf(pdfs / "SRS-Abridged_Life_Tables_2017-2021.pdf", [_table("India", _rows())])
+    make_srs_pdf(pdfs / "SRS-Abridged_Life_Tables_2018-2022.pdf", [_table("India", _rows()), _table("Bihar", _rows())])
+    out = tmp_path / "srs"
+
+    assert build_srs_dataset(pdfs, out, max_workers=2) == ["2017-21", "2018-22"]
+    assert (out / "release=2018-22" / "area=Bihar").is_dir()
+    df = load_srs_dataset(out)
+    assert df.groupby("release").size().to_dict() == {"2017-21": 18, "2018-22": 36}
+    assert {c: str(df[c].dtype) for c in ["age_start", "age_end", "n", "lx"]} == {
+        "age_start": "Int16", "age_end": "Int16", "n": "Int16", "lx": "Int64",
+    }
+
+    assert build_srs_dataset(pdfs, out) == []
+    make_srs_pdf(pdfs / "SRS-Abridged_Life_Tables_2017-2021.pdf", [_table("Kerala", _rows())])
+    assert build_srs_dataset(pdfs, out) == ["2017-21"]
+    assert set(load_srs_dataset(out, releases=["2017-21"])["area"]) == {"Kerala"}
+
+
+def test_build_srs_dataset_rejects_release_clash_with_unchanged_pdf(tmp_path: Path) -> None:
+    pdfs = tmp_path / "pdfs"
+    pdfs.mkdir()
+    make_srs_pdf(pdfs / "SRS_2018-2022.pdf", [_table("India", _rows()), _table("Bihar", _rows())])
+    out = tmp_path / "srs"
+    assert build_srs_dataset(pdfs, out, max_workers=1) == ["2018-22"]
+
+    make_srs_pdf(pdfs / "SRS_2018-22_errata.pdf", [_table("Kerala", _rows())])
+    with pytest.raises(ValueError, match="2018-22"):
+        build_srs_dataset(pdfs, out, max_workers=1)
+    assert set(load_srs_dataset(out)["area"]) == {"India", "Bihar"}
+
+
+def test_build_srs_dataset_drops_partitions_of_removed_pdfs(tmp_path: Path) -> None:
+    pdfs = tmp_path / "pdfs"
+    pdfs.mkdir()
+    make_srs_pdf(pdfs / "SRS_2017-2021.pdf", [_table("Kerala", _rows())])
+    make_srs_pdf(pdfs / "SRS_2018-2022.pdf", [_table("India", _rows())])
+    out = tmp_path / "srs"
+    assert build_srs_dataset(pdfs, out, max_workers=1) == ["2017-21", "2018-22"]
+
+    (pdfs / "SRS_2017-2021.pdf").unlink()
+    assert build_srs_dataset(pdfs, out, max_workers=1) == []
+    assert not (out / "release=2017-21").exists()
+    assert set(load_srs_dataset(out)["release"]) == {"2018-22"}
+    assert list(json.loads((out / "_srs_manifest.json").read_text())["pdfs"]) == ["SRS_2018-2022.pdf"]
+
+    # Renamed to another release: the old partition goes, the new one is written.
+    (pdfs / "SRS_2018-2022.pdf").rename(pdfs / "SRS_2019-2023.pdf")
+    assert build_srs_dataset(pdfs, out, max_workers=1) == ["2019-23"]
+    assert sorted(p.name for p in out.glob("release=*")) == ["release=2019-23"]
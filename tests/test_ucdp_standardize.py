@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 
-from war_hunger_aging.io.ucdp import infer_ucdp_columns, standardize_ucdp_brd
+from war_hunger_aging.io.ucdp import aggregate_ged, ged_battle_deaths, infer_ucdp_columns, standardize_ucdp_brd
 
 
 def test_ucdp_standardization_maps_iso3_and_sums() -> None:
@@ -22,3 +25,52 @@ def test_ucdp_standardization_maps_iso3_and_sums() -> None:
     assert float(yem_2015) == 15.0
     assert float(syr_2016) == 7.0
 
+
+def test_ucdp_multi_country_locations_are_split_per_allocation() -> None:
+    raw = pd.DataFrame(
+        {
+            "year": [2015, 2015, 2015, 2015],
+            "location": ["Syria, Turkey", "Russia (Soviet Union)", "Yemen, Rep.", "Atlantis, Syria"],
+            "bd_best": [10, 4, 6, 8],
+        }
+    )
+    cols = infer_ucdp_columns(raw)
+
+    def _deaths(allocation: str) -> tuple[dict[str, float], list[str]]:
+        std, unmapped = standardize_ucdp_brd(raw, cols=cols, start_year=2010, end_year=2020, allocation=allocation)
+        return dict(zip(std["iso3"], std["battle_deaths"])), unmapped["country"].tolist()
+
+    assert _deaths("equal") == ({"RUS": 4.0, "SYR": 9.0, "TUR": 5.0, "YEM": 6.0}, ["Atlantis"])
+    assert _deaths("full")[0] == {"RUS": 4.0, "SYR": 18.0, "TUR": 10.0, "YEM": 6.0}
+    assert _deaths("first") == ({"RUS": 4.0, "SYR": 10.0, "YEM": 6.0}, ["Atlantis"])
+
+
+def test_ged_streaming_aggregation_matches_pandas(tmp_path: Path) -> None:
+    rng = np.random.default_rng(3)
+    n = 5000
+    events = pd.DataFrame(
+        {
+            "id": np.arange(n),
+            "year": rng.integers(2008, 2022, n),
+            "country": rng.choice(["Syria", "Yemen (North Yemen)", "Russia (Soviet Union)", "Atlantis"], n),
+            "adm_1": rng.choice(["Aleppo governorate", "Sana'a", None], n),
+            "best": rng.integers(0, 50, n),
+            "low": rng.integers(0, 10, n),
+            "high": rng.integers(50, 90, n),
+        }
+    )
+    path = tmp_path / "ged.csv"
+    events.to_csv(path, index=False)
+
+    country, unmapped = aggregate_ged(path, start_year=2010, end_year=2020, block_size=1 << 14)
+    admin1, _ = aggregate_ged([path], start_year=2010, end_year=2020, admin1=True, block_size=1 << 14)
+
+    expected = events[events["year"].between(2010, 2020)].copy()
+    expected["iso3"] = expected["country"].map({"Syria": "SYR", "Yemen (North Yemen)": "YEM", "Russia (Soviet Union)": "RUS"})
+    expected = expected.dropna(subset=["iso3"]).groupby(["iso3", "year"], as_index=False)["best"].sum()
+    np.testing.assert_array_equal(country["deaths_best"].to_numpy(), expected["best"].to_numpy(dtype=float))
+    assert set(unmapped["country"]) == {"Atlantis"}
+    assert admin1["deaths_high"].sum() == country["deaths_high"].sum()
+    bd = ged_battle_deaths(admin1, measure="best")
+    assert list(bd.columns) == ["iso3", "year", "battle_deaths"]
+    np.testing.assert_allclose(bd["battle_deaths"].to_numpy(), country["deaths_best"].to_numpy())
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from war_hunger_aging.io.wdi_bulk import load_wdi_bulk
+
+
+def _write_archive(path: Path) -> None:
+    years = [str(y) for y in range(1960, 1966)]
+    lines = ['"Country Name","Country Code","Indicator Name","Indicator Code",' + ",".join(f'"{y}"' for y in years) + ","]
+    for name, iso3 in [("Yemen, Rep.", "YEM"), ("Syrian Arab Republic", "SYR"), ("Arab World", "ARB")]:
+        for ind in ["SP.POP.TOTL", "SN.ITK.DEFC.ZS", "NY.GDP.MKTP.CD"]:
+            vals = ["" if (int(y) + len(ind)) % 4 == 0 else f"{int(y) - 1950 + len(iso3)}.5" for y in years]
+            lines.append(f'"{name}","{iso3}","{ind} name","{ind}",' + ",".join(vals) + ",")
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("WDICSV.csv", "\ufeff" + "\n".join(lines) + "\n")
+        zf.writestr("WDICountry.csv", '"Country Code"\n"YEM"\n')
+
+
+def test_bulk_archive_streams_to_long_format_and_caches(tmp_path: Path) -> None:
+    archive = tmp_path / "WDI_CSV.zip"
+    _write_archive(archive)
+    kwargs = dict(countries=["syr", "YEM"], start_year=1961, end_year=1964, cache_dir=tmp_path / "cache")
+
+    df = load_wdi_bulk(archive, ["SP.POP.TOTL", "SN.ITK.DEFC.ZS"], **kwargs)
+    assert list(df.columns) == ["iso3", "year", "indicator", "value"]
+    assert len(df) == 2 * 2 * 4
+    assert set(df["iso3"]) == {"SYR", "YEM"} and df["year"].between(1961, 1964).all()
+    assert df.equals(df.sort_values(["indicator", "iso3", "year"]).reset_index(drop=True))
+    row = df[(df["iso3"] == "YEM") & (df["year"] == 1962) & (df["indicator"] == "SP.POP.TOTL")]
+    assert row["value"].item() == 15.5
+    assert np.isnan(df[(df["year"] == 1961) & (df["indicator"] == "SP.POP.TOTL")]["value"]).all()
+
+    assert len(list((tmp_path / "cache").glob("*.parquet"))) == 1
+    pd.testing.assert_frame_equal(load_wdi_bulk(archive, ["SN.ITK.DEFC.ZS", "SP.POP.TOTL"], **kwargs), df)
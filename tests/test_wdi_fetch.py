@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pytest
+
+from war_hunger_aging.io.http import HTTPCache, OfflineCacheMiss
+from war_hunger_aging.io.wdi import RetryPolicy, fetch_indicators
+
+
+def _serve_wdi(hits: Counter, fail_once: set[tuple[str, int]]) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            url = urlparse(self.path)
+            indicator = url.path.rsplit("/", 1)[-1]
+            page = int(parse_qs(url.query)["page"][0])
+            hits[(indicator, page)] += 1
+            if (indicator, page) in fail_once and hits[(indicator, page)] == 1:
+                self.send_response(503)
+                self.end_headers()
+                return
+            etag = f'"{indicator}-{page}"'
+            if self.headers.get("If-None-Match") == etag:
+                hits[("not-modified", page)] += 1
+                self.send_response(304)
+                self.end_headers()
+                return
+            obs = [
+                {"countryiso3code": iso3, "date": str(2000 + page), "value": float(page)}
+                for iso3 in ["YEM", "SYR"]
+            ]
+            body = json.dumps([{"page": page, "pages": 3}, obs]).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_fetch_indicators_reuses_first_page_and_retries() -> None:
+    hits: Counter = Counter()
+    server = _serve_wdi(hits, fail_once={("IND.A", 2)})
+    try:
+        df = fetch_indicators(
+            ["IND.A", "IND.B"],
+            countries=["YEM", "SYR"],
+            start_year=2000,
+            end_year=2005,
+            api_base=f"http://127.0.0.1:{server.server_port}",
+            retry=RetryPolicy(attempts=3, backoff=0.01),
+        )
+    finally:
+        server.shutdown()
+
+    assert len(df) == 2 * 3 * 2
+    assert sorted(df["year"].unique().tolist()) == [2001, 2002, 2003]
+    assert hits[("IND.A", 1)] == 1 and hits[("IND.B", 1)] == 1
+    assert hits[("IND.A", 2)] == 2
+    assert list(df.columns) == ["iso3", "year", "indicator", "value"]
+
+
+def test_http_cache_serves_revalidates_and_replays_offline(tmp_path: Path) -> None:
+    hits: Counter = Counter()
+    server = _serve_wdi(hits, fail_once=set())
+    kwargs = dict(
+        countries=["YEM", "SYR"],
+        start_year=2000,
+        end_year=2005,
+        api_base=f"http://127.0.0.1:{server.server_port}",
+        retry=RetryPolicy(attempts=1),
+    )
+    try:
+        first = fetch_indicators(["IND.A"], cache=HTTPCache(tmp_path), **kwargs)
+        assert sum(hits.values()) == 3
+
+        cached = fetch_indicators(["IND.A"], cache=HTTPCache(tmp_path), **kwargs)
+        assert sum(hits.values()) == 3
+
+        stale = fetch_indicators(["IND.A"], cache=HTTPCache(tmp_path, ttl_seconds=0), **kwargs)
+        assert sum(n for k, n in hits.items() if k[0] == "not-modified") == 3
+    finally:
+        server.shutdown()
+
+    offline = fetch_indicators(["IND.A"], cache=HTTPCache(tmp_path, ttl_seconds=0, offline=True), **kwargs)
+    for df in [cached, stale, offline]:
+        pd.testing.assert_frame_equal(df, first)
+    with pytest.raises(OfflineCacheMiss):
+        fetch_indicators(["IND.B"], cache=HTTPCache(tmp_path, offline=True), **kwargs)
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pyarrow.parquet as pq
+
+from war_hunger_aging.io.who_gho import (
+    fetch_gho_indicator,
+    fetch_gho_sharded,
+    gho_stream_schema,
+    plan_shards,
+    write_gho_parquet,
+)
+
+
+_ISO3 = ["AAA", "BBB", "CCC", "DDD", "EEE"]
+
+
+def _serve(handle: object) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            body = json.dumps(handle(self)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _serve_gho(n_pages: int = 3) -> ThreadingHTTPServer:
+    def handle(self: BaseHTTPRequestHandler) -> dict:
+        url = urlparse(self.path)
+        indicator = url.path.rsplit("/", 1)[-1]
+        page = int(parse_qs(url.query).get("page", ["1"])[0])
+        values = [
+            {
+                "Id": 1000 * page + i,
+                "IndicatorCode": indicator,
+                "SpatialDim": iso3,
+                "TimeDim": 2000 + page,
+                "Dim1": "SEX_FMLE",
+                "NumericValue": 60.0 + page + i,
+                "Value": f"{60 + page + i}",
+                "Comments": "x" * 200,
+            }
+            for i, iso3 in enumerate(["YEM", "SYR"])
+        ]
+        data: dict = {"value": values}
+        if page < n_pages:
+            data["@odata.nextLink"] = f"http://127.0.0.1:{self.server.server_port}{url.path}?page={page + 1}"
+        return data
+
+    return _serve(handle)
+
+
+def _serve_gho_filtered(queries: list[str]) -> ThreadingHTTPServer:
+    """Answers `$filter` queries; a regional aggregate (Id 1) matches every shard."""
+
+    def handle(self: BaseHTTPRequestHandler) -> dict:
+        url = urlparse(self.path)
+        where = parse_qs(url.query)["$filter"][0]
+        queries.append(where)
+        lo, hi = map(int, re.search(r"TimeDim ge (\d+) and TimeDim le (\d+)", where).groups())
+        values = [{"Id": 1, "SpatialDim": "GLOBAL", "TimeDim": lo, "NumericValue": 0.0}]
+        for iso3 in re.findall(r"SpatialDim eq '(\w+)'", where):
+            for year in range(lo, hi + 1):
+                obs_id = 10 * year + _ISO3.index(iso3) + 2
+                values.append({"Id": obs_id, "SpatialDim": iso3, "TimeDim": year, "NumericValue": float(year)})
+        return {"value": values}
+
+    return _serve(handle)
+
+
+def test_streaming_writer_projects_columns_and_matches_dataframe_path(tmp_path: Path) -> None:
+    server = _serve_gho()
+    api_base = f"http://127.0.0.1:{server.server_port}"
+    try:
+        out = tmp_path / "who_gho.parquet"
+        n = write_gho_parquet(["IND_B", "IND_A"], out, api_base=api_base, max_workers=2)
+        legacy = fetch_gho_indicator("IND_A", api_base=api_base)
+    finally:
+        server.shutdown()
+
+    table = pq.read_table(out)
+    assert n == table.num_rows == 2 * 3 * 2
+    assert table.schema == gho_stream_schema()
+    assert "Comments" not in table.column_names
+    assert table.column("indicator").to_pylist() == ["IND_B"] * 6 + ["IND_A"] * 6
+    assert not list(tmp_path.glob(".*parts"))
+
+    streamed = table.to_pandas()
+    streamed = streamed[streamed["indicator"] == "IND_A"].sort_values(["iso3", "year"]).reset_index(drop=True)
+    cols = ["iso3", "year", "value", "Id", "Dim1"]
+    assert streamed[cols].astype(str).equals(legacy[cols].astype(str))
+
+
+def test_sharded_fetch_splits_dedupes_and_merges_deterministically() -> None:
+    shards = plan_shards(_ISO3, start_year=2000, end_year=2006, countries_per_shard=2, years_per_shard=3)
+    assert len(shards) == 3 * 3
+    assert [(s.start_year, s.end_year) for s in shards[:3]] == [(2000, 2002), (2003, 2005), (2006, 2006)]
+
+    queries: list[str] = []
+    server = _serve_gho_filtered(queries)
+    try:
+        runs = [
+            fetch_gho_sharded(
+                ["IND_A"],
+                countries=list(reversed(_ISO3)),
+                start_year=2000,
+                end_year=2006,
+                api_base=f"http://127.0.0.1:{server.server_port}",
+                countries_per_shard=2,
+                years_per_shard=3,
+                max_workers=w,
+            )
+            for w in [1, 4]
+        ]
+    finally:
+        server.shutdown()
+
+    assert len(queries) == 2 * len(shards)
+    df = runs[0]
+    assert len(df) == len(_ISO3) * 7 + 1
+    assert (df["Id"] == 1).sum() == 1
+    assert df["Id"].is_unique
+    assert df.equals(runs[1])
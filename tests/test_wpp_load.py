@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+from war_hunger_aging.io.wpp import load_wpp_mx, write_wpp_bulk_parquet
+
+
+def _raw_wpp() -> pd.DataFrame:
+    rows = []
+    for iso3 in ["YEM", "OMN", "FRA"]:
+        for year in [1989, 1990, 1991]:
+            for sex in ["Female", "Male", "Both"]:
+                for age in [10, 15, 50, 95]:
+                    rows.append({"iso3": iso3, "year": year, "sex": sex, "age": age, "mx": 0.001 * (age + 1)})
+    return pd.DataFrame(rows)
+
+
+def test_load_wpp_mx_filters_parquet_and_csv_gz(tmp_path: Path) -> None:
+    raw = _raw_wpp()
+    pq_path = tmp_path / "wpp_mx.parquet"
+    csv_path = tmp_path / "wpp_mx.csv.gz"
+    raw.to_parquet(pq_path, index=False)
+    raw.to_csv(csv_path, index=False, compression="gzip")
+
+    filters = dict(countries=["YEM", "OMN"], start_year=1990, end_year=1991, sexes=["Female", "Male"], age_min=15, age_max=89)
+    expected = raw[
+        raw["iso3"].isin(["YEM", "OMN"])
+        & raw["year"].between(1990, 1991)
+        & raw["sex"].isin(["Female", "Male"])
+        & raw["age"].between(15, 89)
+    ]
+    for path in [pq_path, csv_path]:
+        df = load_wpp_mx(path, block_size=1 << 10, **filters)
+        assert len(df) == len(expected)
+        assert set(df["iso3"]) == {"YEM", "OMN"}
+        assert df["age"].between(15, 89).all()
+        assert list(df.columns) == ["iso3", "year", "sex", "age", "mx"]
+
+    unfiltered = load_wpp_mx(pq_path)
+    assert len(unfiltered) == len(raw)
+
+
+def test_write_wpp_bulk_parquet_maps_locations_and_streams(tmp_path: Path) -> None:
+    header = "SortOrder,LocID,Notes,ISO3_code,ISO2_code,LocTypeName,Location,Variant,Time,Sex,AgeGrp,AgeGrpStart,AgeGrpSpan,mx,qx"
+    lines = [header]
+    # YEM carries its ISO3 code, OMN only its M49 LocID (512); 900 (World) is an aggregate.
+    for loc, iso3 in [(887, "YEM"), (512, ""), (900, "")]:
+        for year in [1989, 1990]:
+            for sex in ["Female", "Male", "Total"]:
+                for age in range(0, 101):
+                    label, span = (f"{age}+", -1) if age == 100 else (str(age), 1)
+                    lines.append(f"1,{loc},,{iso3},,Country,X,Medium,{year},{sex},{label},{age},{span},{0.001 * (age + 1)},0.1")
+    src = tmp_path / "WPP2024_Life_Table_Complete_Medium_1950-2023.csv.gz"
+    pd.DataFrame([l.split(",") for l in lines[1:]], columns=header.split(",")).to_csv(src, index=False, compression="gzip")
+
+    out = tmp_path / "wpp_mx.parquet"
+    n = write_wpp_bulk_parquet(
+        [src], out, countries=["YEM", "OMN"], start_year=1990, sexes=["Female", "Both"], block_size=1 << 12
+    )
+    df = load_wpp_mx(out)
+    assert n == len(df) == 2 * 2 * 101
+    assert set(df["iso3"]) == {"YEM", "OMN"}
+    assert set(df["sex"]) == {"Female", "Both"}
+    assert set(df["year"]) == {1990}
+    assert df["age"].max() == 100.0